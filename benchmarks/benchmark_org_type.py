@@ -0,0 +1,70 @@
+"""
+Purpose of script: benchmarks helpers.add_organisation_type, which looks up
+the organisation type of each distinct entity code, against the previous
+approach of a str.startswith scan of the organisation codes for each
+organisation type.
+
+Synthetic LSOA level organisation codes are used (around 33,000 E01 codes,
+plus the LA, region and national codes).
+
+Run from the project root with:
+    python -m benchmarks.benchmark_org_type [number of LSOAs]
+"""
+import sys
+import timeit
+import pandas as pd
+from child_vac_code.utilities import helpers
+
+
+def create_synthetic_org_codes(lsoas):
+    """
+    Creates a dataframe of synthetic LSOA, LA, region and national codes.
+    """
+    org_codes = ([f"E01{i:06d}" for i in range(lsoas)]
+                 + [f"{prefix}{i:06d}" for prefix in ["E06", "E07", "E08",
+                                                      "E09", "E10"]
+                    for i in range(60)]
+                 + [f"E12{i:06d}" for i in range(1, 10)]
+                 + ["E92000001", "W92000004", "S92000003"])
+
+    return pd.DataFrame({"Org_Code": org_codes})
+
+
+def add_organisation_type_startswith(df, org_code_column):
+    """
+    The previous version of add_organisation_type, kept for comparison.
+    """
+    df["Org_Type"] = "None"
+    df["Org_Level"] = "None"
+    for prefixes, values in [("E01", ["LSOA", "LSOA"]),
+                             (("E06", "E07", "E08", "E09", "E10"),
+                              ["LA", "Local"]),
+                             ("E12", ["LA_parent", "Regional"]),
+                             ("E38", ["CCG", "Local"]),
+                             ("E54", ["ICB", "Local"]),
+                             ("E40", ["ICB_parent", "Regional"]),
+                             ("E92", ["National", "National"])]:
+        df.loc[df[org_code_column].str.startswith(prefixes),
+               ["Org_Type", "Org_Level"]] = values
+
+    return df
+
+
+def main(lsoas=33000, repeats=5):
+    df = create_synthetic_org_codes(lsoas)
+
+    # Check both approaches give the same result
+    pd.testing.assert_frame_equal(
+        helpers.add_organisation_type(df.copy(), "Org_Code"),
+        add_organisation_type_startswith(df.copy(), "Org_Code"))
+
+    print(f"Adding organisation types for {len(df)} codes (best of {repeats})")
+    for name, function in [("startswith", add_organisation_type_startswith),
+                           ("prefix lookup", helpers.add_organisation_type)]:
+        times = timeit.repeat(lambda: function(df.copy(), "Org_Code"),
+                              number=10, repeat=repeats)
+        print(f"{name:>13}: {min(times) / 10 * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,85 @@
+"""
+Purpose of script: benchmarks processing.pivot_crosstab_data, which unstacks
+the aggregated crosstab data directly, against the previous approach of
+replacing null coverage with a dummy value, pivoting with pd.pivot_table and
+restoring the nulls.
+
+Synthetic aggregated data is used in the shape of the YoY check in the main
+validations: LA x Vac_Type rows by 5 financial year columns, with some null
+coverage values (where the population is 0).
+
+Run from the project root with:
+    python -m benchmarks.benchmark_pivot [number of LAs] [number of vaccines]
+"""
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+from child_vac_code.utilities import processing
+
+ROWS = ["Org_Code", "Org_Name", "Org_Type", "Data_Type", "Child_Age",
+        "Vac_Type"]
+
+
+def create_synthetic_crosstab_data(las, vaccines, years=5, seed=0):
+    """
+    Creates synthetic coverage data aggregated by the YoY check rows and
+    financial year.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.MultiIndex.from_product(
+        [[f"E06{i:06d}" for i in range(las)],
+         [f"Vac_{i}" for i in range(vaccines)],
+         [f"{2018 + i}-{19 + i}" for i in range(years)]],
+        names=["Org_Code", "Vac_Type", "FinancialYear"])
+    df_agg = index.to_frame(index=False)
+    df_agg["Org_Name"] = "LA " + df_agg["Org_Code"]
+    df_agg["Org_Type"] = "LA"
+    df_agg["Data_Type"] = "Actual"
+    df_agg["Child_Age"] = "12m"
+
+    # Some organisations don't have data for some years, and some have a
+    # population of 0 (null coverage)
+    df_agg = df_agg.sample(frac=0.95, random_state=seed).reset_index(drop=True)
+    df_agg["Coverage"] = rng.uniform(50, 100, len(df_agg))
+    df_agg.loc[rng.random(len(df_agg)) < 0.02, "Coverage"] = np.nan
+
+    return df_agg
+
+
+def pivot_crosstab_data_pivot_table(df_agg, rows, columns, measure):
+    """
+    The previous pivot step of create_output_crosstab, kept for comparison.
+    """
+    df_agg = df_agg.copy()
+    df_agg[measure] = df_agg[measure].fillna(-1)
+    df_pivot = pd.pivot_table(df_agg,
+                              values=measure,
+                              index=rows,
+                              columns=columns).reset_index()
+    df_pivot.replace({-1: np.nan}, inplace=True)
+
+    return df_pivot
+
+
+def main(las=150, vaccines=40, repeats=5):
+    df_agg = create_synthetic_crosstab_data(las, vaccines)
+
+    # Check both approaches give the same result
+    pd.testing.assert_frame_equal(
+        processing.pivot_crosstab_data(df_agg, ROWS, "FinancialYear",
+                                       "Coverage"),
+        pivot_crosstab_data_pivot_table(df_agg, ROWS, "FinancialYear",
+                                        "Coverage"))
+
+    print(f"Pivoting {len(df_agg)} aggregated rows (best of {repeats})")
+    for name, function in [("pivot_table", pivot_crosstab_data_pivot_table),
+                           ("unstack", processing.pivot_crosstab_data)]:
+        times = timeit.repeat(
+            lambda: function(df_agg, ROWS, "FinancialYear", "Coverage"),
+            number=5, repeat=repeats)
+        print(f"{name:>11}: {min(times) / 5 * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,71 @@
+"""
+Purpose of script: benchmarks fetching a large sql extract with pandas
+read_sql_query (fetch="pandas") against fetching into pyarrow record batches
+(fetch="arrow") in data_connections.df_from_sql.
+
+A synthetic extract with the columns of the asset table is loaded into a
+temporary SQLite stand-in database, so no server access is needed.
+
+Run from the project root with:
+    python -m benchmarks.benchmark_sql_fetch [number of rows]
+"""
+import sys
+import tempfile
+import timeit
+import numpy as np
+import pandas as pd
+import child_vac_code.parameters as param
+import child_vac_code.utilities.data_connections as dbc
+
+
+def create_synthetic_asset(rows, seed=0):
+    """
+    Creates a synthetic extract with the same columns as the asset table.
+    """
+    rng = np.random.default_rng(seed)
+    org_codes = np.array([f"E06{i:06d}" for i in range(400)])
+    vac_types = np.array([f"Vac_{i}" for i in range(40)])
+
+    return pd.DataFrame(
+        {
+            "FinancialYearStart": rng.choice(
+                ["01APR2018", "01APR2019", "01APR2020", "01APR2021",
+                 "01APR2022"], rows),
+            "Parent_Org_Code": rng.choice(org_codes[:10], rows),
+            "Org_Code": rng.choice(org_codes, rows),
+            "Org_Name": rng.choice(np.char.add("Name ", org_codes), rows),
+            "Org_Type": rng.choice(["LA", "Region", "Country"], rows),
+            "Child_Age": rng.choice(["12m", "24m", "5y"], rows),
+            "Vac_Type": rng.choice(vac_types, rows),
+            "Data_Type": "Actual",
+            "Number_Population": rng.integers(0, 20000, rows),
+            "Number_Vaccinated": rng.integers(0, 20000, rows),
+        }
+    )
+
+
+def main(rows=1000000, repeats=3):
+    with tempfile.TemporaryDirectory() as sqlite_dir:
+        param.DATA_BACKEND = "sqlite"
+        param.SQLITE_DIR = sqlite_dir
+        dbc.seed_sqlite_database(param.DATABASE,
+                                 {param.TABLE: create_synthetic_asset(rows)})
+        query = "SELECT * FROM [DATABASE].[dbo].[TABLE]"
+
+        print(f"Fetching {rows} rows (best of {repeats})")
+        for column_types in [None, param.ASSET_COLUMN_TYPES]:
+            for fetch in ["pandas", "arrow"]:
+                times = timeit.repeat(
+                    lambda: dbc.df_from_sql(query, param.SERVER,
+                                            param.DATABASE,
+                                            column_types=column_types,
+                                            fetch=fetch),
+                    number=1, repeat=repeats)
+                schema = "typed" if column_types else "untyped"
+                print(f"{fetch:>6} {schema:>7}: {min(times):.2f} seconds")
+
+        dbc.dispose_engines()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
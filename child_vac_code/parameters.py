@@ -14,6 +14,10 @@ CSV_DIR = PUB_DIR / "CSVs"
 DASH_DIR = PUB_DIR / "Dashboards"
 LOG_DIR = OUTPUT_DIR / "Logs"
 VALID_DIR = OUTPUT_DIR / "Validations"
+SNAPSHOT_DIR = BASE_DIR / "Snapshots"
+ASSET_STORE_DIR = BASE_DIR / "AssetStore"
+ORG_REF_CACHE_DIR = BASE_DIR / "OrgRefCache"
+RAW_DELTA_DIR = BASE_DIR / "RawDelta"
 
 # Set the locations/filenames of the template files
 OUTLIER_FILEPATH = VALID_DIR / "childhood_vaccination_outliers.xlsx"
@@ -88,6 +92,138 @@ CORP_REF_SERVER = "REF_SERVER"
 CORP_REF_DATABASE = "REF_DATABASE"
 ONS_ORG_TABLE = "REF_TABLE"  # Table containing the ONS organisation listings
 
+# Set the database backend the sql data is read from:
+# "mssql" - the NHSD SQL Server databases above
+# "sqlite" - local SQLite stand-ins for the databases in SQLITE_DIR (one
+# <database>.db file per database, seeded with
+# data_connections.seed_sqlite_database) for running the pipeline offline
+DATA_BACKEND = "mssql"
+SQLITE_DIR = BASE_DIR / "SQLite"
+
+# Set the size of the connection pool kept for each server/database during a run
+# (SQL_POOL_MAX_OVERFLOW sets how many extra connections can be opened when
+# all pooled connections are in use)
+SQL_POOL_SIZE = 2
+SQL_POOL_MAX_OVERFLOW = 2
+
+# Set how sql results are fetched:
+# "pandas" - with pandas read_sql_query
+# "arrow" - directly into pyarrow record batches (faster for large extracts),
+# SQL_FETCH_BATCH_SIZE rows at a time. If SQL_ARROW_DTYPES is True the
+# dataframes use Arrow-backed data types.
+SQL_FETCH = "pandas"
+SQL_FETCH_BATCH_SIZE = 100000
+SQL_ARROW_DTYPES = False
+
+# Set the number of rows to read at a time when importing the asset data.
+# Each chunk is cast to the data types below as it is read, which reduces the
+# memory needed for multi-year imports. Set to None to read in one go.
+ASSET_CHUNKSIZE = None
+ASSET_COLUMN_TYPES = {"FinancialYearStart": "category",
+                      "Parent_Org_Code": "category",
+                      "Org_Code": "category",
+                      "Org_Name": "category",
+                      "Org_Type": "category",
+                      "Child_Age": "category",
+                      "Vac_Type": "category",
+                      "Data_Type": "category",
+                      "Number_Population": "int32",
+                      "Number_Vaccinated": "int32"}
+
+# Set the data types of the COVER and flu data after pre-processing. Text
+# columns with few distinct values are held as categories, which reduces
+# memory use and speeds up the grouping in each output. Counts are held as
+# int32 (int64 is used if the values don't fit).
+PROCESSED_COLUMN_TYPES = {"FinancialYearStart": "category",
+                          "FinancialYear": "category",
+                          "Parent_Org_Code": "category",
+                          "Parent_Org_Name": "category",
+                          "Org_Code": "category",
+                          "Org_Name": "category",
+                          "Org_Type": "category",
+                          "Child_Age": "category",
+                          "Vac_Type": "category",
+                          "Data_Type": "category",
+                          "Vaccine_Status": "category",
+                          "Number_Population": "int32",
+                          "Number_Vaccinated": "int32"}
+
+# Set whether SQL extracts are saved as local snapshots (in SNAPSHOT_DIR) and
+# reused on later runs when the same query is run again. The current year raw
+# data is always fetched, as it can change while the collection is open (see
+# RAW_DELTA_IMPORT).
+# Set REFRESH_SNAPSHOTS to True to re-run the queries and overwrite the
+# snapshots (e.g. if the source data has been updated).
+# SNAPSHOT_MAX_MB sets the size limit of the snapshot folder - the least
+# recently used snapshots are removed when it is exceeded.
+USE_SNAPSHOTS = False
+REFRESH_SNAPSHOTS = False
+SNAPSHOT_MAX_MB = 2000
+
+# Set whether past years of asset data are kept in a local store (in
+# ASSET_STORE_DIR) with one file per year. When True only years missing from
+# the store (and the current reporting year) are imported from SQL.
+# Add any past years that have been updated in the asset to
+# ASSET_STORE_INVALIDATE (in DDMMMYYYY format) so they are re-imported
+# e.g. ["01APR2021"] (they are re-imported on every run while listed)
+USE_ASSET_STORE = False
+ASSET_STORE_INVALIDATE = []
+
+# Set where the aggregation for crosstab outputs (tables and charts) is done:
+# "pandas" - from the imported row level data
+# "sql" - in the SQL asset, fetching only the aggregated counts (crosstabs that
+# can't be expressed in SQL are still aggregated in pandas)
+# If CROSSTAB_PARITY_CHECK is True, each SQL aggregation is also done in pandas
+# and the process stops if they don't match.
+CROSSTAB_EXECUTION = "pandas"
+CROSSTAB_PARITY_CHECK = False
+
+# Set how long (in hours) the organisation reference data for a financial year
+# is cached in ORG_REF_CACHE_DIR and reused by later runs before it is
+# re-imported. Set to 0 to always import it from SQL.
+ORG_REF_CACHE_TTL_HOURS = 168
+
+# Set whether the organisation reference data for the run is also saved as a
+# feather file in the cached_dataframes folder (e.g. for use by a separate
+# process). The outputs use the copy held in memory (see org_ref.py).
+ORG_REF_PERSIST = False
+
+# Set whether the validations import only the organisations whose raw data
+# has changed since the last run (compared using a checksum of each
+# organisation's data), merging them into a local copy of the raw year in
+# RAW_DELTA_DIR. If more than RAW_DELTA_MAX_ORGS organisations have changed
+# the whole year is imported.
+RAW_DELTA_IMPORT = False
+RAW_DELTA_MAX_ORGS = 500
+
+# Set whether crosstabs are aggregated from a cube of the pre-processed data,
+# built once by summing the counts by the dimensions below (see cube.py).
+# Outputs are the same as aggregating the full data.
+USE_AGGREGATION_CUBE = True
+CUBE_DIMENSIONS = ["FinancialYear", "Org_Type", "Org_Code", "Org_Name",
+                   "Parent_Org_Code", "Parent_Org_Name", "Child_Age",
+                   "Vac_Type", "Vaccine_Status"]
+
+# Set whether the row masks used to filter the data for each output are cached
+# and reused by later outputs with the same filters (see masks.py). Turns on
+# pandas copy-on-write mode, which the cache uses to detect changes to the data.
+CACHE_FILTER_MASKS = True
+
+# Set the maximum number of data sources loaded at the same time
+LOAD_MAX_WORKERS = 4
+
+# Set whether pandas copy-on-write mode is used, so that selections from the
+# source data share its memory rather than being copied (see memory.py).
+# Recommended for long time series. Also turned on if CACHE_FILTER_MASKS is
+# True.
+COPY_ON_WRITE = False
+
+# Set the maximum peak memory (MB) allowed at the end of each stage of the
+# pipeline ("load", "pre_processing" and "outputs"). The run is aborted if a
+# stage is over its budget. Stages not listed have no budget,
+# e.g. {"load": 6000, "pre_processing": 8000, "outputs": 12000}
+STAGE_MEMORY_BUDGETS_MB = {}
+
 
 # --- Updates ---
 # Small LAs to combine with larger LAs for publication outputs
@@ -108,6 +244,23 @@ UPDATE_LA_CODE_FLU = {"E08000020": "E08000037",
                       "E10000002": "E06000060"}
 
 
+# Define the age bands in the flu data. For each band sets the child age and
+# vac type, and the flu source data columns holding the population and
+# vaccinated counts. Bands are stacked into rows in the order given (see
+# pre_processing.update_flu_vac_data). Add more as required, e.g. for school
+# age bands.
+FLU_AGE_BANDS = [
+    {"Child_Age": "24m",
+     "Vac_Type": "Flu_24m",
+     "Number_Population": "All 2 year olds (combined): Patients registered",
+     "Number_Vaccinated": "All 2 year olds (combined): Number vaccinated"},
+    {"Child_Age": "3y",
+     "Vac_Type": "Flu_3y",
+     "Number_Population": "All 3 year olds (combined): Patients registered",
+     "Number_Vaccinated": "All 3 year olds (combined): Number vaccinated"},
+]
+
+
 # --- Definitions ---
 # Set symbols for not applicable (null) and not available values in all outputs
 NOT_APPLICABLE = "z"
@@ -123,6 +276,22 @@ CSV_NOT_INC = "not included"
 LOCAL_LEVEL_ORGS = {"LA_code": "LA",
                     "ICB_code": "ICB"}
 
+# Define the organisation type and level for each organisation entity code
+# (the first 3 characters of the organisation code), as added to the
+# organisation reference data by helpers.add_organisation_type.
+# Add more as required.
+ORG_TYPE_PREFIXES = {"E01": ("LSOA", "LSOA"),
+                     "E06": ("LA", "Local"),
+                     "E07": ("LA", "Local"),
+                     "E08": ("LA", "Local"),
+                     "E09": ("LA", "Local"),
+                     "E10": ("LA", "Local"),
+                     "E12": ("LA_parent", "Regional"),
+                     "E38": ("CCG", "Local"),
+                     "E54": ("ICB", "Local"),
+                     "E40": ("ICB_parent", "Regional"),
+                     "E92": ("National", "National")}
+
 # List of valid output types as used in create_output_crosstab
 OUTPUT_TYPE = ["Vaccinated", "Population", "Coverage"]
 
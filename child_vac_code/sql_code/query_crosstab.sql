@@ -0,0 +1,6 @@
+SELECT <Columns>
+      ,SUM([Number_Vaccinated]) as Number_Vaccinated
+      ,SUM([Number_Population]) as Number_Population
+FROM [<Database>].[dbo].[<Table>]
+WHERE [FinancialYearStart] in ('<YearRange>') and [Data_Type] in ('Actual')<Filter>
+GROUP BY <GroupBy>
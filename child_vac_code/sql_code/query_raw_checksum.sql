@@ -0,0 +1,16 @@
+/*
+Returns a row count, count totals and checksum of the raw data for each
+organisation, used as a watermark to find the organisations whose data has
+changed since the last import (see load.import_raw_cover_delta)
+*/
+SELECT [Org_Code_ONS] as Org_Code
+       ,COUNT(*) as Row_Count
+       ,SUM([Denominator]) as Total_Population
+       ,SUM([Value]) as Total_Vaccinated
+       ,CHECKSUM_AGG(BINARY_CHECKSUM([Org_Name], [Org_Type], [Data_Type],
+                                     [Child_Age], [Measure], [Denominator],
+                                     [Value])) as Org_Checksum
+FROM [<Database>].[dbo].[<Table>]
+WHERE [FinancialYearStart] = '<FinancialYearStart>'
+AND [Measure] not like 'Denom_%'
+GROUP BY [Org_Code_ONS]
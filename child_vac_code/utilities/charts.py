@@ -1,4 +1,4 @@
-from child_vac_code.utilities.processing import create_output_crosstab
+from child_vac_code.utilities import output_specs
 
 """
 This module contains all the user defined inputs for each chart.
@@ -317,8 +317,9 @@ def get_charts_flu():
 
 
 """
-    The following functions contain the user defined inputs that determine the
-    dataframe content for each output.
+    The following specs contain the user defined inputs that determine the
+    dataframe content for each output, and the functions after the specs
+    create each output from its spec (see output_specs.py).
 
     See the tables.py file for details of each argument.
 
@@ -326,883 +327,869 @@ def get_charts_flu():
 """
 
 
-# df of DTaP 12m vaccs coverage for England
+CHART_SPECS = {
+    # df of DTaP 12m vaccs coverage for England
+    "create_chart_dtap_12m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP 12m vaccs coverage for regions
+    "create_chart_dtap_12m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP 24m vaccs coverage for England
+    "create_chart_dtap_24m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP 24m vaccs coverage for regions
+    "create_chart_dtap_24m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP 5y vaccs coverage for England
+    "create_chart_dtap_5y_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP 5y vaccs coverage for regions
+    "create_chart_dtap_5y_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP_IPV 5y vaccs coverage for England
+    "create_chart_dtap_ipv_5y_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of DTaP_IPV 5y vaccs coverage for regions
+    "create_chart_dtap_ipv_5y_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MMR 24m vaccs coverage for England
+    "create_chart_mmr_24m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "MMR_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MMR 24m vaccs coverage for regions
+    "create_chart_mmr_24m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MMR 24m vaccs coverage for LAs
+    "create_chart_mmr_24m_year_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Org_Name",
+                    "Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # df of MMR 5y vaccs coverage for England
+    "create_chart_mmr1_5y_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "MMR1_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MMR 5y vaccs coverage for regions
+    "create_chart_mmr1_5y_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MMR2 5y vaccs coverage for England
+    "create_chart_mmr2_5y_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "MMR2_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MMR2 5y vaccs coverage for regions
+    "create_chart_mmr2_5y_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR2_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of rota 12m vaccs coverage for England
+    "create_chart_rota_12m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "Rota_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of rota 12m vaccs coverage for regions
+    "create_chart_rota_12m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Rota_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of PCV 12m vaccs coverage for England
+    "create_chart_pcv_12m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "PCV_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of PCV 24m vaccs coverage for England
+    "create_chart_pcv_24m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "PCV_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of PCV 24m vaccs coverage for regions
+    "create_chart_pcv_24m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['PCV_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of Hib MenC 24m vaccs coverage for England
+    "create_chart_hib_menc_24m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "Hib_MenC_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of Hib MenC 24m vaccs coverage for regions
+    "create_chart_hib_menc_24m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Hib_MenC_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of Hib MenC 5y vaccs coverage for England
+    "create_chart_hib_menc_5y_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of Hib MenC 5y vaccs coverage for regions
+    "create_chart_hib_menc_5y_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Hib_MenC_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MenB 12m vaccs coverage for England
+    "create_chart_menb_12m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MenB 12m vaccs coverage for regions
+    "create_chart_menb_12m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MenB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MenB booster 24m vaccs coverage for England
+    "create_chart_menb_boost_24m_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of MenB booster 24m vaccs coverage for regions
+    "create_chart_menb_boost_24m_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MenB_booster_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of flu 24m and 3y vaccs coverage for england
+    "create_chart_flu_24m_3y_year_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Vac_Type"],
+        "columns": None,
+        "sort_on": None,
+        "row_order": {"Vac_Type": ["Flu_24m_3y"]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m', 'Flu_3y']",
+        "row_subgroup": {"Vac_Type":
+                         {"Flu_24m_3y": ["Flu_24m", "Flu_3y"]}},
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+
+    # df of flu 24m and 3y vaccs coverage for regions
+    "create_chart_flu_24m_3y_year_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Name", "Vac_Type"],
+        "columns": None,
+        "sort_on": None,
+        "row_order": {"Parent_Org_Name": [
+            "North East",
+            "North West",
+            "Yorkshire and The Humber",
+            "East Midlands",
+            "West Midlands",
+            "East of England",
+            "London",
+            "South East",
+            "South West"
+        ],
+            "Vac_Type": ["Flu_24m_3y"]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m', 'Flu_3y']",
+        "row_subgroup": {"Vac_Type":
+                         {"Flu_24m_3y": ["Flu_24m", "Flu_3y"]}},
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+        "rounding": 1,
+    },
+}
+
+output_specs.register_specs(CHART_SPECS)
+
+
+# The content functions used in the output lists, which create each
+# output from its spec
 def create_chart_dtap_12m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP 12m vaccs coverage for regions
+    return output_specs.run("create_chart_dtap_12m_year_eng", df)
+
+
 def create_chart_dtap_12m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP 24m vaccs coverage for England
+    return output_specs.run("create_chart_dtap_12m_year_reg", df)
+
+
 def create_chart_dtap_24m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP 24m vaccs coverage for regions
+    return output_specs.run("create_chart_dtap_24m_year_eng", df)
+
+
 def create_chart_dtap_24m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP 5y vaccs coverage for England
+    return output_specs.run("create_chart_dtap_24m_year_reg", df)
+
+
 def create_chart_dtap_5y_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP 5y vaccs coverage for regions
+    return output_specs.run("create_chart_dtap_5y_year_eng", df)
+
+
 def create_chart_dtap_5y_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['DTaP_IPV_Hib_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP_IPV 5y vaccs coverage for England
+    return output_specs.run("create_chart_dtap_5y_year_reg", df)
+
+
 def create_chart_dtap_ipv_5y_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of DTaP_IPV 5y vaccs coverage for regions
+    return output_specs.run("create_chart_dtap_ipv_5y_year_eng", df)
+
+
 def create_chart_dtap_ipv_5y_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['DTaP_IPV_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MMR 24m vaccs coverage for England
+    return output_specs.run("create_chart_dtap_ipv_5y_year_reg", df)
+
+
 def create_chart_mmr_24m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "MMR_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MMR 24m vaccs coverage for regions
+    return output_specs.run("create_chart_mmr_24m_year_eng", df)
+
+
 def create_chart_mmr_24m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['MMR_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MMR 24m vaccs coverage for LAs
+    return output_specs.run("create_chart_mmr_24m_year_reg", df)
+
+
 def create_chart_mmr_24m_year_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Org_Name",
-               "Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['MMR_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years)
-
-
-# df of MMR 5y vaccs coverage for England
+    return output_specs.run("create_chart_mmr_24m_year_las", df)
+
+
 def create_chart_mmr1_5y_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "MMR1_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MMR 5y vaccs coverage for regions
+    return output_specs.run("create_chart_mmr1_5y_year_eng", df)
+
+
 def create_chart_mmr1_5y_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MMR2 5y vaccs coverage for England
+    return output_specs.run("create_chart_mmr1_5y_year_reg", df)
+
+
 def create_chart_mmr2_5y_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "MMR2_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MMR2 5y vaccs coverage for regions
+    return output_specs.run("create_chart_mmr2_5y_year_eng", df)
+
+
 def create_chart_mmr2_5y_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['MMR2_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of rota 12m vaccs coverage for England
+    return output_specs.run("create_chart_mmr2_5y_year_reg", df)
+
+
 def create_chart_rota_12m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "Rota_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of rota 12m vaccs coverage for regions
+    return output_specs.run("create_chart_rota_12m_year_eng", df)
+
+
 def create_chart_rota_12m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['Rota_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of PCV 12m vaccs coverage for England
+    return output_specs.run("create_chart_rota_12m_year_reg", df)
+
+
 def create_chart_pcv_12m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "PCV_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of PCV 24m vaccs coverage for England
+    return output_specs.run("create_chart_pcv_12m_year_eng", df)
+
+
 def create_chart_pcv_24m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "PCV_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of PCV 24m vaccs coverage for regions
+    return output_specs.run("create_chart_pcv_24m_year_eng", df)
+
+
 def create_chart_pcv_24m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['PCV_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of Hib MenC 24m vaccs coverage for England
+    return output_specs.run("create_chart_pcv_24m_year_reg", df)
+
+
 def create_chart_hib_menc_24m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "Hib_MenC_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of Hib MenC 24m vaccs coverage for regions
+    return output_specs.run("create_chart_hib_menc_24m_year_eng", df)
+
+
 def create_chart_hib_menc_24m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['Hib_MenC_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of Hib MenC 5y vaccs coverage for England
+    return output_specs.run("create_chart_hib_menc_24m_year_reg", df)
+
+
 def create_chart_hib_menc_5y_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of Hib MenC 5y vaccs coverage for regions
+    return output_specs.run("create_chart_hib_menc_5y_year_eng", df)
+
+
 def create_chart_hib_menc_5y_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['Hib_MenC_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MenB 12m vaccs coverage for England
+    return output_specs.run("create_chart_hib_menc_5y_year_reg", df)
+
+
 def create_chart_menb_12m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "MenB_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MenB 12m vaccs coverage for regions
+    return output_specs.run("create_chart_menb_12m_year_eng", df)
+
+
 def create_chart_menb_12m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['MenB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MenB booster 24m vaccs coverage for England
+    return output_specs.run("create_chart_menb_12m_year_reg", df)
+
+
 def create_chart_menb_boost_24m_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of MenB booster 24m vaccs coverage for regions
+    return output_specs.run("create_chart_menb_boost_24m_year_eng", df)
+
+
 def create_chart_menb_boost_24m_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['MenB_booster_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of flu 24m and 3y vaccs coverage for england
+    return output_specs.run("create_chart_menb_boost_24m_year_reg", df)
+
+
 def create_chart_flu_24m_3y_year_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Vac_Type"]
-    columns = None
-    sort_on = None
-    row_order = {"Vac_Type": ["Flu_24m_3y"]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['Flu_24m', 'Flu_3y']")
-    row_subgroup = {"Vac_Type":
-                    {"Flu_24m_3y": ["Flu_24m", "Flu_3y"]}}
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
-
-
-# df of flu 24m and 3y vaccs coverage for regions
+    return output_specs.run("create_chart_flu_24m_3y_year_eng", df)
+
+
 def create_chart_flu_24m_3y_year_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Name", "Vac_Type"]
-    columns = None
-    sort_on = None
-    row_order = {"Parent_Org_Name": [
-        "North East",
-        "North West",
-        "Yorkshire and The Humber",
-        "East Midlands",
-        "West Midlands",
-        "East of England",
-        "London",
-        "South East",
-        "South West"
-    ],
-        "Vac_Type": ["Flu_24m_3y"]}
-    column_order = None
-    column_rename = None
-    filter_condition = ("Vac_Type in ['Flu_24m', 'Flu_3y']")
-    row_subgroup = {"Vac_Type":
-                    {"Flu_24m_3y": ["Flu_24m", "Flu_3y"]}}
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-    rounding = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier,
-                                  ts_years, rounding)
+    return output_specs.run("create_chart_flu_24m_3y_year_reg", df)
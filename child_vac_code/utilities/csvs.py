@@ -1,5 +1,4 @@
-from child_vac_code.utilities.processing import (create_csv_output,
-                                                 create_output_crosstab)
+from child_vac_code.utilities import output_specs
 
 """
 This module contains all the user defined inputs for each tidy csv output.
@@ -55,8 +54,12 @@ def get_csvs_cover():
 
 
 """
-The following functions contain the user defined inputs that determine the
-dataframe content for each output.
+The following specs contain the user defined inputs that determine the
+dataframe content for each output: the processing function that creates the
+output ("function") and its arguments. The functions after the specs create
+each output from its spec (see output_specs.py). The arguments of
+create_csv_output are defined as below, and those of create_output_crosstab
+in tables.py.
 
 output_type : str
     Either "Population" or "Vaccinated"
@@ -101,203 +104,202 @@ Returns:
 """
 
 
-# To create the population values for the rest of the tables csv
+CSV_SPECS = {
+    # To create the population values for the rest of the tables csv
+    "create_csv_la_pop": {
+        "function": "create_csv_output",
+        "filter_condition": 'Vac_Type not in (@param.SELECTIVE_VACCS)',
+        "output_type": "Population",
+        "breakdowns": ["FinancialYear",
+                       "Parent_Org_Code",
+                       "Parent_Org_Name",
+                       "Org_Code",
+                       "Org_Name",
+                       "Child_Age",
+                       "Vac_Type"],
+        "sort_on": ["Parent_Org_Code", "Org_Name", "Child_Age", "Vac_Type"],
+        "column_rename": {"Vac_Type": "Indicator",
+                          "Number_Population": "Value",
+                          "FinancialYear": "CollectionYearRange"},
+    },
+
+    # To create the vaccinated values for the rest of the tables csv
+    "create_csv_la_vax": {
+        "function": "create_csv_output",
+        "filter_condition": 'Vac_Type not in (@param.SELECTIVE_VACCS)',
+        "output_type": "Vaccinated",
+        "breakdowns": ["FinancialYear",
+                       "Parent_Org_Code",
+                       "Parent_Org_Name",
+                       "Org_Code",
+                       "Org_Name",
+                       "Child_Age",
+                       "Vac_Type"],
+        "sort_on": ["Parent_Org_Code", "Org_Name", "Child_Age", "Vac_Type"],
+        "column_rename": {"Vac_Type": "Indicator",
+                          "Number_Vaccinated": "Value",
+                          "FinancialYear": "CollectionYearRange"},
+    },
+
+    # To create csv for table 11b/11c population
+    "create_csv_11b_11c_pop": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
+                 "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code", "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange",
+                          "HepB_Group2_12m": "HepB_12m_Population",
+                          "HepB_Group2_24m": "HepB_24m_Population"},
+        "filter_condition": "Vac_Type in ['HepB_Group2_12m', 'HepB_Group2_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create csv for table 11b/11c vaccinated
+    "create_csv_11b_11c_vac": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
+                 "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code", "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange",
+                          "HepB_Group2_12m": "HepB_12m_Vaccinated",
+                          "HepB_Group2_24m": "HepB_24m_Vaccinated"},
+        "filter_condition": "Vac_Type in ['HepB_Group2_12m', 'HepB_Group2_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create csv for table 11b/11c coverage
+    "create_csv_11b_11c_cov": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
+                 "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code", "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange",
+                          "HepB_Group2_12m": "HepB_12m_Coverage",
+                          "HepB_Group2_24m": "HepB_24m_Coverage"},
+        "filter_condition": "Vac_Type in ['HepB_Group2_12m', 'HepB_Group2_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create csv for table 11a population
+    "create_csv_11a_pop": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
+                 "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange",
+                          "BCG_3m": "BCG_3m_Population"},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create csv for table 11a vaccinated
+    "create_csv_11a_vac": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
+                 "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange",
+                          "BCG_3m": "BCG_3m_Vaccinated"},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create csv for table 11a coverage
+    "create_csv_11a_cov": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
+                 "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange",
+                          "BCG_3m": "BCG_3m_Coverage"},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+}
+
+output_specs.register_specs(CSV_SPECS)
+
+
+# The content functions used in the output lists, which create each
+# output from its spec
 def create_csv_la_pop(df):
-    output_type = "Population"
-    filter_condition = ('Vac_Type not in (@param.SELECTIVE_VACCS)')
-    breakdowns = ["FinancialYear",
-                  "Parent_Org_Code",
-                  "Parent_Org_Name",
-                  "Org_Code",
-                  "Org_Name",
-                  "Child_Age",
-                  "Vac_Type"]
-    sort_on = ["Parent_Org_Code", "Org_Name", "Child_Age", "Vac_Type"]
-    column_rename = {"Vac_Type": "Indicator",
-                     "Number_Population": "Value",
-                     "FinancialYear": "CollectionYearRange"}
-    return create_csv_output(df, filter_condition, output_type,
-                             breakdowns, sort_on, column_rename)
-
-
-# To create the vaccinated values for the rest of the tables csv
+    return output_specs.run("create_csv_la_pop", df)
+
+
 def create_csv_la_vax(df):
-    output_type = "Vaccinated"
-    filter_condition = ('Vac_Type not in (@param.SELECTIVE_VACCS)')
-    breakdowns = ["FinancialYear",
-                  "Parent_Org_Code",
-                  "Parent_Org_Name",
-                  "Org_Code",
-                  "Org_Name",
-                  "Child_Age",
-                  "Vac_Type"]
-    sort_on = ["Parent_Org_Code", "Org_Name", "Child_Age", "Vac_Type"]
-    column_rename = {"Vac_Type": "Indicator",
-                     "Number_Vaccinated": "Value",
-                     "FinancialYear": "CollectionYearRange"}
-    return create_csv_output(df, filter_condition, output_type,
-                             breakdowns, sort_on, column_rename)
-
-
-# To create csv for table 11b/11c population
+    return output_specs.run("create_csv_la_vax", df)
+
+
 def create_csv_11b_11c_pop(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
-            "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code", "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange",
-                     "HepB_Group2_12m": "HepB_12m_Population",
-                     "HepB_Group2_24m": "HepB_24m_Population"}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = ("Vac_Type in ['HepB_Group2_12m', 'HepB_Group2_24m']")
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition,
-                                  row_subgroup, column_subgroup,
-                                  count_multiplier, ts_years)
-
-
-# To create csv for table 11b/11c vaccinated
+    return output_specs.run("create_csv_11b_11c_pop", df)
+
+
 def create_csv_11b_11c_vac(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
-            "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code", "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange",
-                     "HepB_Group2_12m": "HepB_12m_Vaccinated",
-                     "HepB_Group2_24m": "HepB_24m_Vaccinated"}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = ("Vac_Type in ['HepB_Group2_12m', 'HepB_Group2_24m']")
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition,
-                                  row_subgroup, column_subgroup,
-                                  count_multiplier, ts_years)
-
-
-# To create csv for table 11b/11c coverage
+    return output_specs.run("create_csv_11b_11c_vac", df)
+
+
 def create_csv_11b_11c_cov(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
-            "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code", "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange",
-                     "HepB_Group2_12m": "HepB_12m_Coverage",
-                     "HepB_Group2_24m": "HepB_24m_Coverage"}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = ("Vac_Type in ['HepB_Group2_12m', 'HepB_Group2_24m']")
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition,
-                                  row_subgroup, column_subgroup,
-                                  count_multiplier, ts_years)
-
-
-# To create csv for table 11a population
+    return output_specs.run("create_csv_11b_11c_cov", df)
+
+
 def create_csv_11a_pop(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
-            "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange",
-                     "BCG_3m": "BCG_3m_Population"}
-
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create csv for table 11a vaccinated
+    return output_specs.run("create_csv_11a_pop", df)
+
+
 def create_csv_11a_vac(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
-            "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange",
-                     "BCG_3m": "BCG_3m_Vaccinated"}
-
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create csv for table 11a coverage
+    return output_specs.run("create_csv_11a_vac", df)
+
+
 def create_csv_11a_cov(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear", "Parent_Org_Code", "Parent_Org_Name", "Org_Code",
-            "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange",
-                     "BCG_3m": "BCG_3m_Coverage"}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+    return output_specs.run("create_csv_11a_cov", df)
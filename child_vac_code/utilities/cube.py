@@ -0,0 +1,216 @@
+"""
+Purpose of script: builds an aggregation cube of the pre-processed data, so
+that crosstabs are aggregated from a small slice of the cube rather than by
+filtering the full dataframe for each output.
+
+Used when USE_AGGREGATION_CUBE is True (parameters.py). The cube is built once
+by register, summing the count columns by every combination of the
+CUBE_DIMENSIONS in the data, and is split into a partition for each financial
+year. processing.aggregate_crosstab_data then filters and groups only the
+partitions for the years in the crosstab. Crosstabs that need a column that
+isn't a cube dimension (e.g. a filter on the counts) use the full dataframe.
+
+Many outputs share the same aggregation (e.g. the population, vaccinated and
+coverage versions of a table), so each aggregation made from the cube is kept
+and reused for later crosstabs with the same spec.
+"""
+import logging
+import numpy as np
+import pandas as pd
+import child_vac_code.parameters as param
+from child_vac_code.utilities import helpers, predicates
+
+logger = logging.getLogger(__name__)
+
+# Cubes built during the run, keyed by the id of the dataframe they were built
+# from. The dataframe is held so that its id can't be reused.
+_CUBES = {}
+
+
+def build_cube(df, dimensions, count_columns):
+    """
+    Sums the count columns of a dataframe by every combination of the
+    dimension columns in the data. Unlike groupby, combinations with nulls
+    are kept, so the cube can be filtered and grouped in the same way as the
+    dataframe.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    dimensions : list[str]
+        Columns to aggregate by
+    count_columns : list[str]
+        Columns to sum
+
+    Returns
+    -------
+    pandas.DataFrame
+        The dimension columns (with the same data types as df) and the summed
+        count columns
+    """
+    # Number each distinct combination of the dimensions. The columns are
+    # grouped by their factorized codes, where nulls are numbered -1.
+    df_codes = pd.DataFrame({column: pd.factorize(df[column])[0]
+                             for column in dimensions})
+    group_ids = df_codes.groupby(dimensions, sort=False).ngroup().to_numpy()
+
+    # Take the dimension values from the first row of each combination, and
+    # sum the counts of each combination
+    first_rows = np.unique(group_ids, return_index=True)[1]
+    df_cube = df[dimensions].take(first_rows).reset_index(drop=True)
+    df_counts = df[count_columns].groupby(group_ids).sum()
+    for column in count_columns:
+        df_cube[column] = df_counts[column].to_numpy()
+
+    return df_cube
+
+
+def register(df, dimensions=None, count_columns=None):
+    """
+    Builds the aggregation cube of a pre-processed dataframe, so that
+    crosstabs created from it are aggregated from the cube.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The pre-processed data (e.g. from update_child_vac_data)
+    dimensions : list[str]
+        Columns to aggregate by. Set to CUBE_DIMENSIONS (parameters.py) by
+        default. Dimensions not in df are ignored.
+    count_columns : list[str]
+        Columns to sum. Set to Number_Vaccinated and Number_Population by
+        default.
+
+    Returns
+    -------
+    None
+    """
+    if dimensions is None:
+        dimensions = param.CUBE_DIMENSIONS
+    if count_columns is None:
+        count_columns = ["Number_Vaccinated", "Number_Population"]
+    dimensions = [column for column in dimensions if column in df.columns]
+
+    logging.info("Building the aggregation cube")
+    df_cube = build_cube(df, dimensions, count_columns)
+
+    # Split the cube into a partition for each financial year
+    partitions = {year: df_year for year, df_year
+                  in df_cube.groupby("FinancialYear", observed=True,
+                                     sort=False)}
+
+    logging.info(f"Aggregation cube has {len(df_cube)} rows "
+                 f"(from {len(df)})")
+    _CUBES[id(df)] = {"df": df,
+                      "dimensions": dimensions,
+                      "count_columns": count_columns,
+                      "org_types": df["Org_Type"].drop_duplicates().tolist(),
+                      "partitions": partitions,
+                      "empty": df_cube.iloc[:0],
+                      "rollups": {}}
+
+
+def clear():
+    """
+    Removes all aggregation cubes.
+    """
+    _CUBES.clear()
+
+
+def select(df, org_type, filter_condition, variables, ts_years,
+           count_columns):
+    """
+    Selects the cube rows for a crosstab of a dataframe: the partitions for
+    the years in the crosstab, filtered to the org type. Filtering and
+    grouping these rows gives the same result as filtering and grouping the
+    dataframe.
+
+    Returns None if df doesn't have a cube, or the crosstab needs columns
+    that aren't in the cube, in which case the dataframe should be used.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe registered with register
+    org_type : str
+        Org type to filter to (or None)
+    filter_condition : str
+        Optional dataframe query filter (or None)
+    variables : list[str]
+        Columns to group by
+    ts_years : int
+        Number of years to include
+    count_columns : list[str]
+        Columns to be summed
+
+    Returns
+    -------
+    pandas.DataFrame or None
+    """
+    cube = _CUBES.get(id(df))
+    if cube is None:
+        return None
+
+    # Check the crosstab only needs the cube columns
+    needed = set(variables)
+    if filter_condition is not None:
+        needed |= predicates.compile_predicate(filter_condition).columns
+    if not (needed <= set(cube["dimensions"])
+            and set(count_columns) <= set(cube["count_columns"])):
+        logging.info("Crosstab needs columns not in the aggregation cube so "
+                     "is aggregated from the full data")
+        return None
+
+    # Select the partitions for the years in the time series
+    year_range = helpers.convert_year_format(
+        helpers.get_year_range(param.FYEAR_START, ts_years), "fyear")
+    partitions = [cube["partitions"][year] for year in year_range
+                  if year in cube["partitions"]]
+    if len(partitions) == 0:
+        df_cube = cube["empty"]
+    elif len(partitions) == 1:
+        df_cube = partitions[0]
+    else:
+        df_cube = pd.concat(partitions)
+
+    # Filter to org type (checking it is valid as in filter_dataframe)
+    if org_type is not None:
+        helpers.validate_value_with_list("Org_Type", org_type,
+                                         cube["org_types"])
+        df_cube = df_cube[df_cube["Org_Type"] == org_type]
+
+    return df_cube
+
+
+def get_rollup(df, key):
+    """
+    Returns a copy of an aggregation saved with save_rollup, or None if df
+    doesn't have a cube or no aggregation has been saved with the key.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe registered with register
+    key : tuple
+        The crosstab spec e.g. (org_type, filter_condition, variables,
+        ts_years, num_column, denom_column)
+
+    Returns
+    -------
+    pandas.DataFrame or None
+    """
+    cube = _CUBES.get(id(df))
+    if cube is None or key not in cube["rollups"]:
+        return None
+
+    return cube["rollups"][key].copy()
+
+
+def save_rollup(df, key, df_agg):
+    """
+    Saves a copy of an aggregation made from the cube of df, to be reused for
+    crosstabs with the same spec (see get_rollup).
+    """
+    cube = _CUBES.get(id(df))
+    if cube is not None:
+        cube["rollups"][key] = df_agg.copy()
@@ -1,10 +1,11 @@
-from child_vac_code.utilities.processing import (create_output_crosstab,
-                                                 create_output_dashboard_data)
+from child_vac_code.utilities import output_specs
 import child_vac_code.parameters as param
 
 
 """
 This module contains all the user defined inputs for the Power BI dashboard or map data.
+The inputs for each output are declared as specs in DASHBOARD_SPECS (see
+output_specs.py).
 See the tables.py and processing.py files for details of the arguments used
 in the related functions.
 
@@ -128,192 +129,208 @@ def get_dashboards_csv_pub():
     return all_outputs
 
 
-# To create df of coverage for DTaP12m and MMR24m for the dashboard report map
+DASHBOARD_SPECS = {
+    # To create df of coverage for DTaP12m and MMR24m for the dashboard report map
+    "create_dashboard_map_data": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear", "Parent_Org_Code", "Org_Code", "Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code", "Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {"FinancialYear": "CollectionYearRange"},
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m', 'MMR_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Creates dashboard data at UK level
+    "create_dashboard_data_uk": {
+        "function": "create_output_dashboard_data",
+        "output_type": "UK",
+        "org_type": None,
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": {"FinancialYear": "Year", "Org_Code": "OrgCode",
+                          "Org_Name": "OrgName", "Org_Level": "OrgType",
+                          "Vac_Type": "VacCode"},
+        "filter_condition": "Vac_Type not in (@param.SELECTIVE_VACCS)",
+        "population_vaccines": param.POPULATION_VACCINES,
+    },
+
+    # Creates dashboard data at national (England) level
+    "create_dashboard_data_england": {
+        "function": "create_output_dashboard_data",
+        "output_type": "National",
+        "org_type": "LA",
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": {"FinancialYear": "Year", "Org_Code": "OrgCode",
+                          "Org_Name": "OrgName", "Org_Level": "OrgType",
+                          "Vac_Type": "VacCode"},
+        "filter_condition": "Vac_Type not in (@param.SELECTIVE_VACCS)",
+        "population_vaccines": param.POPULATION_VACCINES,
+    },
+
+    # Creates dashboard data for other nations
+    "create_dashboard_data_other_nations": {
+        "function": "create_output_dashboard_data",
+        "output_type": "Other nations",
+        "org_type": "NAT",
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": {"FinancialYear": "Year", "Org_Code": "OrgCode",
+                          "Org_Name": "OrgName", "Org_Level": "OrgType",
+                          "Vac_Type": "VacCode"},
+        "filter_condition": "Vac_Type not in (@param.SELECTIVE_VACCS)",
+        "population_vaccines": param.POPULATION_VACCINES,
+    },
+
+    # Creates dashboard data for regions
+    "create_dashboard_data_regions": {
+        "function": "create_output_dashboard_data",
+        "output_type": "Region",
+        "org_type": "LA",
+        "breakdowns": ["FinancialYear", "Parent_Org_Code",
+                       "Parent_Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Parent_Org_Code"],
+        "column_rename": {"FinancialYear": "Year", "Parent_Org_Code": "OrgCode",
+                          "Parent_Org_Name": "OrgName", "Org_Level": "OrgType",
+                          "Vac_Type": "VacCode"},
+        "filter_condition": "Vac_Type not in (@param.SELECTIVE_VACCS)",
+        "population_vaccines": param.POPULATION_VACCINES,
+    },
+
+    # Creates dashboard data for local authorities
+    "create_dashboard_data_las": {
+        "function": "create_output_dashboard_data",
+        "output_type": "LA",
+        "org_type": "LA",
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": {"FinancialYear": "Year", "Org_Code": "OrgCode",
+                          "Org_Name": "OrgName", "Org_Level": "OrgType",
+                          "Vac_Type": "VacCode"},
+        "filter_condition": "Vac_Type not in (@param.SELECTIVE_VACCS)",
+        "population_vaccines": param.POPULATION_VACCINES,
+    },
+
+    # Creates internal dashboard data at UK level
+    "create_dashboard_data_internal_uk": {
+        "function": "create_output_dashboard_data",
+        "output_type": "UK",
+        "org_type": None,
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": None,
+        "filter_condition": "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)",
+        "population_vaccines": param.POPULATION_VACCINES_VAL,
+        "ts_years": param.TS_YEARS_INTERNAL_DASH,
+    },
+
+    # Creates internal dashboard data at national (England) level
+    "create_dashboard_data_internal_england": {
+        "function": "create_output_dashboard_data",
+        "output_type": "National",
+        "org_type": "LA",
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": None,
+        "filter_condition": "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)",
+        "population_vaccines": param.POPULATION_VACCINES_VAL,
+        "ts_years": param.TS_YEARS_INTERNAL_DASH,
+    },
+
+    # Creates internal dashboard data for other nations
+    "create_dashboard_data_internal_other_nations": {
+        "function": "create_output_dashboard_data",
+        "output_type": "Other nations",
+        "org_type": "NAT",
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": None,
+        "filter_condition": "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)",
+        "population_vaccines": param.POPULATION_VACCINES_VAL,
+        "ts_years": param.TS_YEARS_INTERNAL_DASH,
+    },
+
+    # Creates internal dashboard data for regions
+    "create_dashboard_data_internal_regions": {
+        "function": "create_output_dashboard_data",
+        "output_type": "Region",
+        "org_type": "LA",
+        "breakdowns": ["FinancialYear", "Parent_Org_Code",
+                       "Parent_Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Parent_Org_Code"],
+        "column_rename": {"Parent_Org_Code": "OrgCode",
+                          "Parent_Org_Name": "OrgName"},
+        "filter_condition": "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)",
+        "population_vaccines": param.POPULATION_VACCINES_VAL,
+        "ts_years": param.TS_YEARS_INTERNAL_DASH,
+    },
+
+    # Creates internal dashboard data for local authorities
+    "create_dashboard_data_internal_las": {
+        "function": "create_output_dashboard_data",
+        "output_type": "LA",
+        "org_type": "LA",
+        "breakdowns": ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"],
+        "sort_on": ["Vac_Type", "Org_Code"],
+        "column_rename": None,
+        "filter_condition": "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)",
+        "population_vaccines": param.POPULATION_VACCINES_VAL,
+        "ts_years": param.TS_YEARS_INTERNAL_DASH,
+    },
+}
+
+output_specs.register_specs(DASHBOARD_SPECS)
+
+
+# The content functions used in the output lists, which create each
+# output from its spec
 def create_dashboard_map_data(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear", "Parent_Org_Code", "Org_Code", "Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code", "Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = {"FinancialYear": "CollectionYearRange"}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = ("Vac_Type in ['DTaP_IPV_Hib_HepB_12m', 'MMR_24m']")
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition,
-                                  row_subgroup, column_subgroup,
-                                  count_multiplier, ts_years)
-
-
-# Creates dashboard data at UK level
+    return output_specs.run("create_dashboard_map_data", df)
+
+
 def create_dashboard_data_uk(df):
-    output_type = "UK"
-    org_type = None
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = {"FinancialYear": "Year", "Org_Code": "OrgCode",
-                     "Org_Name": "OrgName", "Org_Level": "OrgType",
-                     "Vac_Type": "VacCode"}
-    filter_condition = "Vac_Type not in (@param.SELECTIVE_VACCS)"
-    population_vaccines = param.POPULATION_VACCINES
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines)
-
-
-# Creates dashboard data at national (England) level
+    return output_specs.run("create_dashboard_data_uk", df)
+
+
 def create_dashboard_data_england(df):
-    output_type = "National"
-    org_type = "LA"
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = {"FinancialYear": "Year", "Org_Code": "OrgCode",
-                     "Org_Name": "OrgName", "Org_Level": "OrgType",
-                     "Vac_Type": "VacCode"}
-    filter_condition = "Vac_Type not in (@param.SELECTIVE_VACCS)"
-    population_vaccines = param.POPULATION_VACCINES
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines)
-
-
-# Creates dashboard data for other nations
+    return output_specs.run("create_dashboard_data_england", df)
+
+
 def create_dashboard_data_other_nations(df):
-    output_type = "Other nations"
-    org_type = "NAT"
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = {"FinancialYear": "Year", "Org_Code": "OrgCode",
-                     "Org_Name": "OrgName", "Org_Level": "OrgType",
-                     "Vac_Type": "VacCode"}
-    filter_condition = "Vac_Type not in (@param.SELECTIVE_VACCS)"
-    population_vaccines = param.POPULATION_VACCINES
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines)
-
-
-# Creates dashboard data for regions
+    return output_specs.run("create_dashboard_data_other_nations", df)
+
+
 def create_dashboard_data_regions(df):
-    output_type = "Region"
-    org_type = "LA"
-    breakdowns = ["FinancialYear", "Parent_Org_Code",
-                  "Parent_Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Parent_Org_Code"]
-    column_rename = {"FinancialYear": "Year", "Parent_Org_Code": "OrgCode",
-                     "Parent_Org_Name": "OrgName", "Org_Level": "OrgType",
-                     "Vac_Type": "VacCode"}
-    filter_condition = "Vac_Type not in (@param.SELECTIVE_VACCS)"
-    population_vaccines = param.POPULATION_VACCINES
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines)
-
-
-# Creates dashboard data for local authorities
+    return output_specs.run("create_dashboard_data_regions", df)
+
+
 def create_dashboard_data_las(df):
-    output_type = "LA"
-    org_type = "LA"
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = {"FinancialYear": "Year", "Org_Code": "OrgCode",
-                     "Org_Name": "OrgName", "Org_Level": "OrgType",
-                     "Vac_Type": "VacCode"}
-    filter_condition = "Vac_Type not in (@param.SELECTIVE_VACCS)"
-    population_vaccines = param.POPULATION_VACCINES
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines)
-
-
-# Creates internal dashboard data at UK level
-def create_dashboard_data_internal_uk(df):
-    output_type = "UK"
-    org_type = None
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = None
-    filter_condition = "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)"
-    population_vaccines = param.POPULATION_VACCINES_VAL
-    ts_years = param.TS_YEARS_INTERNAL_DASH
+    return output_specs.run("create_dashboard_data_las", df)
 
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines, ts_years)
 
+def create_dashboard_data_internal_uk(df):
+    return output_specs.run("create_dashboard_data_internal_uk", df)
 
-# Creates internal dashboard data at national (England) level
-def create_dashboard_data_internal_england(df):
-    output_type = "National"
-    org_type = "LA"
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = None
-    filter_condition = "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)"
-    population_vaccines = param.POPULATION_VACCINES_VAL
-    ts_years = param.TS_YEARS_INTERNAL_DASH
 
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines, ts_years)
+def create_dashboard_data_internal_england(df):
+    return output_specs.run("create_dashboard_data_internal_england", df)
 
 
-# Creates internal dashboard data for other nations
 def create_dashboard_data_internal_other_nations(df):
-    output_type = "Other nations"
-    org_type = "NAT"
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = None
-    filter_condition = "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)"
-    population_vaccines = param.POPULATION_VACCINES_VAL
-    ts_years = param.TS_YEARS_INTERNAL_DASH
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines, ts_years)
+    return output_specs.run("create_dashboard_data_internal_other_nations", df)
 
 
-# Creates internal dashboard data for regions
 def create_dashboard_data_internal_regions(df):
-    output_type = "Region"
-    org_type = "LA"
-    breakdowns = ["FinancialYear", "Parent_Org_Code",
-                  "Parent_Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Parent_Org_Code"]
-    column_rename = {"Parent_Org_Code": "OrgCode",
-                     "Parent_Org_Name": "OrgName"}
-    filter_condition = "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)"
-    population_vaccines = param.POPULATION_VACCINES_VAL
-    ts_years = param.TS_YEARS_INTERNAL_DASH
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines, ts_years)
-
-
-# Creates internal dashboard data for local authorities
+    return output_specs.run("create_dashboard_data_internal_regions", df)
+
+
 def create_dashboard_data_internal_las(df):
-    output_type = "LA"
-    org_type = "LA"
-    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level", "Vac_Type"]
-    sort_on = ["Vac_Type", "Org_Code"]
-    column_rename = None
-    filter_condition = "Vac_Type not in (@param.EXCLUDE_VACCS_VAL)"
-    population_vaccines = param.POPULATION_VACCINES_VAL
-    ts_years = param.TS_YEARS_INTERNAL_DASH
-
-    return create_output_dashboard_data(df, output_type, org_type, breakdowns,
-                                        sort_on, column_rename,
-                                        filter_condition, population_vaccines, ts_years)
+    return output_specs.run("create_dashboard_data_internal_las", df)
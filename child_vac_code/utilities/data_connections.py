@@ -1,34 +1,469 @@
 """
 Purpose of script: handles reading data in from sql.
+
+The database the data is read from is set by DATA_BACKEND (parameters.py):
+    "mssql": the NHSD SQL Server databases (the default)
+    "sqlite": local SQLite files in SQLITE_DIR (one file per database) that
+        stand in for the SQL Server databases, so that the pipeline can be run
+        without access to the server. These can be seeded from fixture data
+        with seed_sqlite_database.
+The same sql templates (sql_code folder) are run against either backend.
 """
-import pyodbc
+import functools
+import hashlib
+import re
 import sqlalchemy as sa
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
+import threading
+import timeit
+from pathlib import Path
+import child_vac_code.parameters as param
+from child_vac_code.utilities import helpers
 
 logger = logging.getLogger(__name__)
 
+# Registry of engines created during the run, keyed by the connection url, so
+# that each database is connected to once and its connections are pooled.
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+class MSSQLBackend:
+    """
+    Connects to the NHSD SQL Server databases with the mssql and pyodbc
+    packages.
+    """
+    name = "mssql"
+
+    def engine_url(self, server, database):
+        return f"mssql+pyodbc://{server}/{database}?driver=SQL+Server"
+
+    def engine_kwargs(self):
+        return {"fast_executemany": True,
+                "pool_size": param.SQL_POOL_SIZE,
+                "max_overflow": param.SQL_POOL_MAX_OVERFLOW,
+                "pool_pre_ping": True}
+
+    def prepare_query(self, query):
+        return query
+
+    def on_connect(self, dbapi_connection, connection_record):
+        pass
+
+
+class SQLiteBackend:
+    """
+    Connects to local SQLite files that stand in for the SQL Server databases.
+    Each database is a file named <database>.db in SQLITE_DIR (parameters.py),
+    and the server name is ignored.
+
+    Queries are written for SQL Server, so fully qualified table names
+    ([Database].[dbo].[Table]) are replaced with the table name before
+    running. SQLite accepts the other SQL Server syntax used in the templates
+    (square bracketed names, LIKE, IN and IS NULL conditions, and window
+    functions). Stand-ins for the SQL Server BINARY_CHECKSUM and CHECKSUM_AGG
+    functions are added to each connection.
+    """
+    name = "sqlite"
+
+    # Matches [Database].[dbo].[Table] and captures the table name
+    _QUALIFIED_TABLE = re.compile(r"\[[^\]]+\]\.\[[^\]]+\]\.(\[[^\]]+\])")
+
+    def __init__(self, sqlite_dir=None):
+        self.sqlite_dir = sqlite_dir
+
+    def database_path(self, database):
+        sqlite_dir = self.sqlite_dir
+        if sqlite_dir is None:
+            sqlite_dir = param.SQLITE_DIR
+        return Path(sqlite_dir) / f"{database}.db"
+
+    def engine_url(self, server, database):
+        return f"sqlite:///{self.database_path(database)}"
+
+    def engine_kwargs(self):
+        # SQLite file connections are not pooled
+        return {}
+
+    def prepare_query(self, query):
+        return self._QUALIFIED_TABLE.sub(r"\1", query)
+
+    def on_connect(self, dbapi_connection, connection_record):
+        dbapi_connection.create_function("BINARY_CHECKSUM", -1,
+                                         _binary_checksum, deterministic=True)
+        dbapi_connection.create_aggregate("CHECKSUM_AGG", 1, _ChecksumAgg)
+
+
+def _binary_checksum(*values):
+    """
+    Stand-in for the SQL Server BINARY_CHECKSUM function: a 32 bit signed
+    checksum of the values.
+    """
+    digest = hashlib.sha256(repr(values).encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "little", signed=True)
+
+
+class _ChecksumAgg:
+    """
+    Stand-in for the SQL Server CHECKSUM_AGG aggregate function: combines the
+    checksums of a group with exclusive or.
+    """
+    def __init__(self):
+        self.checksum = 0
+
+    def step(self, value):
+        if value is not None:
+            self.checksum ^= value
+
+    def finalize(self):
+        return self.checksum
+
+
+BACKENDS = {backend.name: backend for backend in [MSSQLBackend, SQLiteBackend]}
+
+
+def get_backend(name=None):
+    """
+    Returns the data backend with the given name.
+
+    Parameters
+    ----------
+    name: str, optional
+        "mssql" or "sqlite". Default is DATA_BACKEND (parameters.py)
+
+    Returns
+    -------
+    MSSQLBackend or SQLiteBackend
+    """
+    if name is None:
+        name = param.DATA_BACKEND
+
+    helpers.validate_value_with_list("DATA_BACKEND", name, list(BACKENDS))
+
+    return BACKENDS[name]()
+
+
+def get_engine(server, database, backend=None):
+    """
+    Returns the pooled sqlalchemy engine for the server and database, creating
+    it on first use. For the mssql backend the pool size is bounded by the
+    SQL_POOL_SIZE and SQL_POOL_MAX_OVERFLOW settings in parameters.py.
+
+    Parameters
+    ----------
+    server: str
+        server name
+    database: str
+        database name
+    backend: MSSQLBackend or SQLiteBackend, optional
+        Default is the DATA_BACKEND backend (parameters.py)
+
+    Returns
+    -------
+    sqlalchemy.engine.Engine
+    """
+    if backend is None:
+        backend = get_backend()
+
+    url = backend.engine_url(server, database)
+
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(url)
+        if engine is None:
+            logger.info(f"Creating connection pool for {backend.name} "
+                        f"database {database}")
+            engine = sa.create_engine(url, **backend.engine_kwargs())
+            sa.event.listen(engine, "connect", backend.on_connect)
+            _ENGINES[url] = engine
+
+    return engine
+
+
+def dispose_engines():
+    """
+    Closes all pooled connections and empties the engine registry.
+    Should be called once all data has been imported at the end of a run.
+    """
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            logger.info("Closing connection pool for SQL database "
+                        f"{engine.url.database}")
+            engine.dispose()
+        _ENGINES.clear()
 
-def df_from_sql(query, server, database) -> pd.DataFrame:
+
+def df_from_sql(query, server, database, chunksize=None,
+                column_types=None, fetch=None,
+                arrow_dtypes=None, params=None) -> pd.DataFrame:
     """
-    Use sqlalchemy to connect to the NHSD server and database with the help
-    of mssql and pyodbc packages
+    Use sqlalchemy to connect to the server and database of the DATA_BACKEND
+    backend (parameters.py) - by default the NHSD server with the help of
+    mssql and pyodbc packages. Connections are checked out from the pooled
+    engine for the server/database (see get_engine).
+
+    If a chunksize is given the query results are streamed in chunks of that
+    many rows. Each chunk is cast to the column_types schema as it arrives, so
+    only the compact version of the data is held in memory.
+
+    The results are fetched either with pandas read_sql_query (fetch="pandas")
+    or directly into pyarrow record batches (fetch="arrow", see
+    read_sql_arrow), which avoids building the dataframe through Python
+    objects and is faster for large extracts.
+
+    Values can be passed separately from the query text as bound parameters
+    (e.g. a query rendered by sql_templates.render_template). Lists are passed
+    as expanding parameters for use in IN conditions.
 
     Inputs:
         server: server name
         database: database name
         query: string containing a sql query
+        params: dictionary of bind parameter names and values (optional)
+            e.g. {"YearRange": ["01APR2021", "01APR2022"]}
+        chunksize: number of rows to read at a time (optional)
+        column_types: dictionary of column names and the data types they are
+            cast to e.g. {"Vac_Type": "category"} (optional)
+        fetch: "pandas" or "arrow". Default is SQL_FETCH (parameters.py)
+        arrow_dtypes: if True (and fetch is "arrow") the dataframe columns use
+            Arrow-backed data types. Default is SQL_ARROW_DTYPES
+            (parameters.py)
 
     Output:
         pandas Dataframe
     """
-    conn = sa.create_engine(
-        f"mssql+pyodbc://{server}/{database}?driver=SQL+Server", fast_executemany=True)
-    conn.execution_options(autocommit=True)
+    if fetch is None:
+        fetch = param.SQL_FETCH
+    if arrow_dtypes is None:
+        arrow_dtypes = param.SQL_ARROW_DTYPES
+    helpers.validate_value_with_list("fetch", fetch, ["pandas", "arrow"])
+
+    backend = get_backend()
+    engine = get_engine(server, database, backend)
+    query = backend.prepare_query(query)
     logger.info(f"Getting dataframe from SQL database {database}")
     logger.info(f"Running query:\n\n {query}")
-    df = pd.read_sql_query(query, conn)
+    if params is not None:
+        logger.info(f"With parameters: {params}")
+        query = get_statement(query, tuple(sorted(
+            name for name, value in params.items()
+            if isinstance(value, (list, tuple)))))
+
+    # Time the connection checkout, which includes the connect/auth handshake
+    # when no pooled connection is available
+    start_time = timeit.default_timer()
+    with engine.connect() as conn:
+        checkout_time = timeit.default_timer() - start_time
+        logger.info(f"Connection checkout from {database} pool took "
+                    f"{checkout_time:.3f} seconds")
+
+        if fetch == "arrow":
+            df = read_sql_arrow(query, conn,
+                                batch_size=chunksize or param.SQL_FETCH_BATCH_SIZE,
+                                column_types=column_types,
+                                arrow_dtypes=arrow_dtypes, params=params)
+        elif chunksize is None:
+            df = pd.read_sql_query(query, conn, params=params)
+            if column_types is not None:
+                df = helpers.apply_column_types(df, column_types)
+        else:
+            chunks = []
+            for chunk in pd.read_sql_query(query, conn, params=params,
+                                           chunksize=chunksize):
+                if column_types is not None:
+                    chunk = helpers.apply_column_types(chunk, column_types)
+                chunks.append(chunk)
+            logger.info(f"Read {len(chunks)} chunks of up to {chunksize} rows")
+            df = helpers.concat_categorical(chunks)
+
     return df
 
-    print("This message shows that you have successfully imported \
-the get_df_from_sql() function from the data connections module")
+
+@functools.lru_cache(maxsize=256)
+def get_statement(query, expanding_params=()):
+    """
+    Returns the sqlalchemy statement for a query with bind parameters.
+    Statements are cached for the run so each query is only compiled once.
+
+    Parameters
+    ----------
+    query : str
+        Query text with bind parameters e.g. "WHERE [Org_Code] = :OrgCode"
+    expanding_params : tuple(str)
+        Names of the parameters that are passed lists of values
+
+    Returns
+    -------
+    sqlalchemy.sql.expression.TextClause
+    """
+    return sa.text(query).bindparams(
+        *[sa.bindparam(name, expanding=True) for name in expanding_params])
+
+
+def read_sql_arrow(query, conn, batch_size=100000, column_types=None,
+                   arrow_dtypes=False, params=None):
+    """
+    Runs a sql query and fetches the results in batches with the cursor
+    fetchmany, building a pyarrow table from each batch. The table is cast to
+    the column_types schema and only converted to pandas at the end.
+
+    As with pandas read_sql_query, decimal columns are returned as floats.
+    Columns cast to "category" are dictionary encoded (and become pandas
+    categoricals), and integer columns follow the same rules as
+    helpers.apply_column_types.
+
+    Parameters
+    ----------
+    query : str or sqlalchemy.sql.expression.TextClause
+        The sql query (a statement if it has bind parameters)
+    conn : sqlalchemy.engine.Connection
+    batch_size : int
+        Number of rows to fetch at a time
+    column_types : dict(str, str), optional
+        Data types the columns are cast to e.g. {"Vac_Type": "category"}
+    arrow_dtypes : bool
+        If True the dataframe columns (other than categories) use Arrow-backed
+        pandas data types rather than numpy ones
+    params : dict, optional
+        Bind parameter values for the query
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    if params is None:
+        result = conn.exec_driver_sql(query)
+    else:
+        result = conn.execute(query, params)
+    columns = list(result.keys())
+
+    # Build an arrow table from each batch of rows
+    tables = []
+    while True:
+        rows = result.fetchmany(batch_size)
+        if len(rows) == 0:
+            break
+        arrays = [to_arrow_array(values) for values in zip(*rows)]
+        tables.append(pa.Table.from_arrays(arrays, names=columns))
+
+    logger.info(f"Fetched {sum(len(table) for table in tables)} rows in "
+                f"{len(tables)} batches of up to {batch_size} rows")
+
+    if len(tables) == 0:
+        table = pa.table({column: pa.array([], pa.null()) for column in columns})
+    else:
+        # Columns that are all null in a batch are promoted to the type of
+        # the other batches
+        table = pa.concat_tables(tables, promote=True)
+
+    if column_types is not None:
+        table = apply_arrow_column_types(table, column_types, arrow_dtypes)
+
+    # Convert to pandas
+    if arrow_dtypes:
+        return table.to_pandas(types_mapper=lambda arrow_type: (
+            None if pa.types.is_dictionary(arrow_type)
+            else pd.ArrowDtype(arrow_type)))
+
+    return table.to_pandas()
+
+
+def to_arrow_array(values):
+    """
+    Converts a sequence of values fetched from sql to a pyarrow array, with
+    decimals converted to float64.
+    """
+    array = pa.array(values)
+    if pa.types.is_decimal(array.type):
+        array = array.cast(pa.float64())
+
+    return array
+
+
+def apply_arrow_column_types(table, column_types, arrow_dtypes=False):
+    """
+    Casts pyarrow table columns to the data types declared in a column schema.
+    Columns in the schema that are not in the table are ignored.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    column_types : dict(str, str)
+        Contains the column names and the data type they should be cast to
+        e.g. {"Vac_Type": "category", "Number_Population": "int32"}
+    arrow_dtypes : bool
+        If False, integer columns that contain nulls are cast to float64 (with
+        a warning) as they will be converted to numpy types
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    for column, dtype in column_types.items():
+        if column not in table.column_names:
+            continue
+
+        index = table.column_names.index(column)
+        values = table.column(index)
+
+        if dtype == "category":
+            values = pc.dictionary_encode(values)
+
+        elif pd.api.types.is_integer_dtype(np.dtype(dtype)):
+            if values.null_count > 0 and not arrow_dtypes:
+                logger.warning(f"Column {column} contains nulls so has been "
+                               f"cast to float64 instead of {dtype}")
+                values = values.cast(pa.float64())
+            else:
+                # Use int64 if the values don't fit in the declared type
+                try:
+                    values = values.cast(pa.from_numpy_dtype(np.dtype(dtype)))
+                except pa.ArrowInvalid:
+                    values = values.cast(pa.int64())
+
+        else:
+            values = values.cast(pa.from_numpy_dtype(np.dtype(dtype)))
+
+        table = table.set_column(index, column, values)
+
+    return table.unify_dictionaries()
+
+
+def seed_sqlite_database(database, tables, sqlite_dir=None):
+    """
+    Creates (or replaces) tables in the local SQLite stand-in for a database,
+    so that the pipeline can be run with DATA_BACKEND = "sqlite".
+
+    Parameters
+    ----------
+    database: str
+        database name e.g. param.DATABASE
+    tables: dict(str, pandas.DataFrame or path)
+        Contains the table names and the data to load into each, as a
+        dataframe or the path of a csv fixture file
+        e.g. {param.TABLE: "fixtures/asset.csv"}
+    sqlite_dir: path, optional
+        Folder containing the SQLite files. Default is SQLITE_DIR
+        (parameters.py)
+
+    Returns
+    -------
+    None
+    """
+    backend = SQLiteBackend(sqlite_dir)
+    path = backend.database_path(database)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    engine = sa.create_engine(backend.engine_url(None, database))
+    try:
+        for table, data in tables.items():
+            if not isinstance(data, pd.DataFrame):
+                data = pd.read_csv(data)
+            logger.info(f"Seeding {table} in SQLite database {path.name} "
+                        f"with {len(data)} rows")
+            data.to_sql(table, engine, if_exists="replace", index=False)
+    finally:
+        engine.dispose()
@@ -8,6 +8,7 @@ import math
 import datetime
 from itertools import chain, combinations
 from decimal import Decimal, ROUND_HALF_UP, getcontext
+import child_vac_code.parameters as param
 
 
 def create_folder(directory):
@@ -630,19 +631,24 @@ def suppress_column(column_to_suppress,
     return suppression
 
 
-def add_organisation_type(df, org_code_column,
+def add_organisation_type(df, org_code_column, org_type_prefixes=None,
                           include_level=True, missing_value="None"):
     """
     Adds a new organisation type and level columns to a dataframe
     based on the entity codes in the organisation reference data.
-    This should include all organisation types that are processed by the
-    pipeline. Add more as required.
+    The entity code (first 3 characters of the organisation code) is looked
+    up once for each distinct code, so this is quick for large inputs such as
+    LSOA level data.
 
     Parameters
     ----------
     df : pandas.DataFrame
     org_code_column: str
         Name of the column that contains the organisation codes
+    org_type_prefixes: dict(str, tuple(str, str))
+        The organisation type and level for each entity code
+        e.g. {"E06": ("LA", "Local")}.
+        Set to ORG_TYPE_PREFIXES (parameters.py) by default.
     include_level: bool
         Determines if the 'Org_Level' column will be added.
         Set to True by default.
@@ -655,32 +661,29 @@ def add_organisation_type(df, org_code_column,
     df_population : pandas.DataFrame
 
     """
+    if org_type_prefixes is None:
+        org_type_prefixes = param.ORG_TYPE_PREFIXES
+
     # Set the names of the new columns
     col_org_type = "Org_Type"
     col_org_level = "Org_Level"
 
-    # Set the new columns as the default missing value
-    df[col_org_type] = missing_value
-    df[col_org_level] = missing_value
+    # Extract the entity code of each organisation, numbering the distinct
+    # entity codes (missing codes are numbered -1)
+    prefix_index, prefixes = pd.factorize(df[org_code_column].str[:3])
+
+    # Look up the type and level of each distinct entity code, with the
+    # missing value last for codes that are missing or not in the lookup
+    missing = (missing_value, missing_value)
+    lookup = [org_type_prefixes.get(prefix, missing) for prefix in prefixes]
+    lookup.append(missing)
+    org_types = np.array([org_type for org_type, _ in lookup], dtype=object)
+    org_levels = np.array([org_level for _, org_level in lookup], dtype=object)
 
     # Set the Org Type
-    df.loc[df[org_code_column].str.startswith(("E01")),
-           [col_org_type, col_org_level]] = ["LSOA", "LSOA"]
-    df.loc[df[org_code_column].str.startswith(("E06", "E07", "E08", "E09", "E10")),
-           [col_org_type, col_org_level]] = ["LA", "Local"]
-    df.loc[df[org_code_column].str.startswith(("E12")),
-           [col_org_type, col_org_level]] = ["LA_parent", "Regional"]
-    df.loc[df[org_code_column].str.startswith(("E38")),
-           [col_org_type, col_org_level]] = ["CCG", "Local"]
-    df.loc[df[org_code_column].str.startswith(("E54")),
-           [col_org_type, col_org_level]] = ["ICB", "Local"]
-    df.loc[df[org_code_column].str.startswith(("E40")),
-           [col_org_type, col_org_level]] = ["ICB_parent", "Regional"]
-    df.loc[df[org_code_column].str.startswith(("E92")),
-           [col_org_type, col_org_level]] = ["National", "National"]
-
-    if not include_level:
-        df = df.drop(columns=[col_org_level])
+    df[col_org_type] = org_types[prefix_index]
+    if include_level:
+        df[col_org_level] = org_levels[prefix_index]
 
     return df
 
@@ -712,36 +715,40 @@ def round_half_up(argument, decimals=0):
     on >=5, and down on <5. E.g. (1.5, 0) = 2, (2.44, 1) = 2.4. Will round negative
     numbers away from 0. E.g. (-0.5, 0) = -1, (-1.234, 2) == -1.23.
 
-    A guide to using the Decimal module can be found here:
+    The number is rounded as it is displayed (e.g. 2.675 is rounded to 2.68,
+    although the nearest float is slightly less than 2.675), as with the
+    Decimal module. A guide to using the Decimal module can be found here:
     https://docs.python.org/3/library/decimal.html
 
+    A pandas Series is rounded with round_half_up_array. Infinite and null
+    values are returned unchanged.
+
     Parameters
     ----------
-    n : float
+    n : float or pandas.Series
         Number to be rounded
     decimals : integer, optional
         Number of decimal places to round to. The default is 0.
 
     Returns
     -------
-    float
+    float or pandas.Series
 
     """
+    # Round the column elements together
+    if isinstance(argument, pd.Series):
+        return pd.Series(round_half_up_array(argument.to_numpy(dtype=float),
+                                             decimals),
+                         index=argument.index, name=argument.name)
+
+    if np.isinf(argument):
+        return float(argument)
 
     # Set the context for rounding, the precision, and the method of rounding
     context = getcontext().copy()
     context.prec = decimals + 10
     context.rounding = ROUND_HALF_UP
 
-    # Recursively applies the function to the column elements
-    if isinstance(argument, pd.Series):
-        df_rounded = argument.apply(
-            lambda x: argument.inf
-            if x == np.inf
-            else round_half_up(x, decimals)
-        )
-        return df_rounded
-
     # Creates a Decimal object from the given number n, with the given
     # number of decimal places. The quantize method rounds to the nearest
     # integer, using the 'ROUND_HALF_UP' method
@@ -751,6 +758,71 @@ def round_half_up(argument, decimals=0):
     return n_rounded
 
 
+def round_half_up_array(values, decimals=0):
+    """
+    Rounds an array of numbers half up (away from 0) to a given number of
+    decimal places, giving the same results as round_half_up does for each
+    number but without creating a Decimal for each one.
+
+    The numbers are scaled by 10 ** decimals and rounded to the nearest
+    integer. Where the scaled number is too close to a half for the float
+    arithmetic to be relied on, it is checked whether the number is exactly
+    a half as displayed (e.g. 2.675 to 2 decimal places), which is rounded
+    away from 0. Any other number that close to a half (or too large to
+    scale exactly) is rounded with round_half_up.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Array of floats
+    decimals : integer, optional
+        Number of decimal places to round to. The default is 0.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    decimals = int(decimals)
+    values = np.asarray(values, dtype=float)
+    magnitudes = np.abs(values)
+    finite = np.isfinite(values)
+
+    # Round the scaled magnitudes to the nearest integer
+    scaled = magnitudes * 10.0 ** decimals
+    integers = np.floor(scaled)
+    with np.errstate(invalid="ignore"):
+        fractions = scaled - integers
+    rounded = integers + (fractions >= 0.5)
+
+    # Find the scaled magnitudes within the float error of a half, or too
+    # large to scale exactly. The tolerance also allows for round_half_up
+    # first rounding to decimals + 10 significant figures.
+    tolerance = 10.0 ** (-9 - decimals) * np.maximum(scaled, 1)
+    uncertain = finite & ((np.abs(fractions - 0.5) <= tolerance)
+                          | (scaled >= 2 ** 52))
+
+    # Round exact halves away from 0. A number is an exact half if it is
+    # displayed with a 5 in the next decimal place and nothing after it.
+    if uncertain.any():
+        next_place = np.rint(magnitudes[uncertain] * 10.0 ** (decimals + 1))
+        exact_half = ((next_place / 10.0 ** (decimals + 1)
+                       == magnitudes[uncertain])
+                      & (next_place % 10 == 5) & (next_place < 2 ** 52))
+        uncertain_rows = np.flatnonzero(uncertain)
+        rounded[uncertain_rows[exact_half]] = (next_place[exact_half] + 5) // 10
+        uncertain[uncertain_rows[exact_half]] = False
+
+    # Restore the decimal places and the sign
+    result = np.copysign(rounded / 10.0 ** decimals, values)
+    result[~finite] = values[~finite]
+
+    # Use the Decimal rounding for any remaining numbers
+    for row in np.flatnonzero(uncertain):
+        result[row] = round_half_up(values[row], decimals)
+
+    return result
+
+
 def fyearstart_to_fyear(year_start):
     '''
     From a financial year start date (ddmmmyyyy) creates financial year (yyyy-yy)
@@ -775,6 +847,68 @@ def fyearstart_to_fyear(year_start):
     return fyear
 
 
+def fyear_to_fyearstart(fyear):
+    '''
+    From a financial year (yyyy-yy) creates the financial year start date
+    (ddmmmyyyy)
+
+    Parameters
+    ----------
+    fyear : str
+        Financial year in format yyyy-yy (e.g. '2021-22')
+
+    Returns
+    -------
+    year_start : str
+        Financial year start date in format ddmmmyyyy (e.g. '01APR2021')
+    '''
+    return "01APR" + fyear[:4]
+
+
+def convert_year_format(years, to_format):
+    """
+    Converts year strings between the financial year start (ddmmmyyyy) and
+    financial year (yyyy-yy) formats. Each distinct year is only converted
+    once and the results are mapped back to all values, so this is fast for
+    long columns with only a few distinct years.
+
+    Parameters
+    ----------
+    years : pandas.Series or list[str]
+        Years to convert. Categorical series keep their categorical type.
+    to_format : str
+        Format to convert to. Allowed values:
+            "fyear" (financial year start to YYYY-YY format e.g. 2022-23)
+            "fyear_start" (financial year to DDMMMYYYY format e.g. 01APR2022)
+
+    Returns
+    -------
+    pandas.Series or list[str] (matching the input)
+        Converted years, with nulls kept as nulls
+    """
+    validate_value_with_list("convert_year_format to_format", to_format,
+                             ["fyear", "fyear_start"])
+    if to_format == "fyear":
+        convert = fyearstart_to_fyear
+    else:
+        convert = fyear_to_fyearstart
+
+    if isinstance(years, list):
+        return [convert(year) for year in years]
+
+    if isinstance(years.dtype, pd.CategoricalDtype):
+        return years.cat.rename_categories(
+            [convert(year) for year in years.cat.categories])
+
+    # Convert the distinct years, and map back using the position of each
+    # value in the distinct years (-1 for nulls, which maps to the final null)
+    codes, uniques = pd.factorize(years)
+    converted = np.array([convert(year) for year in uniques] + [np.nan],
+                         dtype=object)
+
+    return pd.Series(converted[codes], index=years.index, name=years.name)
+
+
 def expected_column_check(df, input_name, expected_cols):
     """
     Checks whether a dataframe contains the expected columns specified, and raises an
@@ -917,8 +1051,6 @@ def get_year_range_fy(end_year: str, year_span: int):
         get_year_range("2020-21",2)
         returns -> ["2020-21","2019-20"]
 
-    NOTE - can only correctly create ranges containing years from 2000-01 onwards
-
     Parameters
     ----------
     end_year: str
@@ -931,27 +1063,11 @@ def get_year_range_fy(end_year: str, year_span: int):
     list[str] : list of years
 
     """
-    # Create empty list to populate with years in range
-    year_range = []
+    # Create the range of financial year starts and convert to financial years
+    # (ordered so oldest year first)
+    year_range = get_year_range(fyear_to_fyearstart(end_year), year_span)
 
-    # Create range of year numbers based on year_span e.g. 3 = 0, 1, 2
-    # Loop through each year number
-    for n_year in range(year_span):
-        # Create financial year start and end values based on the
-        # year number and the end_year
-        year_start = str(int(end_year[0:4])-(n_year))
-        year_end = str(int(end_year[5:7])-(n_year))
-
-        # If year_end is less than 2 digits, add a 0 at the start
-        if len(year_end) < 2:
-            year_end = year_end.zfill(2)
-
-        # Create new year and append to list
-        year = year_start + "-" + year_end
-        year_range.append(year)
-
-    # Return list of years, ordered so oldest year first
-    return year_range[::-1]
+    return convert_year_format(year_range, "fyear")
 
 
 def flag_outliers_percentiles(df, col_to_check, percentile_lower,
@@ -1159,3 +1275,150 @@ def flag_values_outsidelimits(df, col_to_check, lower_limit, upper_limit,
                (df[col_to_check] > upper_limit), "BreachFlag"] = "Y"
 
     return df
+
+
+def apply_column_types(df, column_types):
+    """
+    Casts dataframe columns to the data types declared in a column schema.
+    Columns in the schema that are not in the dataframe are ignored.
+
+    Integer columns are cast to the declared type where all values fit in it,
+    otherwise int64 is used. Integer columns that contain nulls are cast to
+    float64 (with a warning) as they can't be held in a numpy integer type.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    column_types : dict(str, str)
+        Contains the column names and the data type they should be cast to
+        e.g. {"Vac_Type": "category", "Number_Population": "int32"}
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        With columns cast to the declared data types
+    """
+    for column, dtype in column_types.items():
+        if column not in df.columns:
+            continue
+
+        if dtype == "category":
+            df[column] = df[column].astype("category")
+
+        elif pd.api.types.is_integer_dtype(np.dtype(dtype)):
+            if df[column].isnull().any():
+                logging.warning(f"Column {column} contains nulls so has been "
+                                f"cast to float64 instead of {dtype}")
+                df[column] = df[column].astype("float64")
+            else:
+                # Use int64 if the values don't fit in the declared type
+                dtype_limits = np.iinfo(np.dtype(dtype))
+                if ((df[column].min() < dtype_limits.min) or
+                        (df[column].max() > dtype_limits.max)):
+                    dtype = "int64"
+                df[column] = df[column].astype(dtype)
+
+        else:
+            df[column] = df[column].astype(dtype)
+
+    return df
+
+
+def stack_column_groups(df, id_columns, column_groups, labels):
+    """
+    Reshapes a wide dataframe into a long one, by stacking groups of columns
+    (e.g. the counts for each age band) into rows. Each row of the output has
+    the id columns of a row of df, the values of one group of columns under
+    common names, and labels identifying the group.
+
+    The rows for each group are output in turn, in the order of
+    column_groups. Each output column is built in a single pass.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    id_columns : list[str]
+        Columns repeated for each group
+    column_groups : list[dict(str, str)]
+        For each group, the output column name for each of its columns in df
+        e.g. [{"Number_Population": "2y population"},
+              {"Number_Population": "3y population"}]
+    labels : dict(str, list)
+        Columns to add with a value for each group e.g.
+        {"Child_Age": ["24m", "3y"]}
+
+    Returns
+    -------
+    pandas.DataFrame
+        Containing the id columns, the output value columns and the label
+        columns
+    """
+    n_rows = len(df)
+    n_groups = len(column_groups)
+
+    # Repeat the id columns for each group
+    df_long = df[id_columns].take(np.tile(np.arange(n_rows), n_groups))
+    df_long.reset_index(drop=True, inplace=True)
+
+    # Stack the values of each group under the output column names
+    for column in column_groups[0]:
+        df_long[column] = np.concatenate(
+            [df[group[column]].to_numpy() for group in column_groups])
+
+    # Add the group labels
+    for column, values in labels.items():
+        df_long[column] = np.repeat(np.array(values, dtype=object), n_rows)
+
+    return df_long
+
+
+def concat_categorical(dfs):
+    """
+    Concatenates a list of dataframes, retaining categorical columns as
+    categorical. Pandas will convert a categorical column to object when the
+    categories differ between dataframes, so the categories for each column are
+    first combined across all of the dataframes.
+
+    Parameters
+    ----------
+    dfs : list[pandas.DataFrame]
+        Dataframes with the same columns
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    if len(dfs) == 0:
+        return pd.DataFrame()
+
+    # Set the same categories in each dataframe for each categorical column
+    # (on shallow copies so the input dataframes are not changed)
+    dfs = [df.copy(deep=False) for df in dfs]
+    categorical_cols = dfs[0].select_dtypes(include="category").columns
+    for column in categorical_cols:
+        categories = pd.api.types.union_categoricals(
+            [df[column] for df in dfs]).categories
+        for df in dfs:
+            df[column] = df[column].cat.set_categories(categories)
+
+    return pd.concat(dfs, ignore_index=True)
+
+
+def categorical_to_object(df):
+    """
+    Converts any categorical columns in a dataframe to object columns.
+    Used on aggregated data so that new values (e.g. subgroup names or
+    population labels) can be assigned to the group columns.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    df : pandas.DataFrame
+    """
+    for column in df.select_dtypes(include="category").columns:
+        df[column] = df[column].astype("object")
+
+    return df
@@ -1,23 +1,98 @@
+import json
 import logging
+import timeit
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 import child_vac_code.parameters as param
 import child_vac_code.utilities.data_connections as dbc
-from child_vac_code.utilities import helpers
+from child_vac_code.utilities import helpers, snapshots, sql_templates
 
 logger = logging.getLogger(__name__)
 
+# Watermark key of the raw data rows without an org code (see
+# import_raw_cover_delta)
+NULL_ORG_KEY = "<null>"
 
-def import_asset_data(year_range: list = [param.FYEAR_START]):
+
+def df_from_sql_snapshot(query, server, database, chunksize=None,
+                         column_types=None, params=None):
+    """
+    Gets the data for a sql query, using the local snapshot of the extract
+    where one exists and USE_SNAPSHOTS is True (parameters.py). Otherwise runs
+    the query with the df_from_sql function and saves the result as a snapshot.
+
+    Set REFRESH_SNAPSHOTS to True (parameters.py) to re-run the queries and
+    overwrite existing snapshots.
+
+    Parameters
+    ----------
+    query : str
+        The rendered sql query
+    server : str
+        server name
+    database : str
+        database name
+    chunksize : int, optional
+        Number of rows to read at a time (see df_from_sql)
+    column_types : dict(str, str), optional
+        Data types the columns are cast to (see df_from_sql)
+    params : dict, optional
+        Bind parameter values for the query (see df_from_sql)
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    if not param.USE_SNAPSHOTS:
+        return dbc.df_from_sql(query, server, database, chunksize=chunksize,
+                               column_types=column_types, params=params)
+
+    key = snapshots.snapshot_key(query, server, database, params, column_types,
+                                 param.DATA_BACKEND, param.SQL_FETCH,
+                                 param.SQL_ARROW_DTYPES)
+
+    if not param.REFRESH_SNAPSHOTS:
+        df = snapshots.read_snapshot(key)
+        if df is not None:
+            return df
+
+    df = dbc.df_from_sql(query, server, database, chunksize=chunksize,
+                         column_types=column_types, params=params)
+    snapshots.write_snapshot(key, df)
+
+    return df
+
+
+def import_asset_data(year_range: list = [param.FYEAR_START],
+                      chunksize=param.ASSET_CHUNKSIZE):
     """
     This function will import data filtered by a given year_range
     (based on financial year start dates) from the asset SQL database.
     Uses the df_from_sql function
 
+    If USE_ASSET_STORE is True (parameters.py), past years are read from the
+    local year-partitioned asset store and only years missing from the store
+    are imported from SQL (and then added to the store). The current reporting
+    year (FYEAR_START) is always imported from SQL. Years listed in
+    ASSET_STORE_INVALIDATE are removed from the store and re-imported.
+
+    If a chunksize is set the data is streamed from SQL in chunks, and each
+    chunk is cast to the compact data types in ASSET_COLUMN_TYPES
+    (parameters.py) as it arrives.
+
     Parameters
     ----------
     year_range: list
         The list of years to return
         defaults to returning FYEAR_START from parameters.py
+    chunksize: int
+        Number of rows to read from SQL at a time. If None the data is read
+        in one go with the default data types.
+        defaults to ASSET_CHUNKSIZE from parameters.py
 
     Returns
     -------
@@ -26,23 +101,82 @@ def import_asset_data(year_range: list = [param.FYEAR_START]):
     """
     logging.info("Importing childhood vaccinations data from the SQL asset")
 
+    if not param.USE_ASSET_STORE:
+        return import_asset_years(year_range, chunksize)
+
+    store_dir = param.ASSET_STORE_DIR
+
+    # Remove any years that need refreshing from the store
+    snapshots.invalidate_partitions(param.ASSET_STORE_INVALIDATE, store_dir)
+
+    # Read the past (sealed) years that are already in the store, with the
+    # same data types as data imported from SQL
+    sealed_years = [year for year in year_range if year != param.FYEAR_START]
+    df_stored = snapshots.read_partitions(sealed_years, store_dir)
+    for year, df_year in df_stored.items():
+        if chunksize is None:
+            df_stored[year] = helpers.categorical_to_object(df_year)
+        else:
+            df_stored[year] = helpers.apply_column_types(df_year,
+                                                         param.ASSET_COLUMN_TYPES)
+
+    # Import any years not in the store from SQL and add the sealed years to
+    # the store. Sealed years without any data (e.g. not yet loaded to the
+    # asset) aren't stored, so they are imported again on the next run.
+    missing_years = [year for year in year_range if year not in df_stored]
+    if len(missing_years) > 0:
+        df_missing = import_asset_years(missing_years, chunksize)
+        for year in missing_years:
+            df_year = df_missing[df_missing["FinancialYearStart"] == year]
+            if year in sealed_years:
+                if len(df_year) > 0:
+                    snapshots.write_partition(year, df_year, store_dir)
+                else:
+                    logging.warning(f"No asset data found for {year}, so it "
+                                    "hasn't been added to the asset store")
+            df_stored[year] = df_year
+
+    # Combine the years, oldest first
+    return helpers.concat_categorical([df_stored[year] for year in year_range])
+
+
+def import_asset_years(year_range, chunksize=None):
+    """
+    Imports the data for the years in year_range (based on financial year
+    start dates) from the asset SQL database. Used by import_asset_data.
+
+    Parameters
+    ----------
+    year_range: list
+        The list of years to return
+    chunksize: int
+        Number of rows to read from SQL at a time. If None the data is read
+        in one go with the default data types.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    """
+    logging.info(f"Importing {', '.join(year_range)} from the SQL asset")
+
     # Load our parameters
     server = param.SERVER
     database = param.DATABASE
     table = param.TABLE
 
-    sql_folder = r"child_vac_code\sql_code"
-    query_name = r"\query_asset.sql"
-
-    with open(sql_folder + r"/" + query_name, "r") as sql_file:
-        data = sql_file.read()
-
-    data = data.replace("<YearRange>", "','".join(year_range))
-    data = data.replace("<Database>", database)
-    data = data.replace("<Table>", table)
+    data = sql_templates.render_template("query_asset.sql",
+                                         {"Database": database,
+                                          "Table": table})
+    params = {"YearRange": list(year_range)}
 
     # Get SQL data
-    df = dbc.df_from_sql(data, server, database)
+    if chunksize is None:
+        df = df_from_sql_snapshot(data, server, database, params=params)
+    else:
+        df = df_from_sql_snapshot(data, server, database, chunksize=chunksize,
+                                  column_types=param.ASSET_COLUMN_TYPES,
+                                  params=params)
 
     return df
 
@@ -54,6 +188,13 @@ def import_org_ref_data(financial_year):
     and lower tier LA's, regions, ICBs and ICB regions)
     Uses the df_from_sql function
 
+    Where organisations have more than one valid version, only the most
+    recent version is returned (deduplicated in the sql query).
+
+    The data for each financial year is cached in ORG_REF_CACHE_DIR
+    (parameters.py) and reused by later runs (e.g. the publication and
+    validations pipelines) until it is older than ORG_REF_CACHE_TTL_HOURS.
+
     Parameters
     ----------
     financial_year: str
@@ -74,25 +215,31 @@ def import_org_ref_data(financial_year):
     # Extract required query parameters from financial year
     fy_start, fy_end = helpers.fyear_to_year_start_end(financial_year)
 
-    sql_folder = r"child_vac_code\sql_code"
-    query_name = r"\query_org_ref.sql"
-
-    with open(sql_folder + r"/" + query_name, "r") as sql_file:
-        data = sql_file.read()
-
-    # The parameters in the sql query file
-    # are replaced with our user defined parameters
-    data = data.replace("<Database>", database)
-    data = data.replace("<Table>", table)
-    data = data.replace("<FYStart>", str(fy_start))
-    data = data.replace("<FYEnd>", str(fy_end))
+    # The identifiers in the sql query file are replaced with our user
+    # defined parameters, and the dates are passed as query parameters
+    data = sql_templates.render_template("query_org_ref.sql",
+                                         {"Database": database,
+                                          "Table": table})
+    params = {"FYStart": str(fy_start), "FYEnd": str(fy_end)}
+
+    # Use the cached reference data for the financial year if it is recent
+    # enough. The cache file name includes a key for the query so that a
+    # change of source table isn't read from the cache.
+    cache_ttl = param.ORG_REF_CACHE_TTL_HOURS
+    key = snapshots.snapshot_key(data, server, database, params,
+                                 param.DATA_BACKEND)
+    cache_path = (Path(param.ORG_REF_CACHE_DIR) /
+                  f"org_ref_{financial_year}_{key[:12]}.ft")
+    if cache_ttl:
+        df = snapshots.read_cache_file(cache_path, cache_ttl)
+        if df is not None:
+            return df
 
     # Get SQL data
-    df = dbc.df_from_sql(data, server, database)
+    df = df_from_sql_snapshot(data, server, database, params=params)
 
-    # Remove any duplicate orgs keeping most recent version where duplicated
-    df = df.sort_values(by=["Org_Code", "Open_date"], ascending=True)
-    df = df.drop_duplicates(subset=["Org_Code"], keep="last")
+    if cache_ttl:
+        snapshots.write_cache_file(cache_path, df)
 
     return df
 
@@ -104,7 +251,7 @@ def import_flu():
     If the source data does not contain an expected column, the process will abort with
     an error message detailing which columns are missing.
 
-    Expected columns are defined below. Unrequired columns are dropped.
+    Expected columns are defined below. Unrequired columns are not read.
 
     Returns
     -------
@@ -113,36 +260,63 @@ def import_flu():
     """
     logging.info("Loading LA level flu data")
 
-    # Import csv as a df
-    file_path = param.FLU_LA
-    df = pd.read_csv(file_path)
-
-    # Specify columns needed and check they are in df
-    expected_cols = ["Year",
-                     "Local Authority code",
-                     "All 2 year olds (combined): Patients registered",
-                     "All 2 year olds (combined): Number vaccinated",
-                     "All 3 year olds (combined): Patients registered",
-                     "All 3 year olds (combined): Number vaccinated"
-                     ]
+    # Specify columns needed (the count columns of each age band)
+    count_cols = [band[count] for band in param.FLU_AGE_BANDS
+                  for count in ["Number_Population", "Number_Vaccinated"]]
+    expected_cols = ["Year", "Local Authority code"] + count_cols
     input_data = "input file childhood_vaccination_flu_la.csv"
 
-    # Check that the columns are as expected
-    helpers.expected_column_check(df, input_data, expected_cols)
+    # Import the needed columns from the csv as a df, with counts as int64
+    df = read_csv_columns(param.FLU_LA, input_data, expected_cols, count_cols)
 
-    # Extract necessary cols only from csv
-    df = df[expected_cols]
+    return df
 
-    # Convert counts to numeric
-    for col in ["All 2 year olds (combined): Patients registered",
-                "All 2 year olds (combined): Number vaccinated",
-                "All 3 year olds (combined): Patients registered",
-                "All 3 year olds (combined): Number vaccinated"]:
-        if df[col].dtype == 'object':
-            df[col] = df[col].str.replace(',', '')
-            df[col] = df[col].astype('int64')
 
-    return df
+def read_csv_columns(file_path, input_data, expected_cols, count_cols):
+    """
+    Reads only the expected columns from a csv file using the pyarrow csv
+    reader, which reads the file in parallel blocks and scales to large files.
+
+    The header is checked first, and the process aborts with an error message
+    detailing any expected columns that are missing. Count columns may contain
+    thousands separators (e.g. 1,234), which are removed before the counts are
+    cast to int64. Other columns are read as strings.
+
+    Parameters
+    ----------
+    file_path : path
+        Location of the csv file
+    input_data : str
+        Name of the input used in the error message
+    expected_cols : list[str]
+        Columns to read, in the order they are returned
+    count_cols : list[str]
+        Expected columns that contain counts
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    """
+    # Check that the columns are as expected from the header row
+    df_header = pd.read_csv(file_path, nrows=0)
+    helpers.expected_column_check(df_header, input_data, expected_cols)
+
+    # Read the expected columns only, as strings so that thousands separators
+    # are kept for the counts
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=expected_cols,
+        column_types={col: pa.string() for col in expected_cols},
+        strings_can_be_null=True)
+    table = pa_csv.read_csv(file_path, convert_options=convert_options)
+
+    # Convert counts to int64, removing any thousands separators
+    for col in count_cols:
+        index = table.column_names.index(col)
+        counts = pc.replace_substring(table.column(index), ",", "")
+        table = table.set_column(index, col, counts.cast(pa.int64()))
+
+    return table.to_pandas()
 
 
 def import_vaccine_status_updates():
@@ -186,6 +360,10 @@ def import_raw_cover_data(fyear_start):
     from the COVER raw SQL table for the validations process
     Uses the df_from_sql function
 
+    If RAW_DELTA_IMPORT is True (parameters.py), only the data for
+    organisations that have changed since the last import is fetched and
+    merged into a local copy of the raw year (see import_raw_cover_delta).
+
     Returns
     -------
     pandas.DataFrame
@@ -194,22 +372,195 @@ def import_raw_cover_data(fyear_start):
     """
     logging.info("Importing childhood vaccinations data from the SQL raw table")
 
+    if param.RAW_DELTA_IMPORT:
+        return import_raw_cover_delta(fyear_start)
+
     # Load our parameters
     server = param.SERVER
     database = param.DATABASE
     table = param.TABLE_RAW
 
-    sql_folder = r"child_vac_code\sql_code"
-    query_name = r"\query_raw.sql"
+    data = sql_templates.render_template("query_raw.sql",
+                                         {"Database": database,
+                                          "Table": table})
+    params = {"FinancialYearStart": fyear_start}
 
-    with open(sql_folder + r"/" + query_name, "r") as sql_file:
-        data = sql_file.read()
+    # Get SQL data. The raw table changes while the collection is open (e.g.
+    # resubmissions), so it isn't snapshotted - use RAW_DELTA_IMPORT to avoid
+    # re-fetching organisations that haven't changed.
+    df = dbc.df_from_sql(data, server, database, params=params)
 
-    data = data.replace("<Database>", database)
-    data = data.replace("<Table>", table)
-    data = data.replace("<FinancialYearStart>", fyear_start)
+    return df
 
-    # Get SQL data
-    df = dbc.df_from_sql(data, server, database)
 
-    return df
+def import_raw_cover_delta(fyear_start, delta_dir=None):
+    """
+    Imports the data for the current reporting year from the COVER raw SQL
+    table, fetching only the organisations whose data has changed since the
+    last import.
+
+    A row count, count totals and checksum of the data for each organisation
+    are recorded as a watermark alongside a local copy of the raw year in RAW_DELTA_DIR
+    (parameters.py). On each run the current checksums are compared with the
+    watermark, and the data for organisations that are new or have changed is
+    fetched and replaces their data in the local copy. Organisations no longer
+    in the raw table are removed. Rows without an org code are checked and
+    replaced as one group. The whole year is imported if there is no local
+    copy, or if more than RAW_DELTA_MAX_ORGS organisations have changed.
+
+    Parameters
+    ----------
+    fyear_start : str
+        Financial year start of the data e.g. "01APR2022"
+    delta_dir : path, optional
+        Folder containing the local copy and watermark. Default is
+        RAW_DELTA_DIR (parameters.py)
+
+    Returns
+    -------
+    pandas.DataFrame
+        Containing the data imported from the raw SQL table
+
+    """
+    if delta_dir is None:
+        delta_dir = param.RAW_DELTA_DIR
+
+    # Load our parameters
+    server = param.SERVER
+    database = param.DATABASE
+    table = param.TABLE_RAW
+    identifiers = {"Database": database, "Table": table}
+    params = {"FinancialYearStart": fyear_start}
+
+    # Set the local copy and watermark file locations. The names include a key
+    # for the source so that a change of source table isn't merged.
+    key = snapshots.snapshot_key(table, server, database, params,
+                                 param.DATA_BACKEND)
+    data_path = Path(delta_dir) / f"raw_{fyear_start}_{key[:12]}.ft"
+    watermark_path = data_path.with_suffix(".json")
+
+    # Get the current checksums for each organisation (before the data, so
+    # that any changes made in between are fetched again on the next run)
+    checksum_query = sql_templates.render_template("query_raw_checksum.sql",
+                                                   identifiers)
+    df_checksums = dbc.df_from_sql(checksum_query, server, database,
+                                   params=params)
+    watermark_cols = ["Row_Count", "Total_Population", "Total_Vaccinated",
+                      "Org_Checksum"]
+    # Rows without an org code are checked as one group, keyed separately
+    # so that they aren't confused with an org code
+    watermark = {(NULL_ORG_KEY if pd.isnull(row[0]) else str(row[0])):
+                 [None if pd.isnull(value) else int(value)
+                  for value in row[1:]]
+                 for row in df_checksums[["Org_Code"] + watermark_cols]
+                 .itertuples(index=False)}
+
+    # Compare with the watermark from the last import
+    previous_watermark = None
+    if data_path.exists() and watermark_path.exists():
+        with open(watermark_path, "r") as watermark_file:
+            previous_watermark = json.load(watermark_file)
+
+    if previous_watermark is None:
+        changed_orgs = None
+        logging.info("No local copy of the raw data so importing all "
+                     "organisations")
+    else:
+        changed_orgs = [org_code for org_code, values in watermark.items()
+                        if previous_watermark.get(org_code) != values]
+        removed_orgs = [org_code for org_code in previous_watermark
+                        if org_code not in watermark]
+        logging.info(f"{len(changed_orgs)} organisations changed and "
+                     f"{len(removed_orgs)} removed since the last import")
+        if len(changed_orgs) > param.RAW_DELTA_MAX_ORGS:
+            changed_orgs = None
+            logging.info("Too many organisations changed so importing all "
+                         "organisations")
+
+    if changed_orgs is None:
+        # Import the whole year
+        query = sql_templates.render_template("query_raw.sql", identifiers)
+        df = dbc.df_from_sql(query, server, database, params=params)
+    else:
+        # Keep the local data for unchanged organisations, and add the data
+        # for changed organisations
+        df = pd.read_feather(data_path)
+        replaced_orgs = changed_orgs + removed_orgs
+        replaced = df["Org_Code"].isin(replaced_orgs)
+        if NULL_ORG_KEY in replaced_orgs:
+            replaced = replaced | df["Org_Code"].isnull()
+        df = df[~replaced]
+        if len(changed_orgs) > 0:
+            query = sql_templates.render_template("query_raw_orgs.sql",
+                                                  identifiers)
+            include_null_org = NULL_ORG_KEY in changed_orgs
+            org_codes = [org_code for org_code in changed_orgs
+                         if org_code != NULL_ORG_KEY]
+            df_changed = dbc.df_from_sql(
+                query, server, database,
+                params={**params, "OrgCodes": org_codes,
+                        "IncludeNullOrg": int(include_null_org)})
+            df = pd.concat([df, df_changed], ignore_index=True)
+
+    # Save the local copy and the watermark it is up to date with
+    snapshots.write_cache_file(data_path, df)
+    with open(watermark_path, "w") as watermark_file:
+        json.dump(watermark, watermark_file)
+
+    return df.reset_index(drop=True)
+
+
+def run_concurrent_loads(loads, max_workers=param.LOAD_MAX_WORKERS):
+    """
+    Runs independent data loading functions at the same time on a thread pool
+    and returns their results once all have completed. The time taken by each
+    load is logged.
+
+    If any load fails, the first error raised is re-raised straight away: the
+    loads that haven't started are cancelled, and those still running are not
+    waited for (their results are discarded).
+
+    Parameters
+    ----------
+    loads : dict(str, function)
+        Contains a name for each source and the function (with no arguments)
+        that loads it e.g. {"flu": import_flu}. Use functools.partial to
+        supply any arguments.
+    max_workers : int
+        Maximum number of loads to run at the same time.
+        Defaults to LOAD_MAX_WORKERS from parameters.py
+
+    Returns
+    -------
+    dict(str, object)
+        The result of each load function, keyed by the source name
+
+    """
+    def timed_load(name, load_function):
+        start_time = timeit.default_timer()
+        result = load_function()
+        load_time = timeit.default_timer() - start_time
+        logging.info(f"Loaded {name} in {load_time:.1f} seconds")
+        return result
+
+    logging.info(f"Loading {', '.join(loads)} concurrently")
+
+    # The executor is shut down explicitly (rather than with a with block,
+    # which waits for all the loads) so that an error is raised straight away
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {executor.submit(timed_load, name, load_function): name
+               for name, load_function in loads.items()}
+    done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+
+    # Raise the first error, without waiting for the loads still running
+    # (their threads finish in the background, and their results are
+    # discarded) and cancelling the loads not yet started
+    failed = [future for future in done if future.exception() is not None]
+    if failed:
+        executor.shutdown(wait=False, cancel_futures=True)
+        logging.error(f"Loading {futures[failed[0]]} failed")
+        raise failed[0].exception()
+
+    executor.shutdown()
+
+    return {name: future.result() for future, name in futures.items()}
@@ -0,0 +1,182 @@
+"""
+Purpose of script: caches the boolean row masks used by
+processing.filter_dataframe, so that the year, org type and optional filter
+masks of a dataframe are only computed once however many outputs use them.
+
+Used when CACHE_FILTER_MASKS is True (parameters.py), which requires pandas
+copy-on-write mode (turned on by memory.configure_pandas). The masks are held
+for each dataframe while it exists, along with the data of the columns each
+mask was made from. In copy-on-write mode a change to a column (e.g. a .loc
+write or replace) gives the dataframe new data for the column rather than
+changing the data shared with other selections, so a mask is recomputed when
+the data of any of its columns (or the index) is no longer the data it was
+made from.
+
+Only masks made from categorical columns are cached: in pandas 1.5 some in
+place changes to other columns (e.g. replace with inplace=True) still write
+to the shared data in copy-on-write mode. The columns filtered on are held as
+categories after pre-processing (PROCESSED_COLUMN_TYPES). Changes made
+directly to the underlying numpy data (e.g. through .values) aren't detected.
+invalidate can be used to drop the masks of a dataframe explicitly.
+
+The number of masks reused (hits) and computed (misses) for each type of mask
+is logged at the end of the run by log_stats.
+"""
+import logging
+import weakref
+import pandas as pd
+import child_vac_code.parameters as param
+from child_vac_code.utilities import memory
+
+logger = logging.getLogger(__name__)
+
+# Cached values for each dataframe, keyed by the dataframe id. The dataframe is
+# referenced weakly, and its entry is removed when it is deleted.
+_CACHE = {}
+
+# Number of hits and misses for each type of cached value
+_STATS = {}
+
+
+def _get_entry(df):
+    """
+    Returns the cache entry of a dataframe, creating it if needed. All cached
+    values are removed if the index of the dataframe has been replaced.
+    """
+    key = id(df)
+    entry = _CACHE.get(key)
+    if (entry is None or entry["ref"]() is not df
+            or entry["index"] is not df.index):
+        entry = {"ref": weakref.ref(df, lambda _: _CACHE.pop(key, None)),
+                 "index": df.index,
+                 "values": {}}
+        _CACHE[key] = entry
+
+    return entry
+
+
+def _get_column_data(series):
+    """
+    Returns the data of a categorical column that a cached value is checked
+    against: the categorical array (held so that its memory isn't reused),
+    the address of its codes, its categories and its dtype.
+    """
+    values = series.array
+    return (values, values.codes.ctypes.data, values.categories, values.dtype)
+
+
+def _is_unchanged(column_data, series):
+    """
+    Checks whether a column still has the data a cached value was made from.
+    """
+    _, address, categories, dtype = _get_column_data(series)
+    return (address == column_data[1] and categories is column_data[2]
+            and dtype is column_data[3])
+
+
+def cached(df, key, columns, compute):
+    """
+    Returns a value computed from columns of a dataframe (e.g. a row mask),
+    reusing the value computed for the dataframe with the same key if none of
+    the columns have changed since (see the module docstring).
+
+    The value is computed without caching if CACHE_FILTER_MASKS is False,
+    pandas copy-on-write mode is off, or any of the columns aren't
+    categorical.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    key : tuple
+        Identifies the value. The first item is the type of value, which the
+        hits and misses are counted by e.g. ("org_type", "LA").
+    columns : list[str]
+        Columns of df that the value is computed from
+    compute : function
+        Computes the value (with no arguments)
+
+    Returns
+    -------
+    Any
+        The value returned by compute
+    """
+    if not param.CACHE_FILTER_MASKS or not memory.copy_on_write_enabled():
+        return compute()
+    if not all(isinstance(df[column].dtype, pd.CategoricalDtype)
+               for column in columns):
+        return compute()
+
+    entry = _get_entry(df)
+    stats = _STATS.setdefault(key[0], {"hits": 0, "misses": 0})
+
+    # Reuse the value if the data of its columns hasn't changed
+    if key in entry["values"]:
+        value, columns_data = entry["values"][key]
+        if all(_is_unchanged(column_data, df[column])
+               for column, column_data in columns_data.items()):
+            stats["hits"] += 1
+            return value
+
+    stats["misses"] += 1
+    value = compute()
+    entry["values"][key] = (value, {column: _get_column_data(df[column])
+                                    for column in columns})
+
+    return value
+
+
+def invalidate(df, columns=None):
+    """
+    Removes the cached values of a dataframe, so they are recomputed when next
+    used. Changes to the data are detected automatically, so this is only
+    needed for changes that aren't (see the module docstring).
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    columns : list[str]
+        Columns of df that have been modified. Only the values computed from
+        any of these columns are removed. If None, all the values are removed.
+
+    Returns
+    -------
+    None
+    """
+    entry = _CACHE.get(id(df))
+    if entry is None or entry["ref"]() is not df:
+        return
+
+    if columns is None:
+        del _CACHE[id(df)]
+    else:
+        entry["values"] = {key: (value, value_columns)
+                           for key, (value, value_columns)
+                           in entry["values"].items()
+                           if set(value_columns).isdisjoint(columns)}
+
+
+def get_stats():
+    """
+    Returns the number of hits and misses for each type of cached value, as a
+    dictionary e.g. {"org_type": {"hits": 10, "misses": 2}}.
+    """
+    return {value_type: dict(stats) for value_type, stats in _STATS.items()}
+
+
+def log_stats():
+    """
+    Logs the hit rate of the cache for each type of cached value.
+    """
+    for value_type, stats in _STATS.items():
+        total = stats["hits"] + stats["misses"]
+        logging.info(f"Filter mask cache ({value_type}): "
+                     f"{stats['hits']} hits, {stats['misses']} misses "
+                     f"({stats['hits'] / total:.0%} hit rate)")
+
+
+def clear():
+    """
+    Removes all cached values and resets the hit and miss counts.
+    """
+    _CACHE.clear()
+    _STATS.clear()
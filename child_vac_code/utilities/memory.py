@@ -0,0 +1,135 @@
+"""
+Purpose of script: controls how pandas copies data during the run, and checks
+the memory used by each stage of the pipeline against the budgets set in
+parameters.py.
+
+If COPY_ON_WRITE is True, pandas copy-on-write mode is turned on. Selections
+and slices of a dataframe then share its data until one of them is modified,
+so the defensive copies of the full COVER data taken before modifying a slice
+are not needed.
+
+The peak memory (resident set size) of the process is logged at the end of
+each stage. If it is over the budget for the stage in STAGE_MEMORY_BUDGETS_MB,
+the run is aborted, so that a run that would exhaust the memory of the
+machine fails at a known point.
+"""
+import ctypes
+import logging
+import sys
+import pandas as pd
+import child_vac_code.parameters as param
+
+logger = logging.getLogger(__name__)
+
+# Peak memory (MB) at the end of the previous stage
+_LAST_PEAK_MB = None
+
+
+def configure_pandas():
+    """
+    Turns on pandas copy-on-write mode if COPY_ON_WRITE (parameters.py) is
+    True, or if CACHE_FILTER_MASKS is True (as the filter mask cache relies on
+    it to detect changes to the data, see masks.py).
+    """
+    if param.COPY_ON_WRITE or param.CACHE_FILTER_MASKS:
+        logging.info("Turning on pandas copy-on-write mode")
+        pd.set_option("mode.copy_on_write", True)
+
+
+def copy_on_write_enabled():
+    """
+    Returns True if pandas copy-on-write mode is turned on.
+    """
+    return bool(pd.get_option("mode.copy_on_write"))
+
+
+def copy_for_update(df):
+    """
+    Returns a copy of a dataframe that is safe to modify without changing (or
+    warning about) the dataframe it was selected from. In copy-on-write mode
+    the dataframe is returned as it is, as pandas copies the data when it is
+    modified.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    if copy_on_write_enabled():
+        return df
+
+    return df.copy()
+
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of the process in MB.
+    """
+    if sys.platform == "win32":
+        # Use the peak working set size from the Windows process status API
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", ctypes.c_ulong),
+                        ("PageFaultCount", ctypes.c_ulong),
+                        ("PeakWorkingSetSize", ctypes.c_size_t),
+                        ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t),
+                        ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / 1024 ** 2
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak is in bytes on macOS and kB on Linux
+    if sys.platform == "darwin":
+        return peak / 1024 ** 2
+    return peak / 1024
+
+
+def check_stage(stage):
+    """
+    Logs the peak memory of the process at the end of a stage of the
+    pipeline, and checks it against the budget for the stage in
+    STAGE_MEMORY_BUDGETS_MB (parameters.py).
+
+    Parameters
+    ----------
+    stage : str
+        Name of the stage e.g. "load"
+
+    Returns
+    -------
+    float
+        Peak memory in MB
+
+    Raises
+    ------
+    MemoryError
+        If the peak memory is over the budget for the stage
+    """
+    global _LAST_PEAK_MB
+    peak = peak_rss_mb()
+    last_peak = _LAST_PEAK_MB
+    _LAST_PEAK_MB = peak
+
+    increase = "" if last_peak is None else f" (+{peak - last_peak:.0f} MB)"
+    logging.info(f"Peak memory after {stage} stage: {peak:.0f} MB{increase}")
+
+    budget = param.STAGE_MEMORY_BUDGETS_MB.get(stage)
+    if budget is not None and peak > budget:
+        raise MemoryError(f"The peak memory after the {stage} stage "
+                          f"({peak:.0f} MB) is over its budget of {budget} MB "
+                          "set in STAGE_MEMORY_BUDGETS_MB (parameters.py)")
+
+    return peak
@@ -0,0 +1,150 @@
+"""
+Purpose of script: holds the organisation reference data for the run in
+memory, so that local level outputs can be joined to the valid organisations
+without re-reading and re-filtering the reference data for each output.
+
+The registry is created once by pre_processing.create_org_ref_data. It holds
+a view of the valid organisations for each local level org type (e.g. "LA"),
+indexed by Org_Code. If ORG_REF_PERSIST (parameters.py) is True the reference
+data is also saved as an uncompressed feather file, which can be memory-mapped
+to recreate the registry in a separate process.
+"""
+import logging
+import pyarrow.feather as feather
+import child_vac_code.parameters as param
+from child_vac_code.utilities import helpers
+
+logger = logging.getLogger(__name__)
+
+# File the organisation reference data is saved to if ORG_REF_PERSIST is True
+ORG_REF_FEATHER = "cached_dataframes/df_org_ref.ft"
+
+# The registry for the run (see register)
+_REGISTRY = None
+
+
+class OrgRefRegistry:
+    """
+    Organisation reference data with a precomputed view of the valid
+    organisations for each local level org type.
+
+    Parameters
+    ----------
+    df_org_ref : pandas.DataFrame
+        Organisation reference data as created by
+        pre_processing.create_org_ref_data
+    """
+
+    def __init__(self, df_org_ref):
+        self.df_org_ref = df_org_ref
+
+        # The valid org types are the local level org types added in
+        # pre_processing by helpers.add_organisation_type
+        local_orgs = df_org_ref[df_org_ref["Org_Level"] == "Local"]
+        self.org_types = local_orgs["Org_Type"].unique().tolist()
+
+        # Create the view for each org type. For LA outputs, retain the upper
+        # tier LA's only.
+        self._views = {}
+        for org_type in self.org_types:
+            df_org_type = df_org_ref[(df_org_ref["Org_Type"] == org_type)
+                                     & (df_org_ref["Entity_code"] != "E07")]
+            self._views[org_type] = df_org_type.set_index("Org_Code")
+
+    def view(self, org_type):
+        """
+        Returns the valid organisations of an org type, indexed by Org_Code.
+        The view is shared so should not be modified.
+
+        Parameters
+        ----------
+        org_type : str
+            Local level org type e.g. "LA"
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        # Check that a valid org_type has been used
+        helpers.validate_value_with_list("Org_Type", org_type, self.org_types)
+
+        return self._views[org_type]
+
+    def save(self, path=None):
+        """
+        Saves the organisation reference data as an uncompressed feather file
+        (ORG_REF_FEATHER by default), so that it can be memory-mapped when
+        loaded.
+        """
+        if path is None:
+            path = ORG_REF_FEATHER
+
+        feather.write_feather(self.df_org_ref, path, compression="uncompressed")
+
+    @classmethod
+    def load(cls, path=None):
+        """
+        Creates a registry from a feather file saved by save
+        (ORG_REF_FEATHER by default), reading the file with a memory map.
+        """
+        if path is None:
+            path = ORG_REF_FEATHER
+
+        df_org_ref = feather.read_table(path, memory_map=True).to_pandas()
+
+        return cls(df_org_ref)
+
+
+def register(df_org_ref):
+    """
+    Creates the organisation reference registry for the run.
+
+    Parameters
+    ----------
+    df_org_ref : pandas.DataFrame
+        Organisation reference data as created by
+        pre_processing.create_org_ref_data
+
+    Returns
+    -------
+    OrgRefRegistry
+    """
+    global _REGISTRY
+    _REGISTRY = OrgRefRegistry(df_org_ref)
+
+    return _REGISTRY
+
+
+def get_registry():
+    """
+    Returns the organisation reference registry for the run. If no registry
+    has been created in this process and ORG_REF_PERSIST is True, it is loaded
+    from the saved feather file.
+
+    Returns
+    -------
+    OrgRefRegistry
+
+    Raises
+    ------
+    ValueError
+        If the organisation reference data has not been created
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        if not param.ORG_REF_PERSIST:
+            raise ValueError("The organisation reference data has not been "
+                             "created (see pre_processing.create_org_ref_data)")
+        logging.info("Loading the organisation reference data from "
+                     f"{ORG_REF_FEATHER}")
+        _REGISTRY = OrgRefRegistry.load()
+
+    return _REGISTRY
+
+
+def clear_registry():
+    """
+    Removes the organisation reference registry for the run.
+    """
+    global _REGISTRY
+    _REGISTRY = None
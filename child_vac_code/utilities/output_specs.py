@@ -0,0 +1,226 @@
+"""
+Purpose of script: holds the specs of the outputs created from the
+pre-processed data (tables, charts, csvs and dashboards), and plans the
+aggregations the outputs need.
+
+Each output is declared as a spec in the catalogue of its module (e.g.
+TABLE_SPECS in tables.py): the name of the processing function that creates
+it ("function") and the arguments of that function. The catalogues are
+registered when the modules are imported, which checks every spec (e.g. for
+missing or unknown arguments, and filters that are invalid or reference
+unknown columns) before anything is run.
+The content functions named in the output lists (e.g. get_tables_cover) create
+each output from its spec with run.
+
+plan groups the outputs in an output list by the aggregation each one needs
+(the filtered data summed by a set of variables), so the aggregations needed
+can be inspected before the outputs are run.
+"""
+import copy
+import inspect
+import logging
+from dataclasses import dataclass
+import child_vac_code.parameters as param
+from child_vac_code.utilities import predicates, processing
+
+logger = logging.getLogger(__name__)
+
+# Columns that the filters of the specs can reference: the columns of the
+# pre-processed COVER data (the flu data has a subset of these columns)
+FILTER_COLUMNS = list(param.PROCESSED_COLUMN_TYPES)
+
+# Processing functions that outputs can be created with
+FUNCTIONS = {function.__name__: function for function in
+             [processing.create_output_crosstab,
+              processing.create_csv_output,
+              processing.create_output_dashboard_data]}
+
+# Specs of the outputs, keyed by the output (content function) name
+_REGISTRY = {}
+
+
+@dataclass(frozen=True)
+class OutputSpec:
+    """
+    The spec of an output: the processing function that creates it, and the
+    arguments of the function (other than the dataframe).
+    """
+    name: str
+    function: object
+    arguments: dict
+
+    def aggregation(self, columns=None):
+        """
+        Returns the aggregation the output needs, as a tuple of the org type,
+        filter condition, variables grouped by, number of years, and
+        numerator and denominator columns (the same key as the cube rollups in
+        processing.aggregate_crosstab_data).
+
+        Parameters
+        ----------
+        columns : list[str]
+            Columns of the dataframe the output will be created from. Row
+            variables not in the dataframe (which are added from the
+            organisation reference data) are not grouped by. If None, all the
+            row variables are included.
+
+        Returns
+        -------
+        tuple
+        """
+        arguments = inspect.signature(self.function).bind(
+            None, **self.arguments)
+        arguments.apply_defaults()
+        arguments = arguments.arguments
+
+        # Find the variables the processing function groups by
+        if self.function is processing.create_output_crosstab:
+            rows = processing.check_for_sort_on(arguments["sort_on"],
+                                                list(arguments["rows"]))[0]
+            if columns is not None:
+                rows = [variable for variable in rows if variable in columns]
+            variables = rows
+            if arguments["columns"] is not None:
+                variables = rows + [arguments["columns"]]
+        elif self.function is processing.create_output_dashboard_data:
+            fixed_values = processing.get_dashboard_fixed_values(
+                arguments["output_type"])
+            variables = [variable for variable in arguments["breakdowns"]
+                         if variable not in fixed_values]
+        else:
+            variables = arguments["breakdowns"]
+
+        return (arguments["org_type"], arguments["filter_condition"],
+                tuple(variables), arguments["ts_years"],
+                arguments["num_column"], arguments["denom_column"])
+
+
+def register_specs(specs, columns=None):
+    """
+    Checks and registers a catalogue of output specs.
+
+    Parameters
+    ----------
+    specs : dict(str, dict)
+        The spec of each output, keyed by the output name. Each spec contains
+        the name of the processing function ("function") and its arguments.
+    columns : list[str]
+        Columns of the data the outputs are created from, which the filters
+        are checked against. Default is FILTER_COLUMNS.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If a spec is invalid or an output has already been registered
+    """
+    if columns is None:
+        columns = FILTER_COLUMNS
+
+    for name, spec in specs.items():
+        if name in _REGISTRY:
+            raise ValueError(f"The output spec {name} has been defined more "
+                             "than once")
+
+        arguments = {key: value for key, value in spec.items()
+                     if key != "function"}
+        function = FUNCTIONS.get(spec.get("function"))
+        if function is None:
+            raise ValueError(f"The output spec {name} has an invalid "
+                             f"function: {spec.get('function')}. Valid "
+                             f"functions are {', '.join(FUNCTIONS)}")
+
+        # Check the arguments match the processing function and any filter
+        # can be compiled and only references columns of the data
+        try:
+            inspect.signature(function).bind(None, **arguments)
+        except TypeError as error:
+            raise ValueError(f"The output spec {name} has invalid arguments "
+                             f"for {function.__name__}: {error}")
+        if arguments.get("filter_condition") is not None:
+            predicates.compile_predicate(arguments["filter_condition"],
+                                         columns)
+
+        _REGISTRY[name] = OutputSpec(name, function, arguments)
+
+
+def get_spec(name):
+    """
+    Returns the spec of an output, or None if the output has no spec.
+    """
+    return _REGISTRY.get(name)
+
+
+def run(name, df):
+    """
+    Creates an output from its spec.
+
+    Parameters
+    ----------
+    name : str
+        Name of the output
+    df : pandas.DataFrame
+        The pre-processed data
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    spec = _REGISTRY[name]
+
+    # The arguments are copied as the processing functions can modify them
+    return spec.function(df, **copy.deepcopy(spec.arguments))
+
+
+def plan(output_args, columns=None):
+    """
+    Groups the content functions of a list of outputs (e.g. from
+    get_tables_cover) by the aggregation each one needs.
+
+    Parameters
+    ----------
+    output_args : list[dict]
+        The outputs, as passed to write_data.write_outputs
+    columns : list[str]
+        Columns of the dataframe the outputs will be created from (see
+        OutputSpec.aggregation)
+
+    Returns
+    -------
+    aggregations : dict(tuple, list[str])
+        The names of the content functions that need each aggregation
+    unplanned : list[str]
+        Names of content functions that don't have a spec
+    """
+    aggregations = {}
+    unplanned = []
+    for output in output_args:
+        for key, contents in output.items():
+            if not key.startswith("contents"):
+                continue
+            for content in contents:
+                spec = get_spec(content.__name__)
+                if spec is None:
+                    unplanned.append(content.__name__)
+                    continue
+                aggregations.setdefault(spec.aggregation(columns),
+                                        []).append(spec.name)
+
+    return aggregations, unplanned
+
+
+def log_plan(output_args, columns=None):
+    """
+    Logs the number of distinct aggregations needed by a list of outputs
+    (see plan).
+    """
+    aggregations, unplanned = plan(output_args, columns)
+    contents = sum(len(names) for names in aggregations.values())
+    logger.info(f"{contents} output contents need {len(aggregations)} "
+                "distinct aggregations")
+    if unplanned:
+        logger.info(f"{len(unplanned)} output contents don't have a spec: "
+                    f"{', '.join(unplanned)}")
@@ -1,6 +1,7 @@
 import pandas as pd
+import numpy as np
 import logging
-from child_vac_code.utilities import helpers, load
+from child_vac_code.utilities import helpers, load, org_ref
 import child_vac_code.parameters as param
 import child_vac_code.utilities.validations.validations_processing as val_proc
 
@@ -55,7 +56,13 @@ def create_org_ref_data(fyear, combine_small_las=True):
         df_org_ref = df_org_ref[~df_org_ref["Org_Code"].isin(small_las)]
 
     # Default index values are reset here to support saving to feather
-    return df_org_ref.reset_index(drop=True)
+    df_org_ref = df_org_ref.reset_index(drop=True)
+
+    # Create the organisation reference registry used by the local level
+    # outputs (see processing.select_org_ref_data)
+    org_ref.register(df_org_ref)
+
+    return df_org_ref
 
 
 def update_small_las(df, column_code, column_name,
@@ -168,7 +175,8 @@ def update_child_vac_data(df, df_org_ref, df_status_updates, combine_small_las=T
 
     # Add a financial year column for reporting based on the existing financial
     # year start column
-    df['FinancialYear'] = df['FinancialYearStart'].apply(helpers.fyearstart_to_fyear)
+    df['FinancialYear'] = helpers.convert_year_format(df['FinancialYearStart'],
+                                                      "fyear")
 
     if combine_small_las:
         # Combines small LAs with larger LAs according to combination in
@@ -185,6 +193,9 @@ def update_child_vac_data(df, df_org_ref, df_status_updates, combine_small_las=T
     # Add vaccine status column
     df = add_vaccine_status(df, df_status_updates)
 
+    # Set the compact data types used for processing
+    df = helpers.apply_column_types(df, param.PROCESSED_COLUMN_TYPES)
+
     return df
 
 
@@ -217,8 +228,7 @@ def update_flu_vac_data(df, df_org_ref, fyear):
     df = df.rename(columns={"Year": "FinancialYear", "Local Authority code": "Org_Code"})
 
     # Apply any LA code substitutions specified in parameters.py
-    for oldcode, newcode in param.UPDATE_LA_CODE_FLU.items():
-        df.loc[df["Org_Code"] == oldcode, "Org_Code"] = newcode
+    df["Org_Code"] = df["Org_Code"].replace(param.UPDATE_LA_CODE_FLU)
 
     # Join org_ref info to flu dataframe
     # Select columns from df_org_ref
@@ -235,9 +245,8 @@ def update_flu_vac_data(df, df_org_ref, fyear):
     # Add data type
     df["Data_Type"] = "Actual"
 
-    # Separate 2 year and 3 year flu vaccinations and rename vaccs/pop columns
-
-    # Set common grouping columns
+    # Stack the count columns of each age band (as defined in parameters.py)
+    # into rows, adding the age and vaccination type of each band
     grouping_cols = ["FinancialYear",
                      "Org_Code",
                      "Org_Name",
@@ -245,31 +254,17 @@ def update_flu_vac_data(df, df_org_ref, fyear):
                      "Parent_Org_Code",
                      "Parent_Org_Name",
                      "Data_Type"]
+    count_cols = ["Number_Population", "Number_Vaccinated"]
+    label_cols = ["Child_Age", "Vac_Type"]
+
+    df = helpers.stack_column_groups(
+        df,
+        grouping_cols,
+        [{col: band[col] for col in count_cols} for band in param.FLU_AGE_BANDS],
+        {col: [band[col] for band in param.FLU_AGE_BANDS] for col in label_cols})
 
-    # Extract the 2 year old children dataframe and generalise the names of the
-    # count columns
-    df_2y = df[grouping_cols + ["All 2 year olds (combined): Patients registered",
-                                "All 2 year olds (combined): Number vaccinated"]]
-    df_2y = df_2y.rename(columns={
-        "All 2 year olds (combined): Patients registered": "Number_Population",
-        "All 2 year olds (combined): Number vaccinated": "Number_Vaccinated"})
-
-    # Extract the 3 year old children dataframe and generalise the names of the
-    # count columns
-    df_3y = df[grouping_cols + ["All 3 year olds (combined): Patients registered",
-                                "All 3 year olds (combined): Number vaccinated"]]
-    df_3y = df_3y.rename(columns={
-        "All 3 year olds (combined): Patients registered": "Number_Population",
-        "All 3 year olds (combined): Number vaccinated": "Number_Vaccinated"})
-
-    # Add column for age and vaccination type
-    df_2y["Child_Age"] = "24m"
-    df_2y["Vac_Type"] = "Flu_24m"
-    df_3y["Child_Age"] = "3y"
-    df_3y["Vac_Type"] = "Flu_3y"
-
-    # Append 2 year and 3 year flu dataframes
-    df = pd.concat([df_2y, df_3y])
+    # Set the compact data types used for processing
+    df = helpers.apply_column_types(df, param.PROCESSED_COLUMN_TYPES)
 
     return df
 
@@ -313,25 +308,23 @@ def add_vaccine_status(df, df_status_updates):
         df.loc[(df["Vac_Type"].isin(vac_types)),
                "Vaccine_Status"] = status
 
-    # Join on status updates data
-    df = df.merge(df_status_updates,
-                  how="left",
-                  on=["FinancialYear", "Org_Code", "Vac_Type"],
-                  indicator="Merge_Flag")
-
     # Create dictionary of new status and related vaccination types
     status_updates = {
         "Full data not available": ["HepB_Group2_12m", "HepB_Group2_24m"],
     }
 
-    # Update status for orgs and vac types mentioned in updates file as below
-    for status, vac_types in status_updates.items():
-        df.loc[(df["Merge_Flag"] == "both") &
-               (df["Vac_Type"].isin(vac_types)),
-               "Vaccine_Status"] = status
+    # Index the orgs and vac types in the status updates file
+    keys = ["FinancialYear", "Org_Code", "Vac_Type"]
+    update_keys = pd.MultiIndex.from_frame(df_status_updates[keys])
 
-    # Drop merge flag
-    df.drop(columns=["Merge_Flag"], inplace=True)
+    # Update status for orgs and vac types mentioned in updates file as below.
+    # Only the rows for the vac types with a status are looked up.
+    for status, vac_types in status_updates.items():
+        vac_type_rows = np.flatnonzero(df["Vac_Type"].isin(vac_types))
+        row_keys = pd.MultiIndex.from_frame(df[keys].iloc[vac_type_rows])
+        update_rows = np.zeros(len(df), dtype=bool)
+        update_rows[vac_type_rows] = row_keys.isin(update_keys)
+        df.loc[update_rows, "Vaccine_Status"] = status
 
     return df
 
@@ -356,7 +349,8 @@ def update_child_vac_data_raw(df, df_org_ref):
     """
 
     # Add financial year
-    df["FinancialYear"] = df["FinancialYearStart"].apply(helpers.fyearstart_to_fyear)
+    df["FinancialYear"] = helpers.convert_year_format(df["FinancialYearStart"],
+                                                      "fyear")
 
     # Join corporate ref data org details onto raw data
     df_orgs = df_org_ref[["Org_Code", "Org_Name", "Parent_Org_Code",
@@ -0,0 +1,253 @@
+"""
+Purpose of script: compiles the dataframe query filter strings used in the
+output specs (filter_condition) into predicates that are evaluated directly as
+row masks, rather than through the DataFrame.query parse and eval machinery
+for every output.
+
+A filter is parsed once, when it is first used, and the compiled predicate is
+reused by later outputs with the same filter. The columns it references are
+checked against the dataframe before any data is filtered, so a filter with an
+invalid column (or a parameter that doesn't exist) is rejected straight away.
+
+The filters supported are comparisons of a column with a value or list of
+values (in, not in, ==, !=, <, <=, >, >=) combined with and/or/not (or &, |,
+~), where values can reference parameters e.g.
+"Vac_Type not in @param.SELECTIVE_VACCS". As in DataFrame.query, & and | have
+the same precedence as and/or.
+"""
+import ast
+import io
+import operator
+import re
+import tokenize
+import numpy as np
+import pandas as pd
+import child_vac_code.parameters as param
+
+# Compiled predicates, keyed by the filter string
+_COMPILED = {}
+
+
+class Membership:
+    """
+    Checks whether the values of a column are in (or not in) a list of values.
+    In the filter string, == and != compare with a value or list of values in
+    the same way.
+    """
+
+    def __init__(self, column, value, negate=False):
+        self.column = column
+        self.value = value
+        self.negate = negate
+        self.columns = frozenset([column])
+
+    @property
+    def values(self):
+        """
+        The list of values (a single value is a list of one value).
+        """
+        value = self.value.resolve()
+        return list(value) if isinstance(value, (list, tuple)) else [value]
+
+    def evaluate(self, df):
+        series = df[self.column]
+        values = self.values
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Look up whether each category is one of the values, and select
+            # the rows by their category codes. Nulls have the code -1, so are
+            # looked up in the last position.
+            categories = series.cat.categories
+            lookup = np.zeros(len(categories) + 1, dtype=bool)
+            positions = categories.get_indexer(values)
+            lookup[positions[positions >= 0]] = True
+            lookup[-1] = any(pd.isna(value) for value in values)
+            mask = lookup[series.cat.codes.to_numpy()]
+        else:
+            mask = series.isin(values).to_numpy()
+
+        return ~mask if self.negate else mask
+
+
+class Comparison:
+    """
+    Compares the values of a column with a value (<, <=, > or >=).
+    """
+
+    OPERATORS = {ast.Lt: operator.lt, ast.LtE: operator.le,
+                 ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+    def __init__(self, column, operator_type, value):
+        self.column = column
+        self.operator_type = operator_type
+        self.value = value
+        self.columns = frozenset([column])
+
+    def evaluate(self, df):
+        compare = self.OPERATORS[self.operator_type]
+        return compare(df[self.column], self.value.resolve()).to_numpy()
+
+
+class BooleanOperation:
+    """
+    Combines predicates with and (is_and=True) or or.
+    """
+
+    def __init__(self, is_and, operands):
+        self.is_and = is_and
+        self.operands = operands
+        self.columns = frozenset().union(*(operand.columns
+                                           for operand in operands))
+
+    def evaluate(self, df):
+        combine = np.logical_and if self.is_and else np.logical_or
+        return combine.reduce([operand.evaluate(df)
+                               for operand in self.operands])
+
+
+class Negation:
+    """
+    Negates a predicate.
+    """
+
+    def __init__(self, operand):
+        self.operand = operand
+        self.columns = operand.columns
+
+    def evaluate(self, df):
+        return ~self.operand.evaluate(df)
+
+
+class Value:
+    """
+    A value in a filter: a constant (or list of constants), or a reference to
+    a parameter, which is looked up when the predicate is evaluated.
+    """
+
+    def __init__(self, constant=None, param_name=None):
+        self.constant = constant
+        self.param_name = param_name
+
+    def resolve(self):
+        if self.param_name is not None:
+            return getattr(param, self.param_name)
+        return self.constant
+
+
+def compile_predicate(filter_condition, columns=None):
+    """
+    Compiles a dataframe query filter string into a predicate. Each predicate
+    has the set of columns it references (.columns), and an evaluate method
+    that returns the boolean row mask of a dataframe as a numpy array.
+
+    Parameters
+    ----------
+    filter_condition : str
+    columns : list[str]
+        Columns that the filter can reference (e.g. the columns of the
+        dataframe it will be applied to). If None, the columns are not
+        checked.
+
+    Returns
+    -------
+    Membership, Comparison, BooleanOperation or Negation
+
+    Raises
+    ------
+    ValueError
+        If the filter can't be compiled, or references a column not in columns
+    """
+    predicate = _COMPILED.get(filter_condition)
+    if predicate is None:
+        predicate = _parse(filter_condition)
+        _COMPILED[filter_condition] = predicate
+
+    # Check the columns referenced are valid
+    if columns is not None:
+        invalid_columns = sorted(predicate.columns - set(columns))
+        if invalid_columns:
+            raise ValueError(f"The filter {filter_condition} references "
+                             f"unknown columns: "
+                             f"{', '.join(invalid_columns)}")
+
+    return predicate
+
+
+def _parse(filter_condition):
+    """
+    Parses a filter string into a predicate.
+    """
+    # Local variable references (@) are resolved against the parameters, and
+    # & and | are replaced with and/or so they have the same precedence as in
+    # DataFrame.query
+    expression = re.sub(r"@(?=[A-Za-z_])", "", filter_condition)
+    boolean_operators = {"&": "and", "|": "or"}
+    try:
+        tokens = []
+        for token in tokenize.generate_tokens(io.StringIO(expression).readline):
+            if token.type == tokenize.OP and token.string in boolean_operators:
+                tokens.append((tokenize.NAME,
+                               boolean_operators[token.string]))
+            else:
+                tokens.append((token.type, token.string))
+        tree = ast.parse(tokenize.untokenize(tokens).strip(), mode="eval")
+    except (SyntaxError, tokenize.TokenError):
+        raise ValueError(f"The filter {filter_condition} can't be parsed")
+
+    return _parse_node(tree.body, filter_condition)
+
+
+def _parse_node(node, filter_condition):
+    """
+    Parses a node of a filter's syntax tree into a predicate.
+    """
+    if isinstance(node, ast.BoolOp):
+        return BooleanOperation(isinstance(node.op, ast.And),
+                                [_parse_node(operand, filter_condition)
+                                 for operand in node.values])
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not,
+                                                                ast.Invert)):
+        return Negation(_parse_node(node.operand, filter_condition))
+
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 \
+            and isinstance(node.left, ast.Name):
+        column = node.left.id
+        operator_type = type(node.ops[0])
+        value = _parse_value(node.comparators[0], filter_condition)
+
+        # As in DataFrame.query, in/== with a list checks membership of the
+        # list and in with a single value checks equality
+        if operator_type in (ast.In, ast.NotIn, ast.Eq, ast.NotEq):
+            return Membership(column, value,
+                              negate=operator_type in (ast.NotIn, ast.NotEq))
+
+        if operator_type in Comparison.OPERATORS:
+            return Comparison(column, operator_type, value)
+
+    raise ValueError(f"The filter {filter_condition} can't be compiled: "
+                     "only comparisons of a column with a value are supported")
+
+
+def _parse_value(node, filter_condition):
+    """
+    Parses a value in a filter: a constant, a list/tuple of constants, or a
+    reference to a parameter e.g. param.SELECTIVE_VACCS.
+    """
+    if isinstance(node, ast.Constant):
+        return Value(constant=node.value)
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return Value(constant=[
+            _parse_value(element, filter_condition).resolve()
+            for element in node.elts])
+
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) \
+            and node.value.id == "param":
+        if not hasattr(param, node.attr):
+            raise ValueError(f"The filter {filter_condition} references a "
+                             f"parameter that doesn't exist: {node.attr}")
+        return Value(param_name=node.attr)
+
+    raise ValueError(f"The filter {filter_condition} can't be compiled: "
+                     f"{ast.dump(node)} is not a supported value")
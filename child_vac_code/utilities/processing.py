@@ -2,7 +2,8 @@ import pandas as pd
 import numpy as np
 import logging
 import child_vac_code.parameters as param
-from child_vac_code.utilities import helpers
+from child_vac_code.utilities import (cube, helpers, masks, org_ref,
+                                     predicates, pushdown)
 
 logger = logging.getLogger(__name__)
 
@@ -29,22 +30,12 @@ def select_org_ref_data(org_type, columns):
     """
     logging.info("Extracting the required type of organisation data")
 
-    # Read in the organisation reference data from the cached folder.
-    df_org_ref = pd.read_feather('cached_dataframes/df_org_ref.ft')
-
-    # Check that a valid org_type has been used - exists in the organisation
-    # reference data as added in pre_processing by helpers.add_organisation_type
-    org_type_valid = df_org_ref[df_org_ref["Org_Level"] == "Local"]
-    org_type_valid = org_type_valid["Org_Type"].unique().tolist()
-    helpers.validate_value_with_list("Org_Type",
-                                     org_type,
-                                     org_type_valid)
-
-    # Extract the required organisation types
-    df_org_type = df_org_ref[df_org_ref["Org_Type"] == org_type]
-
-    # For LA outputs, retain the upper tier LA's only
-    df_org_type = df_org_type[df_org_type["Entity_code"] != "E07"]
+    # Get the valid organisations of the required type from the organisation
+    # reference registry (created in pre_processing.create_org_ref_data). The
+    # view is indexed by org code, which is restored as a column.
+    df_org_type = org_ref.get_registry().view(org_type)
+    details = [item for item in columns if item in df_org_type.columns]
+    df_orgs = df_org_type[details].reset_index()
 
     # Adjustment for standard columns required for some outputs
     # so that they are populated for any organisations with no data
@@ -52,14 +43,14 @@ def select_org_ref_data(org_type, columns):
     if "FinancialYear" in columns:
         # Add a financial year column from the parameter input
         fyear = helpers.fyearstart_to_fyear(param.FYEAR_START)
-        df_org_type["FinancialYear"] = fyear
+        df_orgs["FinancialYear"] = fyear
 
     # Check for any item in columns that do appear in the org ref data and
     # drop these from the org ref extract requirement
-    columns = [item for item in columns if item in df_org_type.columns]
+    columns = [item for item in columns if item in df_orgs.columns]
 
     # Extract the details (column names) needed for the output
-    df_orgs = df_org_type[columns].copy()
+    df_orgs = df_orgs[columns]
 
     return df_orgs
 
@@ -102,9 +93,11 @@ def merge_org_ref_data(df, join_on, org_type, columns):
     cols_to_keep = df.columns.difference(df_valid_orgs.columns).tolist()
     cols_to_keep = [join_on] + cols_to_keep
 
-    # Merge the organisation details with the data.
-    df = (pd.merge(df_valid_orgs, df[cols_to_keep],
-                   how="left", on=join_on))
+    # Merge the organisation details with the data (joining on the org codes
+    # as the index of the data).
+    df = (df_valid_orgs.join(df[cols_to_keep].set_index(join_on),
+                             on=join_on, how="left")
+          .reset_index(drop=True))
 
     return df
 
@@ -253,26 +246,47 @@ def filter_dataframe(df, org_type, filter_condition, ts_years,
         Filtered to the conditions input to the function.
 
     """
+    # Compile the optional general filter to a predicate (see predicates.py),
+    # checking that it only references columns in the dataframe before any
+    # data is filtered
+    if filter_condition is not None:
+        predicate = predicates.compile_predicate(filter_condition, df.columns)
+
+    # The masks for each filter are cached for the dataframe (see masks.py),
+    # as the same filters are applied to it for many outputs
+    # Filter dataframe to number of years defined in ts_years
+    def year_mask():
+        year_range = helpers.convert_year_format(
+            helpers.get_year_range(param.FYEAR_START, ts_years), "fyear")
+        return df[year_column].isin(year_range).to_numpy()
+
+    row_filter = masks.cached(df, ("year", year_column, param.FYEAR_START,
+                                   ts_years), [year_column], year_mask)
+
     # Filter dataframe on Org_Type where not None
     if org_type is not None:
         # Create a list of valid org types from the asset
-        valid_org_types = df["Org_Type"].drop_duplicates().tolist()
+        valid_org_types = masks.cached(
+            df, ("valid_org_types",), ["Org_Type"],
+            lambda: df["Org_Type"].drop_duplicates().tolist())
         # Check for invalid org_type argument against the input value
         helpers.validate_value_with_list("Org_Type", org_type,
                                          valid_org_types)
-        # Filter dataframe to org type
-        df = df[df["Org_Type"] == org_type]
+        row_filter = row_filter & masks.cached(
+            df, ("org_type", org_type), ["Org_Type"],
+            lambda: (df["Org_Type"] == org_type).to_numpy())
 
-    # Filter dataframe to number of years defined in ts_years
-    fyear = helpers.fyearstart_to_fyear(param.FYEAR_START)
-    year_range = helpers.get_year_range_fy(fyear, ts_years)
-    df = df[(df[year_column].isin(year_range))]
-
-    # Apply the optional general filter
+    # Apply the optional general filter. The predicate is evaluated for every
+    # row, which gives the same rows as querying the rows selected by the
+    # standard filters.
     if filter_condition is not None:
-        df = df.query(filter_condition)
+        row_filter = row_filter & masks.cached(
+            df, ("filter_condition", filter_condition),
+            sorted(predicate.columns), lambda: predicate.evaluate(df))
 
-    return df
+    # Select the filtered rows (in one step, so that the data is only copied
+    # once)
+    return df[row_filter]
 
 
 def apply_hepb_suppression(df, eligible_col, vaccinated_col, coverage_col):
@@ -329,6 +343,123 @@ def apply_hepb_suppression(df, eligible_col, vaccinated_col, coverage_col):
     return df
 
 
+def aggregate_crosstab_data(df, org_type, filter_condition, variables,
+                            ts_years, num_column="Number_Vaccinated",
+                            denom_column="Number_Population"):
+    """
+    Filters the data for a crosstab and sums the numerator and denominator
+    columns by the variables.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    org_type : str
+        Determines which of the pre-defined org types will be reported on.
+    filter_condition : str
+        Optional dataframe filter as a string (see filter_dataframe).
+    variables : list[str]
+        Variable names that the data will be grouped on.
+    ts_years: int
+        Number of years to be used in the time series.
+    num_column: str
+        Name of the column that holds the measure (coverage) numerator data
+    denom_column: str
+        Name of the column that holds the measure (coverage) denominator data
+
+    Returns
+    -------
+    df_agg : pandas.DataFrame
+    """
+    # Where an aggregation cube has been built from the data (see cube.py),
+    # reuse the aggregation for the same crosstab spec if it has been made
+    # before, or use the cube rows for the years and org type of the crosstab
+    source_df = df
+    rollup_key = (org_type, filter_condition, tuple(variables), ts_years,
+                  num_column, denom_column)
+    df_agg = cube.get_rollup(source_df, rollup_key)
+    if df_agg is not None:
+        return df_agg
+
+    df_cube = cube.select(df, org_type, filter_condition, variables, ts_years,
+                          [num_column, denom_column])
+    if df_cube is not None:
+        df, org_type = df_cube, None
+
+    # Apply standard and optional filters to dataframe
+    df_filtered = filter_dataframe(df, org_type, filter_condition, ts_years)
+
+    # Aggregate the data by the required variables
+    # (observed=True so unused categories of categorical columns aren't output)
+    df_agg = (df_filtered.groupby(variables, observed=True)[[num_column,
+                                                              denom_column]]
+              .sum())
+    df_agg.reset_index(inplace=True)
+    df_agg = helpers.categorical_to_object(df_agg)
+    # (pandas doesn't sort observed groups of more than one categorical
+    # column, so the groups are sorted as they would be for object columns)
+    df_agg = df_agg.sort_values(variables, ignore_index=True)
+
+    if df_cube is not None:
+        cube.save_rollup(source_df, rollup_key, df_agg)
+
+    return df_agg
+
+
+def pivot_crosstab_data(df_agg, rows, columns, measure):
+    """
+    Pivots aggregated crosstab data so that the values of the columns variable
+    become columns of the measure. Gives the same result as pd.pivot_table,
+    but the aggregated values are unstacked directly, so nulls (e.g. coverage
+    where the population is 0) are kept without a dummy value.
+
+    Parameters
+    ----------
+    df_agg : pandas.DataFrame
+        Data aggregated by the rows and columns variables
+    rows : list[str]
+        Variable name(s) that hold the row labels
+    columns : str
+        Variable name that holds the column labels (or None, in which case
+        the measure is the only column)
+    measure : str
+        Name of the column that holds the values
+
+    Returns
+    -------
+    df_pivot : pandas.DataFrame
+        One row for each combination of the rows variables (sorted), with the
+        rows variables as columns followed by the pivoted measure columns
+    """
+    # Index the measure by the row and column variables
+    variables = rows if columns is None else rows + [columns]
+    values = df_agg.set_index(variables)[measure]
+
+    # Exclude groups with a null in any variable, as in pivot_table (nulls
+    # have the code -1 in the index)
+    if values.index.nlevels > 1:
+        null_groups = np.logical_or.reduce([codes == -1 for codes
+                                            in values.index.codes])
+    else:
+        null_groups = values.index.isna()
+    if null_groups.any():
+        values = values[~null_groups]
+
+    # Where there is more than one value for a group (e.g. a row subgroup with
+    # the same name as an existing row), use the mean as pivot_table does.
+    # Only observed combinations of categorical variables are kept, as in
+    # pivot_table.
+    if not values.index.is_unique:
+        values = values.groupby(level=variables, observed=True).mean()
+
+    # Unstack the column variable (which sorts the rows and columns)
+    if columns is None:
+        df_pivot = values.sort_index().to_frame()
+    else:
+        df_pivot = values.unstack(columns)
+
+    return df_pivot.reset_index()
+
+
 def create_output_crosstab(df, org_type, output_type, rows, columns, sort_on,
                            row_order, column_order, column_rename,
                            filter_condition, row_subgroup, column_subgroup,
@@ -405,9 +536,6 @@ def create_output_crosstab(df, org_type, output_type, rows, columns, sort_on,
         in the form of a crosstab, with aggregated counts
     """
 
-    # Apply standard and optional filters to dataframe
-    df_filtered = filter_dataframe(df, org_type, filter_condition, ts_years)
-
     # If sort_on is used, need to account for columns only used for sorting
     rows, cols_to_remove = check_for_sort_on(sort_on, rows)
 
@@ -417,7 +545,7 @@ def create_output_crosstab(df, org_type, output_type, rows, columns, sort_on,
     # Prevents the process trying to call columns that don't exist in the source data.
     rows_original = rows.copy()
     for variable in rows:
-        if variable not in df_filtered.columns:
+        if variable not in df.columns:
             rows.remove(variable)
 
     # Create a combined rows and columns list to represent all the variables
@@ -427,11 +555,26 @@ def create_output_crosstab(df, org_type, output_type, rows, columns, sort_on,
     else:
         all_variables = rows + [columns]
 
-    # Aggregate the data by the required variables
-    df_agg = (df_filtered.groupby(all_variables)[[num_column,
-                                                  denom_column]]
-              .sum())
-    df_agg.reset_index(inplace=True)
+    # Filter and aggregate the data by the required variables. If
+    # CROSSTAB_EXECUTION is "sql" this is done in the SQL asset where possible
+    # (see pushdown.py), otherwise in pandas.
+    df_agg = None
+    if param.CROSSTAB_EXECUTION == "sql":
+        df_agg = pushdown.aggregate_crosstab(df, org_type, filter_condition,
+                                             all_variables, ts_years,
+                                             num_column, denom_column)
+    if df_agg is None:
+        df_agg = aggregate_crosstab_data(df, org_type, filter_condition,
+                                         all_variables, ts_years, num_column,
+                                         denom_column)
+    elif param.CROSSTAB_PARITY_CHECK:
+        # Check the SQL aggregation against the pandas aggregation
+        pushdown.check_parity(df_agg,
+                              aggregate_crosstab_data(df, org_type,
+                                                      filter_condition,
+                                                      all_variables, ts_years,
+                                                      num_column, denom_column),
+                              all_variables)
 
     # Add any required row or column subgroups to data
     if row_subgroup is not None:
@@ -466,21 +609,8 @@ def create_output_crosstab(df, org_type, output_type, rows, columns, sort_on,
     elif output_type == "Population":
         measure = denom_column
 
-    # Convert nulls (coverage values with 0 data) to a dummy value
-    # for pivoting (prevents loss of nulls)
-    if measure == "Coverage":
-        dummy_value = -1
-        df_agg[measure] = df_agg[measure].fillna(dummy_value)
-
     # Pivots the dataframe into a crosstab
-    df_pivot = pd.pivot_table(df_agg,
-                              values=measure,
-                              index=rows,
-                              columns=columns).reset_index()
-
-    if measure == "Coverage":
-        # Restore nulls where previously replaced with dummy value
-        df_pivot.replace({-1: np.nan}, inplace=True)
+    df_pivot = pivot_crosstab_data(df_agg, rows, columns, measure)
 
     # Check the rows content for the presence of the 'Org_Code' column
     # If present then join to the valid organisation reference data.
@@ -593,9 +723,11 @@ def create_csv_output(df, filter_condition, output_type, breakdowns, sort_on,
     df_filtered = filter_dataframe(df, org_type, filter_condition, ts_years)
 
     # Aggregate the data by the required variables
-    df_filtered = (df_filtered.groupby(breakdowns)[[
+    df_filtered = (df_filtered.groupby(breakdowns, observed=True)[[
         num_column, denom_column]].sum())
     df_filtered.reset_index(inplace=True)
+    df_filtered = helpers.categorical_to_object(df_filtered)
+    df_filtered = df_filtered.sort_values(breakdowns, ignore_index=True)
 
     # Complete output specific adjustments to produce pop or vacc figures per org_type
     if output_type == "Population":
@@ -629,6 +761,37 @@ def create_csv_output(df, filter_condition, output_type, breakdowns, sort_on,
     return df_csv
 
 
+def get_dashboard_fixed_values(output_type):
+    """
+    Returns the values of the dashboard breakdowns that are the same for every
+    row of an output type: the org code and name for UK and national data,
+    and the org level.
+
+    Parameters
+    ----------
+    output_type : str
+        The dashboard output type (see create_output_dashboard_data)
+
+    Returns
+    -------
+    dict(str, str)
+        Values keyed by the breakdown column
+    """
+    fixed_values = {}
+    if output_type == "UK":
+        fixed_values = {"Org_Code": "K02000001", "Org_Name": "United Kingdom"}
+    if output_type == "National":
+        fixed_values = {"Org_Code": "E92000001", "Org_Name": "England"}
+
+    # Add org level column based on input
+    if output_type in ["National", "Other nations"]:
+        fixed_values["Org_Level"] = "Country"
+    else:
+        fixed_values["Org_Level"] = output_type
+
+    return fixed_values
+
+
 def create_output_dashboard_data(df, output_type, org_type, breakdowns, sort_on,
                                  column_rename, filter_condition, population_vaccines,
                                  ts_years=1,
@@ -690,25 +853,25 @@ def create_output_dashboard_data(df, output_type, org_type, breakdowns, sort_on,
     # Apply standard and optional filters to dataframe
     df_filtered = filter_dataframe(df, org_type, filter_condition, ts_years)
 
-    # Update org code and name for UK and national data before grouping
-    if output_type == "UK":
-        df_filtered["Org_Code"] = "K02000001"
-        df_filtered["Org_Name"] = "United Kingdom"
-    if output_type == "National":
-        df_filtered["Org_Code"] = "E92000001"
-        df_filtered["Org_Name"] = "England"
-
-    # Add org level column based on input
-    if output_type in ["National", "Other nations"]:
-        df_filtered["Org_Level"] = "Country"
-    else:
-        df_filtered["Org_Level"] = output_type
+    # Set the org code and name for UK and national data, and the org level.
+    # These are the same for all rows, so are added after grouping rather
+    # than to the filtered data.
+    fixed_values = get_dashboard_fixed_values(output_type)
 
     # Aggregate the data by the required variables
-    df_agg = (df_filtered.groupby(breakdowns)[[num_column, denom_column]]
+    group_columns = [column for column in breakdowns
+                     if column not in fixed_values]
+    df_agg = (df_filtered.groupby(group_columns, observed=True)[[num_column,
+                                                                 denom_column]]
               .sum())
 
     df_agg.reset_index(inplace=True)
+    df_agg = helpers.categorical_to_object(df_agg)
+    for column, value in fixed_values.items():
+        if column in breakdowns:
+            df_agg[column] = value
+    df_agg = df_agg[breakdowns + [num_column, denom_column]]
+    df_agg = df_agg.sort_values(breakdowns, ignore_index=True)
 
     # Calculate coverage
     df_agg = helpers.add_percent_or_rate(df_agg,
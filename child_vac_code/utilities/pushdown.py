@@ -0,0 +1,299 @@
+"""
+Purpose of script: pushes the aggregation step of create_output_crosstab
+down to the SQL asset, so that only the aggregated counts are fetched rather
+than the row level data.
+
+Used when CROSSTAB_EXECUTION is set to "sql" (parameters.py). The dataframe
+passed to the crosstab functions must have been registered with
+register_source, which records where its data was imported from and the
+pre-processing applied to it. Crosstab specs that can't be expressed in SQL
+(e.g. grouping by vaccine status, or a dataframe that wasn't imported from the
+asset such as the flu data) are aggregated in pandas as normal.
+"""
+import ast
+import logging
+import pandas as pd
+import child_vac_code.parameters as param
+from child_vac_code.utilities import helpers, load, predicates, sql_templates
+
+logger = logging.getLogger(__name__)
+
+# Dataframes registered as pushdown sources during the run, keyed by the
+# dataframe id. The dataframe is held so that its id can't be reused.
+_SOURCES = {}
+
+# Columns that are derived from another column after the SQL aggregation
+DERIVED_COLUMNS = {"FinancialYear": "FinancialYearStart",
+                   "Parent_Org_Name": "Parent_Org_Code"}
+
+
+def register_source(df, year_range, df_org_ref, combine_small_las=True):
+    """
+    Registers a pre-processed asset dataframe so that crosstabs created from
+    it can be aggregated in SQL.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The asset data after pre-processing (update_child_vac_data)
+    year_range : list[str]
+        The financial year starts imported into df e.g. ["01APR2022"]
+    df_org_ref : pandas.DataFrame
+        Organisation reference data used to add parent names to df
+    combine_small_las : bool
+        Whether small LAs were combined with larger ones in df
+
+    Returns
+    -------
+    None
+    """
+    _SOURCES[id(df)] = {"df": df,
+                        "year_range": list(year_range),
+                        "df_org_ref": df_org_ref,
+                        "combine_small_las": combine_small_las}
+
+
+def clear_sources():
+    """
+    Removes all registered pushdown sources.
+    """
+    _SOURCES.clear()
+
+
+def get_column_expressions(combine_small_las=True):
+    """
+    Returns the SQL expression for each column of the asset table that can be
+    grouped or filtered on. If combine_small_las is True the org code and
+    name expressions combine the small LAs in LA_UPDATE (parameters.py) with
+    their larger neighbours, as in pre_processing.update_small_las.
+    """
+    column_expressions = {column: f"[{column}]" for column in
+                          ["FinancialYearStart", "Parent_Org_Code", "Org_Code",
+                           "Org_Name", "Org_Type", "Child_Age", "Vac_Type",
+                           "Data_Type"]}
+
+    if combine_small_las:
+        for column, from_key, to_key in [("Org_Code", "From_code", "To_code"),
+                                         ("Org_Name", "From_name", "To_name")]:
+            cases = " ".join(
+                f"WHEN {sql_literal(from_value)} THEN {sql_literal(to_value)}"
+                for from_value, to_value in zip(param.LA_UPDATE[from_key],
+                                                param.LA_UPDATE[to_key]))
+            column_expressions[column] = (f"CASE [{column}] {cases} "
+                                          f"ELSE [{column}] END")
+
+    return column_expressions
+
+
+def sql_literal(value):
+    """
+    Returns a string or number as a SQL literal.
+    """
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return repr(value)
+
+    raise ValueError(f"The value {value!r} can't be used in SQL")
+
+
+def compile_filter(filter_condition, column_expressions):
+    """
+    Translates a dataframe query filter string (as used by filter_dataframe)
+    into a SQL condition.
+
+    Supports the filters that can be compiled to a predicate (see
+    predicates.py) e.g. "Vac_Type not in @param.SELECTIVE_VACCS".
+
+    Parameters
+    ----------
+    filter_condition : str
+    column_expressions : dict(str, str)
+        The SQL expression for each column that can be filtered on
+
+    Returns
+    -------
+    str
+        SQL condition
+
+    Raises
+    ------
+    ValueError
+        If the filter can't be translated to SQL
+    """
+    predicate = predicates.compile_predicate(filter_condition,
+                                             column_expressions)
+
+    return _compile_predicate(predicate, column_expressions)
+
+
+def _compile_predicate(predicate, column_expressions):
+    """
+    Translates a compiled filter predicate into a SQL condition.
+    """
+    if isinstance(predicate, predicates.BooleanOperation):
+        joiner = " AND " if predicate.is_and else " OR "
+        return "(" + joiner.join(_compile_predicate(operand,
+                                                    column_expressions)
+                                 for operand in predicate.operands) + ")"
+
+    if isinstance(predicate, predicates.Negation):
+        operand_sql = _compile_predicate(predicate.operand, column_expressions)
+        return f"NOT ({operand_sql})"
+
+    column_sql = column_expressions[predicate.column]
+
+    if isinstance(predicate, predicates.Membership):
+        values = predicate.values
+        if len(values) == 0:
+            return "1=1" if predicate.negate else "1=0"
+        values_sql = ", ".join(sql_literal(value) for value in values)
+        return (f"{column_sql} {'not in' if predicate.negate else 'in'} "
+                f"({values_sql})")
+
+    comparison_operators = {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">",
+                            ast.GtE: ">="}
+    return (f"{column_sql} {comparison_operators[predicate.operator_type]} "
+            f"{sql_literal(predicate.value.resolve())}")
+
+
+def aggregate_crosstab(df, org_type, filter_condition, variables, ts_years,
+                       num_column="Number_Vaccinated",
+                       denom_column="Number_Population"):
+    """
+    Aggregates the data for a crosstab in SQL, giving the same result as
+    filtering the dataframe with filter_dataframe and summing the num_column
+    and denom_column by the variables in pandas.
+
+    Returns None if df isn't a registered source or the crosstab spec can't be
+    expressed in SQL, in which case the pandas aggregation should be used.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe registered with register_source
+    org_type : str
+        Org type to filter to (or None)
+    filter_condition : str
+        Optional dataframe query filter (or None)
+    variables : list[str]
+        Columns to group by
+    ts_years : int
+        Number of years to include
+    num_column : str
+        Name of the numerator column
+    denom_column : str
+        Name of the denominator column
+
+    Returns
+    -------
+    pandas.DataFrame or None
+    """
+    source = _SOURCES.get(id(df))
+    if source is None:
+        return None
+
+    # Check the crosstab can be expressed in SQL
+    if (num_column, denom_column) != ("Number_Vaccinated", "Number_Population"):
+        logging.info("Crosstab counts are not in the asset so are aggregated "
+                     "in pandas")
+        return None
+
+    column_expressions = get_column_expressions(source["combine_small_las"])
+    sql_variables = []
+    for variable in variables:
+        sql_variable = DERIVED_COLUMNS.get(variable, variable)
+        if sql_variable not in column_expressions:
+            logging.info(f"Crosstab grouped by {variable} is aggregated in "
+                         "pandas")
+            return None
+        if sql_variable not in sql_variables:
+            sql_variables.append(sql_variable)
+
+    conditions = []
+    if filter_condition is not None:
+        try:
+            conditions.append(compile_filter(filter_condition,
+                                             column_expressions))
+        except ValueError as error:
+            logging.info(f"Crosstab filter is aggregated in pandas: {error}")
+            return None
+
+    # Filter to org type (checking it is valid as in filter_dataframe)
+    if org_type is not None:
+        helpers.validate_value_with_list("Org_Type", org_type,
+                                         df["Org_Type"].drop_duplicates().tolist())
+        conditions.append(f"[Org_Type] = {sql_literal(org_type)}")
+
+    # Filter to the years in the time series that are in the source data
+    year_range = [year for year in
+                  helpers.get_year_range(param.FYEAR_START, ts_years)
+                  if year in source["year_range"]]
+
+    # Build the aggregation query
+    fragments = {
+        "Columns": "\n      ,".join(
+            f"{column_expressions[column]} as {column}"
+            for column in sql_variables),
+        "GroupBy": ", ".join(column_expressions[column]
+                             for column in sql_variables),
+        "Filter": "".join(f"\nAND {condition}" for condition in conditions)}
+    query = sql_templates.render_template(
+        "query_crosstab.sql",
+        {"Database": param.DATABASE, "Table": param.TABLE},
+        fragments)
+    params = {"YearRange": year_range}
+
+    logging.info("Aggregating crosstab data in SQL")
+    df_agg = load.df_from_sql_snapshot(query, param.SERVER, param.DATABASE,
+                                       params=params)
+
+    # Add the derived columns
+    if "FinancialYear" in variables:
+        df_agg["FinancialYear"] = helpers.convert_year_format(
+            df_agg["FinancialYearStart"], "fyear")
+    if "Parent_Org_Name" in variables:
+        df_orgs = source["df_org_ref"][["Org_Code", "Org_Name"]].rename(
+            columns={"Org_Code": "Parent_Org_Code",
+                     "Org_Name": "Parent_Org_Name"})
+        df_agg = pd.merge(df_agg, df_orgs, how="left", on="Parent_Org_Code")
+
+    # Re-aggregate by the requested variables. As in pandas, groups with a
+    # null in any variable are dropped and null counts sum to 0.
+    df_agg[[num_column, denom_column]] = df_agg[[num_column,
+                                                 denom_column]].fillna(0)
+    df_agg = (df_agg.groupby(variables)[[num_column, denom_column]]
+              .sum()
+              .reset_index())
+
+    return df_agg
+
+
+def check_parity(df_sql, df_pandas, variables):
+    """
+    Checks that the SQL aggregation of a crosstab matches the pandas
+    aggregation, and aborts the process if not.
+
+    Parameters
+    ----------
+    df_sql : pandas.DataFrame
+        Output of aggregate_crosstab
+    df_pandas : pandas.DataFrame
+        The same crosstab data aggregated in pandas
+    variables : list[str]
+        Columns the data is grouped by
+
+    Returns
+    -------
+    None
+    """
+    df_sql = df_sql.sort_values(variables).reset_index(drop=True)
+    df_pandas = df_pandas.sort_values(variables).reset_index(drop=True)
+
+    try:
+        pd.testing.assert_frame_equal(df_sql, df_pandas, check_dtype=False)
+    except AssertionError as error:
+        raise ValueError("The SQL crosstab aggregation does not match the "
+                         f"pandas aggregation:\n{error}")
+
+    logging.info("SQL crosstab aggregation matches pandas")
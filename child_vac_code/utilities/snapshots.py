@@ -0,0 +1,328 @@
+"""
+Purpose of script: stores local snapshots of SQL extracts so that reruns of
+the pipeline don't need to re-query data that hasn't changed.
+
+Each snapshot is keyed by a hash of the query text and the server/database it
+was run against, and saved as a compressed feather file in SNAPSHOT_DIR
+(parameters.py).
+
+Also holds the year-partitioned store of the asset data (ASSET_STORE_DIR),
+where each financial year is saved as a separate partition file, and
+functions for cache files that expire after a set time (e.g. the organisation
+reference data cache).
+"""
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+import pandas as pd
+import child_vac_code.parameters as param
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_key(query, server, database, *args):
+    """
+    Creates the key for a snapshot from the query text and the server and
+    database that it is run against.
+
+    Parameters
+    ----------
+    query : str
+        The rendered sql query
+    server : str
+        server name
+    database : str
+        database name
+    *args
+        Any other values that change the content of the extract (e.g. the
+        data types it is cast to)
+
+    Returns
+    -------
+    str
+        sha256 hash of the inputs
+    """
+    content = "\n".join([server, database, query] + [repr(arg) for arg in args])
+
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def snapshot_path(key, snapshot_dir=None):
+    """
+    Returns the file path of the snapshot with the given key.
+    """
+    if snapshot_dir is None:
+        snapshot_dir = param.SNAPSHOT_DIR
+
+    return Path(snapshot_dir) / f"{key}.ft"
+
+
+def read_snapshot(key, snapshot_dir=None):
+    """
+    Reads a snapshot if one exists for the key. The modified time of the file
+    is updated so that the most recently used snapshots are kept on eviction.
+
+    Parameters
+    ----------
+    key : str
+        Snapshot key (see snapshot_key)
+    snapshot_dir : path, optional
+        Folder containing the snapshots. Default is SNAPSHOT_DIR (parameters.py)
+
+    Returns
+    -------
+    pandas.DataFrame or None if there is no snapshot for the key
+    """
+    path = snapshot_path(key, snapshot_dir)
+
+    if not path.exists():
+        return None
+
+    logger.info(f"Reading snapshot {path.name}")
+    df = pd.read_feather(path)
+    os.utime(path)
+
+    return df
+
+
+def write_snapshot(key, df, snapshot_dir=None, max_mb=None):
+    """
+    Saves a dataframe as a zstd compressed feather snapshot, and then removes
+    the least recently used snapshots if the folder is over its size limit.
+
+    Parameters
+    ----------
+    key : str
+        Snapshot key (see snapshot_key)
+    df : pandas.DataFrame
+    snapshot_dir : path, optional
+        Folder containing the snapshots. Default is SNAPSHOT_DIR (parameters.py)
+    max_mb : int, optional
+        Maximum size of the snapshot folder in megabytes.
+        Default is SNAPSHOT_MAX_MB (parameters.py)
+
+    Returns
+    -------
+    None
+    """
+    path = snapshot_path(key, snapshot_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"Writing snapshot {path.name}")
+    # Feather requires a default index
+    df.reset_index(drop=True).to_feather(path, compression="zstd")
+
+    evict_snapshots(snapshot_dir, max_mb)
+
+
+def invalidate_snapshots(keys=None, snapshot_dir=None):
+    """
+    Removes snapshots so that the data is re-queried on the next run.
+
+    Parameters
+    ----------
+    keys : list[str], optional
+        Keys of the snapshots to remove. Default is None (all snapshots are
+        removed)
+    snapshot_dir : path, optional
+        Folder containing the snapshots. Default is SNAPSHOT_DIR (parameters.py)
+
+    Returns
+    -------
+    None
+    """
+    if keys is None:
+        if snapshot_dir is None:
+            snapshot_dir = param.SNAPSHOT_DIR
+        paths = list(Path(snapshot_dir).glob("*.ft"))
+    else:
+        paths = [snapshot_path(key, snapshot_dir) for key in keys]
+
+    for path in paths:
+        if path.exists():
+            logger.info(f"Removing snapshot {path.name}")
+            path.unlink()
+
+
+def evict_snapshots(snapshot_dir=None, max_mb=None):
+    """
+    Removes the least recently used snapshots until the total size of the
+    snapshot folder is within the size limit.
+
+    Parameters
+    ----------
+    snapshot_dir : path, optional
+        Folder containing the snapshots. Default is SNAPSHOT_DIR (parameters.py)
+    max_mb : int, optional
+        Maximum size of the snapshot folder in megabytes.
+        Default is SNAPSHOT_MAX_MB (parameters.py)
+
+    Returns
+    -------
+    None
+    """
+    if snapshot_dir is None:
+        snapshot_dir = param.SNAPSHOT_DIR
+    if max_mb is None:
+        max_mb = param.SNAPSHOT_MAX_MB
+
+    # List snapshots with the least recently used first
+    # (snapshots can be written by concurrent loads, so files that are removed
+    # while this runs are skipped)
+    snapshot_stats = []
+    for path in Path(snapshot_dir).glob("*.ft"):
+        try:
+            snapshot_stats.append((path, path.stat()))
+        except FileNotFoundError:
+            continue
+    snapshot_stats.sort(key=lambda item: item[1].st_mtime)
+    total_bytes = sum(stat.st_size for path, stat in snapshot_stats)
+
+    while snapshot_stats and total_bytes > max_mb * 1024 * 1024:
+        path, stat = snapshot_stats.pop(0)
+        total_bytes -= stat.st_size
+        logger.info(f"Evicting snapshot {path.name}")
+        path.unlink(missing_ok=True)
+
+
+def partition_path(year, store_dir=None):
+    """
+    Returns the file path of the partition for a financial year start
+    (e.g. 01APR2021) in the year-partitioned store.
+    """
+    if store_dir is None:
+        store_dir = param.ASSET_STORE_DIR
+
+    return Path(store_dir) / f"FinancialYearStart={year}.ft"
+
+
+def read_partitions(years, store_dir=None):
+    """
+    Reads the partitions for the years that are in the year-partitioned store.
+
+    Parameters
+    ----------
+    years : list[str]
+        Financial year starts to read e.g. ["01APR2020", "01APR2021"]
+    store_dir : path, optional
+        Folder containing the partitions. Default is ASSET_STORE_DIR
+        (parameters.py)
+
+    Returns
+    -------
+    dict(str, pandas.DataFrame)
+        Data for each year found in the store (years not in the store are
+        not included)
+    """
+    dfs = {}
+    for year in years:
+        path = partition_path(year, store_dir)
+        if path.exists():
+            logger.info(f"Reading {year} from the asset store")
+            dfs[year] = pd.read_feather(path)
+
+    return dfs
+
+
+def write_partition(year, df, store_dir=None):
+    """
+    Saves the data for a financial year start as a zstd compressed feather
+    partition in the year-partitioned store.
+
+    Parameters
+    ----------
+    year : str
+        Financial year start e.g. "01APR2021"
+    df : pandas.DataFrame
+        Data for the year
+    store_dir : path, optional
+        Folder containing the partitions. Default is ASSET_STORE_DIR
+        (parameters.py)
+
+    Returns
+    -------
+    None
+    """
+    path = partition_path(year, store_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"Writing {year} to the asset store")
+    # Feather requires a default index
+    df.reset_index(drop=True).to_feather(path, compression="zstd")
+
+
+def invalidate_partitions(years, store_dir=None):
+    """
+    Removes partitions from the year-partitioned store so that those years
+    are re-imported on the next run.
+
+    Parameters
+    ----------
+    years : list[str]
+        Financial year starts to remove e.g. ["01APR2021"]
+    store_dir : path, optional
+        Folder containing the partitions. Default is ASSET_STORE_DIR
+        (parameters.py)
+
+    Returns
+    -------
+    None
+    """
+    for year in years:
+        path = partition_path(year, store_dir)
+        if path.exists():
+            logger.info(f"Removing {year} from the asset store")
+            path.unlink()
+
+
+def read_cache_file(path, max_age_hours):
+    """
+    Reads a cache file if it exists and was written within max_age_hours.
+
+    Parameters
+    ----------
+    path : path
+        Feather file written by write_cache_file
+    max_age_hours : float
+        Maximum age of the file in hours
+
+    Returns
+    -------
+    pandas.DataFrame or None if there is no cache file or it has expired
+    """
+    path = Path(path)
+
+    try:
+        age_hours = (time.time() - path.stat().st_mtime) / 3600
+    except FileNotFoundError:
+        return None
+
+    if age_hours > max_age_hours:
+        logger.info(f"Cache file {path.name} has expired")
+        return None
+
+    logger.info(f"Reading cache file {path.name}")
+    return pd.read_feather(path)
+
+
+def write_cache_file(path, df):
+    """
+    Saves a dataframe as a zstd compressed feather cache file.
+
+    Parameters
+    ----------
+    path : path
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    None
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"Writing cache file {path.name}")
+    # Feather requires a default index
+    df.reset_index(drop=True).to_feather(path, compression="zstd")
@@ -0,0 +1,123 @@
+"""
+Purpose of script: reads the sql query templates in the sql_code folder and
+renders them into queries with bound parameters.
+
+Each template is read and parsed once per run. Placeholders in a template are
+handled according to how they are written:
+    [<Name>]    identifier (e.g. database or table name) - checked and
+                inserted into the query text
+    '<Name>'    value - passed to the server as a bound parameter (:Name)
+    ('<Name>')  list of values - passed as an expanding bound parameter
+    <Name>      SQL generated by the code (e.g. the pushdown group by
+                columns) - inserted into the query text as it is
+
+As values are passed separately from the query text, the same query text is
+sent to the server whatever the values are, so the server can reuse its
+cached query plan.
+"""
+import functools
+import re
+from child_vac_code.utilities import helpers
+
+# Folder containing the sql query templates
+SQL_FOLDER = helpers.get_project_root() / "child_vac_code" / "sql_code"
+
+_IDENTIFIER_PLACEHOLDER = re.compile(r"\[<(\w+)>\]")
+_LIST_PLACEHOLDER = re.compile(r"\('<(\w+)>'\)")
+_VALUE_PLACEHOLDER = re.compile(r"'<(\w+)>'")
+_FRAGMENT_PLACEHOLDER = re.compile(r"<(\w+)>")
+
+# Comments in the templates (placeholders in comments are not replaced)
+_COMMENT = re.compile(r"/\*.*?\*/|--[^\n]*", re.DOTALL)
+
+# Characters allowed in database and table names
+_VALID_IDENTIFIER = re.compile(r"^[\w .\-]+$")
+
+
+@functools.lru_cache(maxsize=None)
+def parse_template(query_name):
+    """
+    Reads a sql template and replaces the value placeholders with bind
+    parameters. Cached so that each template is only read once.
+
+    Parameters
+    ----------
+    query_name : str
+        File name of the template in the sql_code folder e.g. "query_asset.sql"
+
+    Returns
+    -------
+    str
+        The template text with bind parameters (:Name) in place of the value
+        placeholders. Identifier and fragment placeholders are left in place.
+    """
+    with open(SQL_FOLDER / query_name, "r") as sql_file:
+        text = sql_file.read()
+
+    # Replace the value placeholders outside of comments. Lists are passed
+    # as expanding parameters, which add their own brackets.
+    parts = []
+    position = 0
+    for comment in _COMMENT.finditer(text):
+        parts.append(_bind_values(text[position:comment.start()]))
+        parts.append(comment.group())
+        position = comment.end()
+    parts.append(_bind_values(text[position:]))
+
+    return "".join(parts)
+
+
+def _bind_values(text):
+    """
+    Replaces list and value placeholders in sql text with bind parameters.
+    """
+    text = _LIST_PLACEHOLDER.sub(r":\1", text)
+
+    return _VALUE_PLACEHOLDER.sub(r":\1", text)
+
+
+def render_template(query_name, identifiers, fragments=None):
+    """
+    Renders a sql template into a query, inserting the identifiers and any
+    fragments. Values are not inserted - they are passed as parameters when
+    the query is run (see data_connections.df_from_sql).
+
+    Parameters
+    ----------
+    query_name : str
+        File name of the template in the sql_code folder e.g. "query_asset.sql"
+    identifiers : dict(str, str)
+        Database and table names for the identifier placeholders
+        e.g. {"Database": param.DATABASE, "Table": param.TABLE}
+    fragments : dict(str, str), optional
+        SQL for any fragment placeholders
+
+    Returns
+    -------
+    str
+        Query text with bind parameters for the values
+    """
+    text = _render_identifiers(query_name, tuple(sorted(identifiers.items())))
+
+    if fragments is not None:
+        text = _FRAGMENT_PLACEHOLDER.sub(
+            lambda match: fragments[match.group(1)], text)
+
+    return text
+
+
+@functools.lru_cache(maxsize=None)
+def _render_identifiers(query_name, identifier_items):
+    """
+    Inserts identifiers into a parsed template. Cached so that the same query
+    text object is returned for the same identifiers.
+    """
+    identifiers = dict(identifier_items)
+    for name, identifier in identifiers.items():
+        if not _VALID_IDENTIFIER.match(identifier):
+            raise ValueError(f"The {name} name {identifier} is not a valid "
+                             "SQL identifier")
+
+    return _IDENTIFIER_PLACEHOLDER.sub(
+        lambda match: f"[{identifiers[match.group(1)]}]",
+        parse_template(query_name))
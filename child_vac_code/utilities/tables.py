@@ -1,4 +1,4 @@
-from child_vac_code.utilities.processing import create_output_crosstab
+from child_vac_code.utilities import output_specs
 
 """
 This module contains all the user defined inputs for each table.
@@ -568,8 +568,11 @@ def get_tables_flu():
 
 
 """
-    The following functions contain the user defined inputs that determine the
-    dataframe content for each output. The arguments are defined as:
+    The following specs contain the user defined inputs that determine the
+    dataframe content for each output: the processing function that creates
+    the output ("function") and its arguments. The specs are registered and
+    checked in output_specs.py, and the functions after the specs create each
+    output from its spec. The arguments are defined as:
 
 org_type: str
     Determines which of the pre-defined org types the data will be filtered to.
@@ -643,2295 +646,2113 @@ Returns:
 """
 
 
-# Create df of population data (thousands) for 12m vaccines for England
+TABLE_SPECS = {
+    # Create df of population data (thousands) for 12m vaccines for England
+    "create_table_population_12m_england_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 12m vaccines for England
+    "create_table_coverage_12m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 24m vaccines for England
+    "create_table_population_24m_england_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ('DTaP_IPV_Hib_HepB_24m')",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 24m vaccines for England
+    "create_table_coverage_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 5y vaccines for England
+    "create_table_population_5y_england_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 5y vaccines for England
+    "create_table_coverage_5y_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for DTaP 24m for England
+    "create_table_coverage_dtap_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for MMR 24m for England
+    "create_table_coverage_mmr_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for DTaP 24m by region
+    "create_table_coverage_dtap_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Parent_Org_Code",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": ["E12000001", "E12000002", "E12000003", "E12000004",
+                         "E12000005", "E12000006", "E12000007", "E12000008",
+                         "E12000009"],
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for MMR 24m by region
+    "create_table_coverage_mmr_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Parent_Org_Code",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": ["E12000001", "E12000002", "E12000003", "E12000004",
+                         "E12000005", "E12000006", "E12000007", "E12000008",
+                         "E12000009"],
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 12m vaccines for UK
+    "create_table_population_12m_uk_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": None,
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 12m vaccines
+    # for Wales, Scotland, and N Ireland
+    "create_table_population_12m_other_nations_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "NAT",
+        "output_type": "Population",
+        "rows": ["Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {
+            "Org_Name": [
+                "Wales",
+                "Scotland",
+                "Northern Ireland"
+            ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 12m vaccines for UK
+    "create_table_coverage_12m_uk": {
+        "function": "create_output_crosstab",
+        "org_type": None,
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 12m vaccines for Wales, Scotland, and N Ireland
+    "create_table_coverage_12m_other_nations": {
+        "function": "create_output_crosstab",
+        "org_type": "NAT",
+        "output_type": "Coverage",
+        "rows": ["Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {
+            "Org_Name": [
+                "Wales",
+                "Scotland",
+                "Northern Ireland"
+            ]},
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 24m vaccines for UK
+    "create_table_population_24m_uk_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": None,
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 24m vaccines
+    # for Wales, Scotland, and N Ireland
+    "create_table_population_24m_other_nations_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "NAT",
+        "output_type": "Population",
+        "rows": ["Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {
+            "Org_Name": [
+                "Wales",
+                "Scotland",
+                "Northern Ireland"
+            ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 24m vaccines for UK
+    "create_table_coverage_24m_uk": {
+        "function": "create_output_crosstab",
+        "org_type": None,
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 24m vaccines for Wales, Scotland, and N Ireland
+    "create_table_coverage_24m_other_nations": {
+        "function": "create_output_crosstab",
+        "org_type": "NAT",
+        "output_type": "Coverage",
+        "rows": ["Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {
+            "Org_Name": [
+                "Wales",
+                "Scotland",
+                "Northern Ireland"
+            ]},
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 5y vaccines for UK
+    "create_table_population_5y_uk_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": None,
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 5y vaccines
+    # for Wales, Scotland, and N Ireland
+    "create_table_population_5y_other_nations_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "NAT",
+        "output_type": "Population",
+        "rows": ["Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {
+            "Org_Name": [
+                "Wales",
+                "Scotland",
+                "Northern Ireland"
+            ]},
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 5y vaccines for UK
+    "create_table_coverage_5y_uk": {
+        "function": "create_output_crosstab",
+        "org_type": None,
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 5y vaccines for Wales, Scotland, and N Ireland
+    "create_table_coverage_5y_other_nations": {
+        "function": "create_output_crosstab",
+        "org_type": "NAT",
+        "output_type": "Coverage",
+        "rows": ["Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": {
+            "Org_Name": [
+                "Wales",
+                "Scotland",
+                "Northern Ireland"
+            ]},
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for DTaP 12m for England
+    "create_table_coverage_dtap_12m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 12m vaccines by region
+    "create_table_population_12m_regions_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 12m vaccines by region
+    "create_table_coverage_12m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 12m vaccines by LA
+    "create_table_population_12m_las_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 12m vaccines by LA
+    "create_table_coverage_12m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 12m vaccines for England
+    "create_table_population_12m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 12m vaccines for England
+    "create_table_vaccinated_12m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 12m vaccines by region
+    "create_table_population_12m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 12m vaccines by region
+    "create_table_vaccinated_12m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 12m vaccines by LA
+    "create_table_population_12m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 12m vaccines by LA
+    "create_table_vaccinated_12m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_12m",
+            "PCV_12m",
+            "Rota_12m",
+            "MenB_12m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 24m vaccines by region
+    "create_table_population_24m_regions_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 24m vaccines by region
+    "create_table_coverage_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 24m vaccines by LA
+    "create_table_population_24m_las_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 24m vaccines by LA
+    "create_table_coverage_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 5y vaccines by region
+    "create_table_population_5y_regions_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 5y vaccines by region
+    "create_table_coverage_5y_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data (thousands) for 5y vaccines by LA
+    "create_table_population_5y_las_thousands": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": 0.001,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for 5y vaccines by LA
+    "create_table_coverage_5y_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 5y vaccines for England
+    "create_table_population_5y_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Type"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 5y vaccines for England
+    "create_table_vaccinated_5y_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Type"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 5y vaccines by region
+    "create_table_population_5y_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 5y vaccines by region
+    "create_table_vaccinated_5y_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 5y vaccines by LA
+    "create_table_population_5y_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['MMR1_5y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 5y vaccines by LA
+    "create_table_vaccinated_5y_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_5y",
+            "DTaP_IPV_5y",
+            "MMR1_5y",
+            "MMR2_5y",
+            "Hib_MenC_5y"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 24m vaccines for England
+    "create_table_vaccinated_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 24m vaccines by region
+    "create_table_vaccinated_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for 24m vaccines by LA
+    "create_table_vaccinated_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": [
+            "DTaP_IPV_Hib_HepB_24m",
+            "MMR_24m",
+            "Hib_MenC_24m",
+            "PCV_24m",
+            "MenB_booster_24m"
+        ],
+        "column_rename": None,
+        "filter_condition": None,
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 24m vaccines for England
+    "create_table_population_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ('DTaP_IPV_Hib_HepB_24m')",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 24m vaccines by region
+    "create_table_population_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for 24m vaccines by LA
+    "create_table_population_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of population for 3 month bcg vaccines in LAs (no multiplier)
+    "create_table_population_bcg_3m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Population'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of vaccinated for 3 month bcg vaccines in LAs (no multiplier)
+    "create_table_vaccinated_bcg_3m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Vaccinated'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of coverage for 3 month bcg vaccines in LAs
+    "create_table_coverage_bcg_3m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": ['BCG_3m'],
+        "column_rename": {'BCG_3m': 'Coverage'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of population for 3 month bcg vaccines in regions
+    "create_table_population_bcg_3m_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Population'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of vaccinated for 3 month bcg vaccines in regions
+    "create_table_vaccinated_bcg_3m_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Vaccinated'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of coverage for 3 month bcg vaccines in regions
+    "create_table_coverage_bcg_3m_reg": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": ['BCG_3m'],
+        "column_rename": {'BCG_3m': 'Coverage'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of population for 3 month bcg vaccines for England
+    "create_table_population_bcg_3m_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Population'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of vaccinated for 3 month bcg vaccines in England
+    "create_table_vaccinated_bcg_3m_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Vaccinated'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # To create df of coverage for 3 month bcg vaccines in England
+    "create_table_coverage_bcg_3m_eng": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'BCG_3m': 'Coverage'},
+        "filter_condition": "Vac_Type in ['BCG_3m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for HepB 12m by LA
+    # Vaccine_Status will be moved to end of output in output_specific_updates
+    "create_table_population_hepb_12m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'HepB_Group2_12m': 'Population'},
+        "filter_condition": "Vac_Type in ['HepB_Group2_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for HepB 12m by LA
+    # Vaccine_Status will be moved to end of output in output_specific_updates
+    "create_table_vaccinated_hepb_12m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'HepB_Group2_12m': 'Vaccinated'},
+        "filter_condition": "Vac_Type in ['HepB_Group2_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for HepB 12m by LA
+    # Vaccine_Status will be moved to end of output in output_specific_updates
+    "create_table_coverage_hepb_12m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": ['HepB_Group2_12m'],
+        "column_rename": {'HepB_Group2_12m': 'Coverage'},
+        "filter_condition": "Vac_Type in ['HepB_Group2_12m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for HepB 24m by LA
+    # Vaccine_Status will be moved to end of output in output_specific_updates
+    "create_table_population_hepb_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'HepB_Group2_24m': 'Population'},
+        "filter_condition": "Vac_Type in ['HepB_Group2_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for HepB 24m by LA
+    # Vaccine_Status will be moved to end of output in output_specific_updates
+    "create_table_vaccinated_hepb_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": {'HepB_Group2_24m': 'Vaccinated'},
+        "filter_condition": "Vac_Type in ['HepB_Group2_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for HepB 24m by LA
+    # Vaccine_Status will be moved to end of output in output_specific_updates
+    "create_table_coverage_hepb_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": ['HepB_Group2_24m'],
+        "column_rename": {'HepB_Group2_24m': 'Coverage'},
+        "filter_condition": "Vac_Type in ['HepB_Group2_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for flu 24m for England
+    "create_table_population_flu_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for flu 24m for England
+    "create_table_vaccinated_flu_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for flu 24m for England
+    "create_table_coverage_flu_24m_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for flu 24m by region
+    "create_table_population_flu_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for flu 24m by region
+    "create_table_vaccinated_flu_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for flu 24m by region
+    "create_table_coverage_flu_24m_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for flu 24m by LA
+    "create_table_population_flu_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for flu 24m by LA
+    "create_table_vaccinated_flu_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for flu 24m by LA
+    "create_table_coverage_flu_24m_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_24m']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for flu 3y for England
+    "create_table_population_flu_3y_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for flu 3y for England
+    "create_table_vaccinated_flu_3y_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for flu 3y for England
+    "create_table_coverage_flu_3y_england": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["FinancialYear"],
+        "columns": "Vac_Type",
+        "sort_on": None,
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for flu 3y by region
+    "create_table_population_flu_3y_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for flu 3y by region
+    "create_table_vaccinated_flu_3y_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for flu 3y by region
+    "create_table_coverage_flu_3y_regions": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Parent_Org_Code", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of population data for flu 3y by LA
+    "create_table_population_flu_3y_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Population",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of vaccinated data for flu 3y by LA
+    "create_table_vaccinated_flu_3y_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Vaccinated",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+
+    # Create df of coverage data for flu 3y by LA
+    "create_table_coverage_flu_3y_las": {
+        "function": "create_output_crosstab",
+        "org_type": "LA",
+        "output_type": "Coverage",
+        "rows": ["Org_Code", "Org_Name", "Parent_Org_Name"],
+        "columns": "Vac_Type",
+        "sort_on": ["Parent_Org_Code",
+                    "Org_Name"],
+        "row_order": None,
+        "column_order": None,
+        "column_rename": None,
+        "filter_condition": "Vac_Type in ['Flu_3y']",
+        "row_subgroup": None,
+        "column_subgroup": None,
+        "count_multiplier": None,
+        "ts_years": 1,
+    },
+}
+
+output_specs.register_specs(TABLE_SPECS)
+
+
+# The content functions used in the output lists, which create each
+# output from its spec
 def create_table_population_12m_england_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 12m vaccines for England
-def create_table_coverage_12m_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run(
+        "create_table_population_12m_england_thousands", df)
+
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_coverage_12m_england(df):
+    return output_specs.run("create_table_coverage_12m_england", df)
 
 
-# Create df of population data (thousands) for 24m vaccines for England
 def create_table_population_24m_england_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ('DTaP_IPV_Hib_HepB_24m')")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 24m vaccines for England
-def create_table_coverage_24m_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run(
+        "create_table_population_24m_england_thousands", df)
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+
+def create_table_coverage_24m_england(df):
+    return output_specs.run("create_table_coverage_24m_england", df)
 
 
-# Create df of population data (thousands) for 5y vaccines for England
 def create_table_population_5y_england_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 5y vaccines for England
-def create_table_coverage_5y_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run("create_table_population_5y_england_thousands", df)
+
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_coverage_5y_england(df):
+    return output_specs.run("create_table_coverage_5y_england", df)
 
 
-# Create df of coverage data for DTaP 24m for England
 def create_table_coverage_dtap_24m_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for MMR 24m for England
+    return output_specs.run("create_table_coverage_dtap_24m_england", df)
+
+
 def create_table_coverage_mmr_24m_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['MMR_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for DTaP 24m by region
+    return output_specs.run("create_table_coverage_mmr_24m_england", df)
+
+
 def create_table_coverage_dtap_24m_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Parent_Org_Code"
-    sort_on = None
-    row_order = None
-    column_order = ["E12000001", "E12000002", "E12000003", "E12000004",
-                    "E12000005", "E12000006", "E12000007", "E12000008",
-                    "E12000009"]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for MMR 24m by region
+    return output_specs.run("create_table_coverage_dtap_24m_regions", df)
+
+
 def create_table_coverage_mmr_24m_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Parent_Org_Code"
-    sort_on = None
-    row_order = None
-    column_order = ["E12000001", "E12000002", "E12000003", "E12000004",
-                    "E12000005", "E12000006", "E12000007", "E12000008",
-                    "E12000009"]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 12m vaccines for UK
+    return output_specs.run("create_table_coverage_mmr_24m_regions", df)
+
+
 def create_table_population_12m_uk_thousands(df):
-    org_type = None
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 12m vaccines
-# for Wales, Scotland, and N Ireland
+    return output_specs.run("create_table_population_12m_uk_thousands", df)
+
+
 def create_table_population_12m_other_nations_thousands(df):
-    org_type = "NAT"
-    output_type = "Population"
-    rows = ["Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {
-        "Org_Name": [
-            "Wales",
-            "Scotland",
-            "Northern Ireland"
-        ]}
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 12m vaccines for UK
-def create_table_coverage_12m_uk(df):
-    org_type = None
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run(
+        "create_table_population_12m_other_nations_thousands", df)
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
 
+def create_table_coverage_12m_uk(df):
+    return output_specs.run("create_table_coverage_12m_uk", df)
 
-# Create df of coverage data for 12m vaccines for Wales, Scotland, and N Ireland
-def create_table_coverage_12m_other_nations(df):
-    org_type = "NAT"
-    output_type = "Coverage"
-    rows = ["Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {
-        "Org_Name": [
-            "Wales",
-            "Scotland",
-            "Northern Ireland"
-        ]}
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_coverage_12m_other_nations(df):
+    return output_specs.run("create_table_coverage_12m_other_nations", df)
 
 
-# Create df of population data (thousands) for 24m vaccines for UK
 def create_table_population_24m_uk_thousands(df):
-    org_type = None
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 24m vaccines
-# for Wales, Scotland, and N Ireland
+    return output_specs.run("create_table_population_24m_uk_thousands", df)
+
+
 def create_table_population_24m_other_nations_thousands(df):
-    org_type = "NAT"
-    output_type = "Population"
-    rows = ["Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {
-        "Org_Name": [
-            "Wales",
-            "Scotland",
-            "Northern Ireland"
-        ]}
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 24m vaccines for UK
-def create_table_coverage_24m_uk(df):
-    org_type = None
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run(
+        "create_table_population_24m_other_nations_thousands", df)
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
 
+def create_table_coverage_24m_uk(df):
+    return output_specs.run("create_table_coverage_24m_uk", df)
 
-# Create df of coverage data for 24m vaccines for Wales, Scotland, and N Ireland
-def create_table_coverage_24m_other_nations(df):
-    org_type = "NAT"
-    output_type = "Coverage"
-    rows = ["Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {
-        "Org_Name": [
-            "Wales",
-            "Scotland",
-            "Northern Ireland"
-        ]}
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_coverage_24m_other_nations(df):
+    return output_specs.run("create_table_coverage_24m_other_nations", df)
 
 
-# Create df of population data (thousands) for 5y vaccines for UK
 def create_table_population_5y_uk_thousands(df):
-    org_type = None
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 5y vaccines
-# for Wales, Scotland, and N Ireland
+    return output_specs.run("create_table_population_5y_uk_thousands", df)
+
+
 def create_table_population_5y_other_nations_thousands(df):
-    org_type = "NAT"
-    output_type = "Population"
-    rows = ["Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {
-        "Org_Name": [
-            "Wales",
-            "Scotland",
-            "Northern Ireland"
-        ]}
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 5y vaccines for UK
-def create_table_coverage_5y_uk(df):
-    org_type = None
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run(
+        "create_table_population_5y_other_nations_thousands", df)
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
 
+def create_table_coverage_5y_uk(df):
+    return output_specs.run("create_table_coverage_5y_uk", df)
 
-# Create df of coverage data for 5y vaccines for Wales, Scotland, and N Ireland
-def create_table_coverage_5y_other_nations(df):
-    org_type = "NAT"
-    output_type = "Coverage"
-    rows = ["Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = {
-        "Org_Name": [
-            "Wales",
-            "Scotland",
-            "Northern Ireland"
-        ]}
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_coverage_5y_other_nations(df):
+    return output_specs.run("create_table_coverage_5y_other_nations", df)
 
 
-# Create df of coverage data for DTaP 12m for England
 def create_table_coverage_dtap_12m_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 12m vaccines by region
+    return output_specs.run("create_table_coverage_dtap_12m_england", df)
+
+
 def create_table_population_12m_regions_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 12m vaccines by region
+    return output_specs.run(
+        "create_table_population_12m_regions_thousands", df)
+
+
 def create_table_coverage_12m_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 12m vaccines by LA
+    return output_specs.run("create_table_coverage_12m_regions", df)
+
+
 def create_table_population_12m_las_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 12m vaccines by LA
+    return output_specs.run("create_table_population_12m_las_thousands", df)
+
+
 def create_table_coverage_12m_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 12m vaccines for England
+    return output_specs.run("create_table_coverage_12m_las", df)
+
+
 def create_table_population_12m_england(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 12m vaccines for England
-def create_table_vaccinated_12m_england(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run("create_table_population_12m_england", df)
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+
+def create_table_vaccinated_12m_england(df):
+    return output_specs.run("create_table_vaccinated_12m_england", df)
 
 
-# Create df of population data for 12m vaccines by region
 def create_table_population_12m_regions(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 12m vaccines by region
+    return output_specs.run("create_table_population_12m_regions", df)
+
+
 def create_table_vaccinated_12m_regions(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 12m vaccines by LA
+    return output_specs.run("create_table_vaccinated_12m_regions", df)
+
+
 def create_table_population_12m_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 12m vaccines by LA
+    return output_specs.run("create_table_population_12m_las", df)
+
+
 def create_table_vaccinated_12m_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_12m",
-        "PCV_12m",
-        "Rota_12m",
-        "MenB_12m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 24m vaccines by region
+    return output_specs.run("create_table_vaccinated_12m_las", df)
+
+
 def create_table_population_24m_regions_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 24m vaccines by region
+    return output_specs.run(
+        "create_table_population_24m_regions_thousands", df)
+
+
 def create_table_coverage_24m_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 24m vaccines by LA
+    return output_specs.run("create_table_coverage_24m_regions", df)
+
+
 def create_table_population_24m_las_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 24m vaccines by LA
+    return output_specs.run("create_table_population_24m_las_thousands", df)
+
+
 def create_table_coverage_24m_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 5y vaccines by region
+    return output_specs.run("create_table_coverage_24m_las", df)
+
+
 def create_table_population_5y_regions_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 5y vaccines by region
+    return output_specs.run("create_table_population_5y_regions_thousands", df)
+
+
 def create_table_coverage_5y_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data (thousands) for 5y vaccines by LA
+    return output_specs.run("create_table_coverage_5y_regions", df)
+
+
 def create_table_population_5y_las_thousands(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = 0.001
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for 5y vaccines by LA
+    return output_specs.run("create_table_population_5y_las_thousands", df)
+
+
 def create_table_coverage_5y_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 5y vaccines for England
+    return output_specs.run("create_table_coverage_5y_las", df)
+
+
 def create_table_population_5y_england(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Type"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 5y vaccines for England
-def create_table_vaccinated_5y_england(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Type"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run("create_table_population_5y_england", df)
+
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_vaccinated_5y_england(df):
+    return output_specs.run("create_table_vaccinated_5y_england", df)
 
 
-# Create df of population data for 5y vaccines by region
 def create_table_population_5y_regions(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 5y vaccines by region
+    return output_specs.run("create_table_population_5y_regions", df)
+
+
 def create_table_vaccinated_5y_regions(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 5y vaccines by LA
+    return output_specs.run("create_table_vaccinated_5y_regions", df)
+
+
 def create_table_population_5y_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['MMR1_5y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 5y vaccines by LA
+    return output_specs.run("create_table_population_5y_las", df)
+
+
 def create_table_vaccinated_5y_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_5y",
-        "DTaP_IPV_5y",
-        "MMR1_5y",
-        "MMR2_5y",
-        "Hib_MenC_5y"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 24m vaccines for England
-def create_table_vaccinated_24m_england(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
+    return output_specs.run("create_table_vaccinated_5y_las", df)
+
 
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+def create_table_vaccinated_24m_england(df):
+    return output_specs.run("create_table_vaccinated_24m_england", df)
 
 
-# Create df of vaccinated data for 24m vaccines by region
 def create_table_vaccinated_24m_regions(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for 24m vaccines by LA
+    return output_specs.run("create_table_vaccinated_24m_regions", df)
+
+
 def create_table_vaccinated_24m_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = [
-        "DTaP_IPV_Hib_HepB_24m",
-        "MMR_24m",
-        "Hib_MenC_24m",
-        "PCV_24m",
-        "MenB_booster_24m"
-    ]
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 24m vaccines for England
+    return output_specs.run("create_table_vaccinated_24m_las", df)
+
+
 def create_table_population_24m_england(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ('DTaP_IPV_Hib_HepB_24m')")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 24m vaccines by region
+    return output_specs.run("create_table_population_24m_england", df)
+
+
 def create_table_population_24m_regions(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for 24m vaccines by LA
+    return output_specs.run("create_table_population_24m_regions", df)
+
+
 def create_table_population_24m_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['DTaP_IPV_Hib_HepB_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of population for 3 month bcg vaccines in LAs (no multiplier)
+    return output_specs.run("create_table_population_24m_las", df)
+
+
 def create_table_population_bcg_3m_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Population'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of vaccinated for 3 month bcg vaccines in LAs (no multiplier)
+    return output_specs.run("create_table_population_bcg_3m_las", df)
+
+
 def create_table_vaccinated_bcg_3m_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Vaccinated'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of coverage for 3 month bcg vaccines in LAs
+    return output_specs.run("create_table_vaccinated_bcg_3m_las", df)
+
+
 def create_table_coverage_bcg_3m_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = ['BCG_3m']
-    column_rename = {'BCG_3m': 'Coverage'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of population for 3 month bcg vaccines in regions
+    return output_specs.run("create_table_coverage_bcg_3m_las", df)
+
+
 def create_table_population_bcg_3m_reg(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Population'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of vaccinated for 3 month bcg vaccines in regions
+    return output_specs.run("create_table_population_bcg_3m_reg", df)
+
+
 def create_table_vaccinated_bcg_3m_reg(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Vaccinated'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of coverage for 3 month bcg vaccines in regions
+    return output_specs.run("create_table_vaccinated_bcg_3m_reg", df)
+
+
 def create_table_coverage_bcg_3m_reg(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = ['BCG_3m']
-    column_rename = {'BCG_3m': 'Coverage'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of population for 3 month bcg vaccines for England
+    return output_specs.run("create_table_coverage_bcg_3m_reg", df)
+
+
 def create_table_population_bcg_3m_eng(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Population'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of vaccinated for 3 month bcg vaccines in England
+    return output_specs.run("create_table_population_bcg_3m_eng", df)
+
+
 def create_table_vaccinated_bcg_3m_eng(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Vaccinated'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# To create df of coverage for 3 month bcg vaccines in England
+    return output_specs.run("create_table_vaccinated_bcg_3m_eng", df)
+
+
 def create_table_coverage_bcg_3m_eng(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = {'BCG_3m': 'Coverage'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['BCG_3m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for HepB 12m by LA
-# Vaccine_Status will be moved to end of output in output_specific_updates
+    return output_specs.run("create_table_coverage_bcg_3m_eng", df)
+
+
 def create_table_population_hepb_12m_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {'HepB_Group2_12m': 'Population'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['HepB_Group2_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for HepB 12m by LA
-# Vaccine_Status will be moved to end of output in output_specific_updates
+    return output_specs.run("create_table_population_hepb_12m_las", df)
+
+
 def create_table_vaccinated_hepb_12m_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {'HepB_Group2_12m': 'Vaccinated'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['HepB_Group2_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for HepB 12m by LA
-# Vaccine_Status will be moved to end of output in output_specific_updates
+    return output_specs.run("create_table_vaccinated_hepb_12m_las", df)
+
+
 def create_table_coverage_hepb_12m_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = ['HepB_Group2_12m']
-    column_rename = {'HepB_Group2_12m': 'Coverage'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['HepB_Group2_12m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for HepB 24m by LA
-# Vaccine_Status will be moved to end of output in output_specific_updates
+    return output_specs.run("create_table_coverage_hepb_12m_las", df)
+
+
 def create_table_population_hepb_24m_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {'HepB_Group2_24m': 'Population'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['HepB_Group2_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for HepB 24m by LA
-# Vaccine_Status will be moved to end of output in output_specific_updates
+    return output_specs.run("create_table_population_hepb_24m_las", df)
+
+
 def create_table_vaccinated_hepb_24m_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = {'HepB_Group2_24m': 'Vaccinated'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['HepB_Group2_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for HepB 24m by LA
-# Vaccine_Status will be moved to end of output in output_specific_updates
+    return output_specs.run("create_table_vaccinated_hepb_24m_las", df)
+
+
 def create_table_coverage_hepb_24m_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name", "Vaccine_Status"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = ['HepB_Group2_24m']
-    column_rename = {'HepB_Group2_24m': 'Coverage'}
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['HepB_Group2_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for flu 24m for England
+    return output_specs.run("create_table_coverage_hepb_24m_las", df)
+
+
 def create_table_population_flu_24m_england(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for flu 24m for England
+    return output_specs.run("create_table_population_flu_24m_england", df)
+
+
 def create_table_vaccinated_flu_24m_england(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for flu 24m for England
+    return output_specs.run("create_table_vaccinated_flu_24m_england", df)
+
+
 def create_table_coverage_flu_24m_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for flu 24m by region
+    return output_specs.run("create_table_coverage_flu_24m_england", df)
+
+
 def create_table_population_flu_24m_regions(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for flu 24m by region
+    return output_specs.run("create_table_population_flu_24m_regions", df)
+
+
 def create_table_vaccinated_flu_24m_regions(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for flu 24m by region
+    return output_specs.run("create_table_vaccinated_flu_24m_regions", df)
+
+
 def create_table_coverage_flu_24m_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for flu 24m by LA
+    return output_specs.run("create_table_coverage_flu_24m_regions", df)
+
+
 def create_table_population_flu_24m_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for flu 24m by LA
+    return output_specs.run("create_table_population_flu_24m_las", df)
+
+
 def create_table_vaccinated_flu_24m_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for flu 24m by LA
+    return output_specs.run("create_table_vaccinated_flu_24m_las", df)
+
+
 def create_table_coverage_flu_24m_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_24m']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for flu 3y for England
+    return output_specs.run("create_table_coverage_flu_24m_las", df)
+
+
 def create_table_population_flu_3y_england(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for flu 3y for England
+    return output_specs.run("create_table_population_flu_3y_england", df)
+
+
 def create_table_vaccinated_flu_3y_england(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for flu 3y for England
+    return output_specs.run("create_table_vaccinated_flu_3y_england", df)
+
+
 def create_table_coverage_flu_3y_england(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["FinancialYear"]
-    columns = "Vac_Type"
-    sort_on = None
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for flu 3y by region
+    return output_specs.run("create_table_coverage_flu_3y_england", df)
+
+
 def create_table_population_flu_3y_regions(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for flu 3y by region
+    return output_specs.run("create_table_population_flu_3y_regions", df)
+
+
 def create_table_vaccinated_flu_3y_regions(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for flu 3y by region
+    return output_specs.run("create_table_vaccinated_flu_3y_regions", df)
+
+
 def create_table_coverage_flu_3y_regions(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Parent_Org_Code", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of population data for flu 3y by LA
+    return output_specs.run("create_table_coverage_flu_3y_regions", df)
+
+
 def create_table_population_flu_3y_las(df):
-    org_type = "LA"
-    output_type = "Population"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of vaccinated data for flu 3y by LA
+    return output_specs.run("create_table_population_flu_3y_las", df)
+
+
 def create_table_vaccinated_flu_3y_las(df):
-    org_type = "LA"
-    output_type = "Vaccinated"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
-
-
-# Create df of coverage data for flu 3y by LA
+    return output_specs.run("create_table_vaccinated_flu_3y_las", df)
+
+
 def create_table_coverage_flu_3y_las(df):
-    org_type = "LA"
-    output_type = "Coverage"
-    rows = ["Org_Code", "Org_Name", "Parent_Org_Name"]
-    columns = "Vac_Type"
-    sort_on = ["Parent_Org_Code",
-               "Org_Name"]
-    row_order = None
-    column_order = None
-    column_rename = None
-    row_subgroup = None
-    column_subgroup = None
-    filter_condition = (
-        "Vac_Type in ['Flu_3y']")
-    row_subgroup = None
-    column_subgroup = None
-    count_multiplier = None
-    ts_years = 1
-
-    return create_output_crosstab(df, org_type, output_type, rows, columns,
-                                  sort_on, row_order, column_order,
-                                  column_rename, filter_condition, row_subgroup,
-                                  column_subgroup, count_multiplier, ts_years)
+    return output_specs.run("create_table_coverage_flu_3y_las", df)
@@ -3,7 +3,7 @@ import pandas as pd
 import xlwings as xw
 from datetime import datetime
 
-from child_vac_code.utilities import helpers, processing
+from child_vac_code.utilities import helpers, output_specs, predicates, processing
 import child_vac_code.parameters as param
 
 """
@@ -61,6 +61,11 @@ contents: list[str]
 
 """
 
+# Filter of the vaccines included in the outliers and YoY checks, checked
+# against the columns of the data when the module is imported
+EXCLUDE_VACCS_FILTER = "Vac_Type not in ({0})".format(param.EXCLUDE_VACCS_VAL)
+predicates.compile_predicate(EXCLUDE_VACCS_FILTER, output_specs.FILTER_COLUMNS)
+
 
 def get_validations_main():
     """
@@ -151,7 +156,7 @@ def create_outliers(df_combined):
     column_rename = None
     row_subgroup = None
     column_subgroup = None
-    filter_condition = "Vac_Type not in ({0})".format(param.EXCLUDE_VACCS_VAL)
+    filter_condition = EXCLUDE_VACCS_FILTER
     row_subgroup = None
     column_subgroup = None
     count_multiplier = None
@@ -253,7 +258,7 @@ def create_yoy_check(df_combined):
         column_rename = None
         row_subgroup = None
         column_subgroup = None
-        filter_condition = "Vac_Type not in ({0})".format(param.EXCLUDE_VACCS_VAL)
+        filter_condition = EXCLUDE_VACCS_FILTER
         row_subgroup = None
         column_subgroup = None
         count_multiplier = None
@@ -1,7 +1,7 @@
 import pandas as pd
 import xlwings as xw
 import child_vac_code.parameters as param
-from child_vac_code.utilities import helpers, processing
+from child_vac_code.utilities import helpers, output_specs, processing
 from child_vac_code.utilities.write import write_format
 import logging
 
@@ -308,6 +308,9 @@ def write_outputs(df, output_args, output_path, year):
     None
 
     """
+    # Log the aggregations needed by the outputs before any are run
+    output_specs.log_plan(output_args, df.columns)
+
     # For each item in the output_args dictionary
     for output in output_args:
         # Extract all the required arguments from the output_args dictionary
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+from child_vac_code.utilities import cube, processing
+
+
+@pytest.fixture
+def df_cover(monkeypatch):
+    """
+    Pre-processed COVER style data with duplicate and null dimension values,
+    and the cube built from it for the test
+    """
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+    df = pd.DataFrame(
+        {
+            "FinancialYear": ["2020-21", "2021-22", "2022-23", "2022-23",
+                              "2022-23", "2022-23", "2022-23"],
+            "Org_Type": ["LA", "LA", "LA", "LA", "LA", "LA", "NAT"],
+            "Org_Code": ["E06000001", "E06000001", "E06000001", "E06000001",
+                         "E06000002", "E06000002", "W92000004"],
+            "Vac_Type": ["HepB_Group2_12m", "HepB_Group2_12m",
+                         "HepB_Group2_12m", "HepB_Group2_12m", "PCV_12m",
+                         "HepB_Group2_12m", "PCV_12m"],
+            "Vaccine_Status": ["Full data submitted", "Full data submitted",
+                               "Full data submitted", "Full data submitted",
+                               np.nan, np.nan, np.nan],
+            "Number_Population": [100, 110, 120, 5, 300, 40, 1000],
+            "Number_Vaccinated": [90, 100, 110, 4, 250, 35, 900],
+        }
+    ).astype({"Org_Code": "category", "Vac_Type": "category",
+              "Vaccine_Status": "category"})
+    yield df
+    cube.clear()
+
+
+def test_build_cube(df_cover):
+    """
+    Tests that build_cube sums the counts by each combination of the
+    dimensions, keeping combinations with nulls
+    """
+    actual = cube.build_cube(df_cover, ["FinancialYear", "Vaccine_Status"],
+                             ["Number_Population"])
+
+    expected = pd.DataFrame(
+        {
+            "FinancialYear": ["2020-21", "2021-22", "2022-23", "2022-23"],
+            "Vaccine_Status": pd.Categorical(
+                ["Full data submitted", "Full data submitted",
+                 "Full data submitted", np.nan],
+                categories=["Full data submitted"]),
+            "Number_Population": [100, 110, 125, 1340],
+        }
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_aggregate_crosstab_data_cube(df_cover):
+    """
+    Tests that aggregating crosstab data from the cube gives the same result
+    as aggregating the full data, and that reused aggregations aren't changed
+    by the outputs
+    """
+    specs = [("LA", None, ["FinancialYear", "Vac_Type"], 2),
+             ("LA", None, ["Org_Code", "Vaccine_Status"], 1),
+             (None, "Vac_Type in ['PCV_12m']", ["Org_Type"], 3),
+             ("LA", "Number_Population > 50", ["Vac_Type"], 1)]
+    expected = [processing.aggregate_crosstab_data(df_cover, *spec)
+                for spec in specs]
+
+    cube.register(df_cover)
+
+    for spec, df_expected in zip(specs, expected):
+        actual = processing.aggregate_crosstab_data(df_cover, *spec)
+        pd.testing.assert_frame_equal(actual, df_expected)
+        actual["Number_Vaccinated"] = 0
+
+        actual = processing.aggregate_crosstab_data(df_cover, *spec)
+        pd.testing.assert_frame_equal(actual, df_expected)
+
+    with pytest.raises(ValueError):
+        processing.aggregate_crosstab_data(df_cover, "ICB", None,
+                                           ["Vac_Type"], 1)
@@ -0,0 +1,284 @@
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+import child_vac_code.utilities.data_connections as dbc
+from child_vac_code.utilities import load
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path, monkeypatch):
+    """
+    Points the data connections at an empty SQLite stand-in database folder,
+    and closes the connections after the test
+    """
+    monkeypatch.setattr(param, "DATA_BACKEND", "sqlite")
+    monkeypatch.setattr(param, "SQLITE_DIR", tmp_path)
+    monkeypatch.setattr(param, "USE_SNAPSHOTS", False)
+    monkeypatch.setattr(param, "USE_ASSET_STORE", False)
+    monkeypatch.setattr(param, "ORG_REF_CACHE_DIR", tmp_path / "OrgRefCache")
+    yield tmp_path
+    dbc.dispose_engines()
+
+
+def test_sqlite_prepare_query():
+    """
+    Tests that the SQLite backend replaces fully qualified SQL Server table
+    names with the table name
+    """
+    query = "SELECT [Org_Code] FROM [DATABASE].[dbo].[TABLE] WHERE [A] = 'x'"
+
+    expected = "SELECT [Org_Code] FROM [TABLE] WHERE [A] = 'x'"
+
+    actual = dbc.SQLiteBackend().prepare_query(query)
+
+    assert actual == expected
+
+
+def test_get_backend():
+    """
+    Tests that get_backend returns the named backend and rejects unknown
+    backends
+    """
+    assert isinstance(dbc.get_backend("mssql"), dbc.MSSQLBackend)
+    assert isinstance(dbc.get_backend("sqlite"), dbc.SQLiteBackend)
+
+    with pytest.raises(ValueError):
+        dbc.get_backend("oracle")
+
+
+def test_import_asset_data_sqlite(sqlite_backend):
+    """
+    Tests that the asset sql template runs against the SQLite stand-in,
+    returning only the requested years and actual data
+    """
+    asset = pd.DataFrame(
+        {
+            "FinancialYearStart": ["01APR2020", "01APR2021", "01APR2021",
+                                   "01APR2021"],
+            "Parent_Org_Code": ["E12000001"] * 4,
+            "Org_Code": ["E06000001"] * 4,
+            "Org_Name": ["Hartlepool"] * 4,
+            "Org_Type": ["LA"] * 4,
+            "Child_Age": ["12m"] * 4,
+            "Vac_Type": ["MMR1_24m", "MMR1_24m", "PCV_12m", "PCV_12m"],
+            "Data_Type": ["Actual", "Actual", "Actual", "Projected"],
+            "Number_Population": [100, 110, 120, 130],
+            "Number_Vaccinated": [90, 95, 100, 105],
+        }
+    )
+    dbc.seed_sqlite_database(param.DATABASE, {param.TABLE: asset},
+                             sqlite_backend)
+
+    expected = asset.iloc[[1, 2]].reset_index(drop=True)
+
+    actual = load.import_asset_data(["01APR2021"], chunksize=None)
+
+    pd.testing.assert_frame_equal(actual.reset_index(drop=True), expected)
+
+
+def test_import_asset_data_store_empty_year(sqlite_backend, monkeypatch):
+    """
+    Tests that a past year with no asset data isn't added to the asset store,
+    so it is imported again once it has been loaded to the asset
+    """
+    monkeypatch.setattr(param, "USE_ASSET_STORE", True)
+    monkeypatch.setattr(param, "ASSET_STORE_DIR", sqlite_backend / "Store")
+    monkeypatch.setattr(param, "ASSET_STORE_INVALIDATE", [])
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+
+    def asset_data(years):
+        return pd.DataFrame(
+            {
+                "FinancialYearStart": years,
+                "Parent_Org_Code": ["E12000001"] * len(years),
+                "Org_Code": ["E06000001"] * len(years),
+                "Org_Name": ["Hartlepool"] * len(years),
+                "Org_Type": ["LA"] * len(years),
+                "Child_Age": ["12m"] * len(years),
+                "Vac_Type": ["PCV_12m"] * len(years),
+                "Data_Type": ["Actual"] * len(years),
+                "Number_Population": [100] * len(years),
+                "Number_Vaccinated": [90] * len(years),
+            }
+        )
+
+    year_range = ["01APR2020", "01APR2021"]
+    for years in [["01APR2020"], ["01APR2020", "01APR2021"]]:
+        dbc.seed_sqlite_database(param.DATABASE,
+                                 {param.TABLE: asset_data(years)},
+                                 sqlite_backend)
+
+        actual = load.import_asset_data(year_range, chunksize=None)
+
+        assert actual["FinancialYearStart"].tolist() == years
+
+
+def test_import_org_ref_data_sqlite(sqlite_backend):
+    """
+    Tests that the organisation reference sql template runs against the
+    SQLite stand-in, returning the latest version of organisations that were
+    valid at the end of the financial year
+    """
+    org_ref = pd.DataFrame(
+        {
+            "GEOGRAPHY_CODE": ["E06000001", "E06000001", "E06000002",
+                               "E06000003", "E99000001"],
+            "GEOGRAPHY_NAME": ["Hartlepool old", "Hartlepool",
+                               "Middlesbrough", "Closed LA", "Other"],
+            "PARENT_GEOGRAPHY_CODE": ["E12000001"] * 5,
+            "ENTITY_CODE": ["E06", "E06", "E06", "E06", "E99"],
+            "DATE_OF_OPERATION": ["2009-04-01", "2019-04-01", "2009-04-01",
+                                  "2009-04-01", "2009-04-01"],
+            "DATE_OF_TERMINATION": [None, None, None, "2022-04-01", None],
+        }
+    )
+    dbc.seed_sqlite_database(param.CORP_REF_DATABASE,
+                             {param.ONS_ORG_TABLE: org_ref}, sqlite_backend)
+
+    actual = load.import_org_ref_data("2022-23")
+
+    assert list(actual["Org_Code"]) == ["E06000001", "E06000002"]
+    assert list(actual["Org_Name"]) == ["Hartlepool", "Middlesbrough"]
+
+    # The data is cached, so is returned on the next import even if the
+    # source has changed
+    dbc.seed_sqlite_database(param.CORP_REF_DATABASE,
+                             {param.ONS_ORG_TABLE: org_ref.iloc[:1]},
+                             sqlite_backend)
+
+    cached = load.import_org_ref_data("2022-23")
+
+    pd.testing.assert_frame_equal(cached, actual)
+
+
+def test_seed_sqlite_database_from_csv(sqlite_backend):
+    """
+    Tests that seed_sqlite_database loads a csv fixture file into the
+    SQLite stand-in
+    """
+    fixture = sqlite_backend / "raw.csv"
+    pd.DataFrame({"FinancialYearStart": ["01APR2022", "01APR2022"],
+                  "Org_Code_ONS": ["E06000001", "E06000001"],
+                  "Org_Name": ["Hartlepool", "Hartlepool"],
+                  "Org_Type": ["LA", "LA"],
+                  "Data_Type": ["Actual", "Actual"],
+                  "Child_Age": ["12m", "12m"],
+                  "Measure": ["PCV_12m", "Denom_12m"],
+                  "Denominator": [100, 100],
+                  "Value": [90, 100]}).to_csv(fixture, index=False)
+    dbc.seed_sqlite_database(param.DATABASE, {param.TABLE_RAW: fixture},
+                             sqlite_backend)
+
+    actual = load.import_raw_cover_data("01APR2022")
+
+    assert list(actual["Vac_Type"]) == ["PCV_12m"]
+    assert list(actual["Number_Vaccinated"]) == [90]
+
+
+def test_df_from_sql_arrow_fetch(sqlite_backend):
+    """
+    Tests that fetching with arrow gives the same dataframe as fetching with
+    pandas, with and without a column schema and when fetched in batches
+    """
+    data = pd.DataFrame(
+        {
+            "Org_Code": ["E06000001", "E06000002", None, "E06000001"],
+            "Vac_Type": ["MMR1_24m", "PCV_12m", "PCV_12m", "PCV_12m"],
+            "Number_Population": [100, 200, 300, 400],
+            "Number_Vaccinated": [90, None, 250, 380],
+            "Coverage": [90.0, 50.5, 83.3, 95.0],
+        }
+    )
+    dbc.seed_sqlite_database(param.DATABASE, {param.TABLE: data},
+                             sqlite_backend)
+    query = "SELECT * FROM [DATABASE].[dbo].[TABLE]"
+    column_types = {"Org_Code": "category",
+                    "Vac_Type": "category",
+                    "Number_Population": "int32",
+                    "Number_Vaccinated": "int32"}
+
+    for chunksize in [None, 3]:
+        expected = dbc.df_from_sql(query, param.SERVER, param.DATABASE,
+                                   fetch="pandas")
+        actual = dbc.df_from_sql(query, param.SERVER, param.DATABASE,
+                                 chunksize=chunksize, fetch="arrow")
+        pd.testing.assert_frame_equal(actual, expected)
+
+        expected = dbc.df_from_sql(query, param.SERVER, param.DATABASE,
+                                   column_types=column_types, fetch="pandas")
+        actual = dbc.df_from_sql(query, param.SERVER, param.DATABASE,
+                                 chunksize=chunksize,
+                                 column_types=column_types, fetch="arrow")
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_import_raw_cover_delta(sqlite_backend, monkeypatch):
+    """
+    Tests that the delta import of the raw data gives the same result as a
+    full import after organisations are changed, added and removed
+    """
+    monkeypatch.setattr(param, "RAW_DELTA_DIR", sqlite_backend / "RawDelta")
+    monkeypatch.setattr(param, "RAW_DELTA_IMPORT", True)
+
+    def raw_data(orgs_values):
+        return pd.DataFrame(
+            [["01APR2022", org_code, f"Name {org_code}", "LA", "Actual", "12m",
+              measure, 100, value]
+             for org_code, value in orgs_values
+             for measure in ["PCV_12m", "Rota_12m", "Denom_12m"]],
+            columns=["FinancialYearStart", "Org_Code_ONS", "Org_Name",
+                     "Org_Type", "Data_Type", "Child_Age", "Measure",
+                     "Denominator", "Value"])
+
+    def full_import():
+        monkeypatch.setattr(param, "RAW_DELTA_IMPORT", False)
+        df = load.import_raw_cover_data("01APR2022")
+        monkeypatch.setattr(param, "RAW_DELTA_IMPORT", True)
+        return df.sort_values(["Org_Code", "Vac_Type"]).reset_index(drop=True)
+
+    # Rows without an org code are replaced when they change, including when
+    # they are the only change
+    for orgs_values in [[("E06000001", 90), ("E06000002", 80)],
+                        [("E06000001", 95), ("E06000002", 80)],
+                        [("E06000002", 80), ("E06000003", 70)],
+                        [("E06000002", 80), (None, 60)],
+                        [("E06000002", 80), (None, 65)],
+                        [("E06000002", 85), (None, 65)],
+                        [("E06000002", 85)]]:
+        dbc.seed_sqlite_database(param.DATABASE,
+                                 {param.TABLE_RAW: raw_data(orgs_values)},
+                                 sqlite_backend)
+
+        actual = (load.import_raw_cover_data("01APR2022")
+                  .sort_values(["Org_Code", "Vac_Type"])
+                  .reset_index(drop=True))
+
+        pd.testing.assert_frame_equal(actual, full_import())
+
+
+def test_import_raw_cover_data_not_snapshotted(sqlite_backend, monkeypatch):
+    """
+    Tests that the current year raw data is fetched again when snapshots are
+    used, so a resubmission isn't served from a stale snapshot
+    """
+    monkeypatch.setattr(param, "USE_SNAPSHOTS", True)
+    monkeypatch.setattr(param, "SNAPSHOT_DIR", sqlite_backend / "Snapshots")
+    monkeypatch.setattr(param, "RAW_DELTA_IMPORT", False)
+
+    for value in [90, 95]:
+        raw = pd.DataFrame(
+            {"FinancialYearStart": ["01APR2022"],
+             "Org_Code_ONS": ["E06000001"],
+             "Org_Name": ["Hartlepool"],
+             "Org_Type": ["LA"],
+             "Data_Type": ["Actual"],
+             "Child_Age": ["12m"],
+             "Measure": ["PCV_12m"],
+             "Denominator": [100],
+             "Value": [value]})
+        dbc.seed_sqlite_database(param.DATABASE, {param.TABLE_RAW: raw},
+                                 sqlite_backend)
+
+        actual = load.import_raw_cover_data("01APR2022")
+
+        assert actual["Number_Vaccinated"].tolist() == [value]
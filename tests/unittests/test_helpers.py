@@ -413,6 +413,73 @@ def test_add_organisation_type():
     pd.testing.assert_frame_equal(actual, expected)
 
 
+def test_add_organisation_type_prefixes():
+    """
+    Tests the add_organisation_type function with a given organisation type
+    lookup, including missing codes and no level column
+    """
+
+    input_df = pd.DataFrame(
+        {
+            "Org_Code": ["E01000001", "W06000001", None, "E01000002"],
+        }
+    )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["E01000001", "W06000001", None, "E01000002"],
+            "Org_Type": ["LSOA", "LA", "Unknown", "LSOA"],
+        }
+    )
+
+    actual = helpers.add_organisation_type(
+        input_df,
+        org_code_column="Org_Code",
+        org_type_prefixes={"E01": ("LSOA", "LSOA"), "W06": ("LA", "Local")},
+        include_level=False,
+        missing_value="Unknown"
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_stack_column_groups():
+    """
+    Tests the stack_column_groups function, which stacks groups of columns
+    into rows
+    """
+
+    input_df = pd.DataFrame(
+        {
+            "Org_Code": ["A", "B"],
+            "Pop_2y": [10, 20],
+            "Vacc_2y": [5, 15],
+            "Pop_3y": [11, 21],
+            "Vacc_3y": [6, 16],
+        },
+        index=[3, 4]
+    )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["A", "B", "A", "B"],
+            "Pop": [10, 20, 11, 21],
+            "Vacc": [5, 15, 6, 16],
+            "Age": ["2y", "2y", "3y", "3y"],
+        }
+    )
+
+    actual = helpers.stack_column_groups(
+        input_df,
+        ["Org_Code"],
+        [{"Pop": "Pop_2y", "Vacc": "Vacc_2y"},
+         {"Pop": "Pop_3y", "Vacc": "Vacc_3y"}],
+        {"Age": ["2y", "3y"]}
+    )
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
 def test_round_half_up():
     """
     Tests the round_half_up function, using various example of postive and
@@ -434,6 +501,36 @@ def test_round_half_up():
     assert helpers.round_half_up(0.5, 1) == 0.5
 
 
+@pytest.mark.parametrize("decimals", [0, 1, 2, 3])
+def test_round_half_up_array(decimals):
+    """
+    Tests that round_half_up_array gives the same results as rounding each
+    number with Decimal (round_half_up), for random coverage percentages,
+    counts in thousands, numbers exactly half way between two roundings and
+    negative numbers, and that infinite and null values are unchanged
+    """
+    rng = np.random.default_rng(decimals)
+    numerators = rng.integers(0, 100000, 5000)
+    denominators = numerators + rng.integers(1, 1000, 5000)
+    values = np.concatenate([
+        100 * numerators / denominators,
+        rng.integers(0, 2000000, 5000) * 0.001,
+        (rng.integers(0, 10 ** 6, 5000) * 10 + 5) / 10 ** (decimals + 1),
+        -rng.uniform(0, 1000, 5000),
+    ])
+
+    expected = np.array([helpers.round_half_up(value, decimals)
+                         for value in values])
+
+    np.testing.assert_array_equal(
+        helpers.round_half_up_array(values, decimals), expected)
+
+    series = pd.Series([2.675, np.inf, -np.inf, np.nan], index=[3, 2, 1, 0])
+    pd.testing.assert_series_equal(
+        helpers.round_half_up(series, 2),
+        pd.Series([2.68, np.inf, -np.inf, np.nan], index=[3, 2, 1, 0]))
+
+
 def test_fyearstart_to_fyear():
     """
    Tests that the fyearstart_to_fyear function works as expected
@@ -452,6 +549,31 @@ def test_fyearstart_to_fyear():
     assert actual == expected
 
 
+def test_convert_year_format():
+    """
+    Tests that the convert_year_format function converts series (including
+    categorical series and nulls) and lists between the financial year start
+    and financial year formats
+    """
+    input_series = pd.Series(["01APR2021", "01APR1999", None, "01APR2021"],
+                             index=[3, 2, 1, 0], name="FinancialYearStart")
+
+    expected = pd.Series(["2021-22", "1999-00", np.nan, "2021-22"],
+                         index=[3, 2, 1, 0], name="FinancialYearStart")
+
+    actual = helpers.convert_year_format(input_series, "fyear")
+
+    pd.testing.assert_series_equal(actual, expected)
+
+    actual = helpers.convert_year_format(input_series.astype("category"),
+                                         "fyear")
+
+    pd.testing.assert_series_equal(actual, expected.astype("category"))
+
+    assert (helpers.convert_year_format(["2021-22", "1999-00"], "fyear_start")
+            == ["01APR2021", "01APR1999"])
+
+
 def test_expected_column_check():
     """
     Tests that the expected_column_check function works as expected, which checks
@@ -753,3 +875,56 @@ def test_flag_values_outsidelimits_includefalse():
         include_limits=False)
 
     pd.testing.assert_frame_equal(df_actual, df_expected)
+
+
+def test_apply_column_types():
+    """
+    Tests the apply_column_types function, which casts columns to the data
+    types declared in a schema, using int64 where values don't fit the
+    declared integer type and float64 where there are nulls
+    """
+    df_input = pd.DataFrame(
+        {
+            "Vac_Type":          ["MMR1_5y", "MMR2_5y", "MMR1_5y"],
+            "Number_Population": [100, 200, 300],
+            "Number_Vaccinated": [90, None, 250],
+            "Number_Large":      [1, 2, 2**40],
+        }
+    )
+
+    column_types = {"Vac_Type": "category",
+                    "Number_Population": "int32",
+                    "Number_Vaccinated": "int32",
+                    "Number_Large": "int32",
+                    "Not_In_Data": "int32"}
+
+    actual = helpers.apply_column_types(df_input, column_types)
+
+    assert actual["Vac_Type"].dtype == "category"
+    assert actual["Number_Population"].dtype == "int32"
+    assert actual["Number_Vaccinated"].dtype == "float64"
+    assert actual["Number_Large"].dtype == "int64"
+    assert "Not_In_Data" not in actual.columns
+
+
+def test_concat_categorical():
+    """
+    Tests the concat_categorical function, which retains categorical columns
+    when concatenating dataframes with different categories
+    """
+    df_1 = pd.DataFrame({"Vac_Type": pd.Categorical(["MMR1_5y", "MMR2_5y"]),
+                         "Total": [1, 2]})
+    df_2 = pd.DataFrame({"Vac_Type": pd.Categorical(["BCG_3m", "MMR1_5y"]),
+                         "Total": [3, 4]})
+
+    expected = pd.DataFrame(
+        {
+            "Vac_Type": pd.Categorical(["MMR1_5y", "MMR2_5y", "BCG_3m", "MMR1_5y"],
+                                       categories=["MMR1_5y", "MMR2_5y", "BCG_3m"]),
+            "Total": [1, 2, 3, 4],
+        }
+    )
+
+    actual = helpers.concat_categorical([df_1, df_2])
+
+    pd.testing.assert_frame_equal(actual, expected)
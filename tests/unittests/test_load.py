@@ -0,0 +1,77 @@
+import threading
+import time
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+from child_vac_code.utilities import load
+
+
+def test_import_flu(tmp_path, monkeypatch):
+    """
+    Tests the import_flu function, which should read only the expected
+    columns and convert counts with thousands separators to int64
+    """
+    file_path = tmp_path / "childhood_vaccination_flu_la.csv"
+    file_path.write_text(
+        "Year,Local Authority code,Local Authority name,"
+        "All 2 year olds (combined): Patients registered,"
+        "All 2 year olds (combined): Number vaccinated,"
+        "All 3 year olds (combined): Patients registered,"
+        "All 3 year olds (combined): Number vaccinated\n"
+        '2022-23,E06000001,Hartlepool,"1,234",500,"12,345","1,000"\n'
+        "2022-23,E06000002,Middlesbrough,900,450,800,400\n")
+    monkeypatch.setattr(param, "FLU_LA", file_path)
+
+    expected = pd.DataFrame(
+        {
+            "Year": ["2022-23", "2022-23"],
+            "Local Authority code": ["E06000001", "E06000002"],
+            "All 2 year olds (combined): Patients registered": [1234, 900],
+            "All 2 year olds (combined): Number vaccinated": [500, 450],
+            "All 3 year olds (combined): Patients registered": [12345, 800],
+            "All 3 year olds (combined): Number vaccinated": [1000, 400],
+        }
+    )
+
+    actual = load.import_flu()
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_import_flu_missing_column(tmp_path, monkeypatch):
+    """
+    Tests that import_flu raises an error if an expected column is missing
+    """
+    file_path = tmp_path / "childhood_vaccination_flu_la.csv"
+    file_path.write_text("Year,Local Authority code\n2022-23,E06000001\n")
+    monkeypatch.setattr(param, "FLU_LA", file_path)
+
+    with pytest.raises(ValueError, match="does not contain expected columns"):
+        load.import_flu()
+
+
+def test_run_concurrent_loads_first_failure():
+    """
+    Tests that the error of a failed load is raised without waiting for the
+    loads still running
+    """
+    slow_load_finished = threading.Event()
+
+    def slow_load():
+        time.sleep(2)
+        slow_load_finished.set()
+
+    def failing_load():
+        raise ValueError("Source not found")
+
+    start_time = time.perf_counter()
+    with pytest.raises(ValueError, match="Source not found"):
+        load.run_concurrent_loads({"slow": slow_load,
+                                   "failing": failing_load}, max_workers=2)
+
+    assert not slow_load_finished.is_set()
+    assert time.perf_counter() - start_time < 1
+
+    # All the results are returned when every load succeeds
+    assert load.run_concurrent_loads({"a": lambda: 1, "b": lambda: 2}) == {
+        "a": 1, "b": 2}
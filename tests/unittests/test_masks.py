@@ -0,0 +1,135 @@
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+from child_vac_code.utilities import masks, processing
+
+
+@pytest.fixture
+def df_cover(monkeypatch):
+    """
+    Pre-processed COVER style data, with copy-on-write mode on and the mask
+    cache cleared after the test
+    """
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+    monkeypatch.setattr(param, "CACHE_FILTER_MASKS", True)
+    masks.clear()
+    df = pd.DataFrame(
+        {
+            "FinancialYear": ["2021-22", "2022-23", "2022-23", "2022-23",
+                              "2022-23"],
+            "Org_Type": ["LA", "LA", "LA", "LA", "NAT"],
+            "Vac_Type": ["PCV_12m", "PCV_12m", "BCG_3m", "MMR_24m",
+                         "PCV_12m"],
+            "Number_Population": [100, 110, 120, 130, 1000],
+        }
+    ).astype({"FinancialYear": "category", "Org_Type": "category",
+              "Vac_Type": "category"})
+    with pd.option_context("mode.copy_on_write", True):
+        yield df
+    masks.clear()
+
+
+def filter_uncached(df, org_type, filter_condition, ts_years, monkeypatch):
+    """
+    Filters a dataframe without the mask cache
+    """
+    with monkeypatch.context() as context:
+        context.setattr(param, "CACHE_FILTER_MASKS", False)
+        return processing.filter_dataframe(df, org_type, filter_condition,
+                                           ts_years)
+
+
+def test_filter_dataframe_cached(df_cover):
+    """
+    Tests that filter_dataframe gives the same rows when the masks are reused,
+    and counts the hits and misses for each type of mask
+    """
+    filter_condition = "Vac_Type in ['PCV_12m', 'MMR_24m']"
+    expected = df_cover.iloc[[1, 3]]
+
+    for _ in range(2):
+        actual = processing.filter_dataframe(df_cover, "LA", filter_condition,
+                                             1)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    assert masks.get_stats() == {"year": {"hits": 1, "misses": 1},
+                                 "valid_org_types": {"hits": 1, "misses": 1},
+                                 "org_type": {"hits": 1, "misses": 1},
+                                 "filter_condition": {"hits": 1, "misses": 1}}
+
+    # A filter referencing a parameter selects the same rows as a query
+    actual = processing.filter_dataframe(
+        df_cover, None, "Vac_Type not in @param.SELECTIVE_VACCS", 2)
+    pd.testing.assert_frame_equal(
+        actual, df_cover.query("Vac_Type not in @param.SELECTIVE_VACCS"))
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda df: df.loc.__setitem__((1, "Vac_Type"), "BCG_3m"),
+        lambda df: df["Vac_Type"].replace({"PCV_12m": "Rota_12m"},
+                                          inplace=True),
+        lambda df: df["Vac_Type"].replace({"PCV_12m": "MMR_24m"},
+                                          inplace=True),
+        lambda df: df.replace({"Vac_Type": {"MMR_24m": "BCG_3m"}},
+                              inplace=True),
+        lambda df: df["Vac_Type"].__setitem__(3, "BCG_3m"),
+        lambda df: df.__setitem__("Vac_Type", df["Vac_Type"].iloc[::-1]
+                                  .to_numpy()),
+        lambda df: df.__setitem__("Org_Type", pd.Categorical(["NAT"] * 5)),
+        lambda df: df.drop(index=1, inplace=True),
+    ],
+)
+def test_filter_dataframe_cache_modified(df_cover, modify, monkeypatch):
+    """
+    Tests that the masks made from a column are recomputed automatically once
+    the data has been modified, including by in place changes to a column
+    """
+    filter_condition = "Vac_Type in ['PCV_12m', 'MMR_24m']"
+    processing.filter_dataframe(df_cover, None, filter_condition, 1)
+    processing.filter_dataframe(df_cover, "NAT", filter_condition, 1)
+
+    modify(df_cover)
+
+    for org_type in [None, "NAT"]:
+        actual = processing.filter_dataframe(df_cover, org_type,
+                                             filter_condition, 1)
+        expected = filter_uncached(df_cover, org_type, filter_condition, 1,
+                                   monkeypatch)
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_filter_dataframe_cache_unchanged_columns(df_cover):
+    """
+    Tests that masks are only recomputed when their own columns change, that
+    masks made from non-categorical columns aren't cached, and that the masks
+    can be invalidated explicitly
+    """
+    processing.filter_dataframe(df_cover, "LA", "Vac_Type in ['BCG_3m']", 1)
+    processing.filter_dataframe(df_cover, "LA", "Number_Population > 105", 1)
+
+    df_cover.replace({"Number_Population": {110: 50}}, inplace=True)
+    actual = processing.filter_dataframe(df_cover, "LA",
+                                         "Number_Population > 105", 1)
+    pd.testing.assert_frame_equal(actual, df_cover.iloc[[2, 3]])
+
+    processing.filter_dataframe(df_cover, "LA", "Vac_Type in ['BCG_3m']", 1)
+    assert masks.get_stats()["filter_condition"] == {"hits": 1, "misses": 1}
+    assert masks.get_stats()["org_type"] == {"hits": 3, "misses": 1}
+
+    masks.invalidate(df_cover, ["Vac_Type"])
+    processing.filter_dataframe(df_cover, "LA", "Vac_Type in ['BCG_3m']", 1)
+    assert masks.get_stats()["filter_condition"] == {"hits": 1, "misses": 2}
+    assert masks.get_stats()["org_type"] == {"hits": 4, "misses": 1}
+
+
+def test_filter_dataframe_not_cached(df_cover):
+    """
+    Tests that the masks aren't cached when copy-on-write mode is off
+    """
+    with pd.option_context("mode.copy_on_write", False):
+        processing.filter_dataframe(df_cover, "LA", "Vac_Type in ['BCG_3m']",
+                                    1)
+
+    assert masks.get_stats() == {}
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+from child_vac_code.utilities import memory, processing
+
+
+def test_check_stage(monkeypatch):
+    """
+    Tests that check_stage returns the peak memory, and aborts if it is over
+    the budget for the stage
+    """
+    monkeypatch.setattr(param, "STAGE_MEMORY_BUDGETS_MB", {"load": 1})
+
+    assert memory.check_stage("outputs") > 0
+
+    with pytest.raises(MemoryError):
+        memory.check_stage("load")
+
+
+def test_copy_on_write_dashboard_data(monkeypatch):
+    """
+    Tests that creating dashboard data in copy-on-write mode gives the same
+    output as the default mode, and doesn't change the source data
+    """
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+    df = pd.DataFrame(
+        {
+            "FinancialYear": ["2021-22", "2022-23", "2022-23", "2022-23"],
+            "Org_Code": ["E06000001", "E06000001", "E06000002", "E06000002"],
+            "Org_Name": ["LA 1", "LA 1", "LA 2", "LA 2"],
+            "Org_Type": ["LA", "LA", "LA", "LA"],
+            "Vac_Type": ["PCV_12m", "PCV_12m", "PCV_12m", "BCG_3m"],
+            "Number_Population": [100, 200, 300, 400],
+            "Number_Vaccinated": [90, 180, 250, 380],
+        }
+    )
+    df_source = df.copy()
+    breakdowns = ["FinancialYear", "Org_Code", "Org_Name", "Org_Level",
+                  "Vac_Type"]
+
+    expected = processing.create_output_dashboard_data(
+        df, "National", "LA", breakdowns, None, None, None, {}, 2)
+
+    with pd.option_context("mode.copy_on_write", True):
+        assert memory.copy_on_write_enabled()
+        actual = processing.create_output_dashboard_data(
+            df, "National", "LA", breakdowns, None, None, None, {}, 2)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    pd.testing.assert_frame_equal(df, df_source)
+    assert actual.index.get_level_values("Org_Code").unique().tolist() == [
+        "E92000001"]
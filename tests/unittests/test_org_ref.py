@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+from child_vac_code.utilities import org_ref, processing
+
+
+@pytest.fixture
+def df_org_ref():
+    """
+    Organisation reference data with org type and level added, and the
+    registry created from it for the test
+    """
+    df = pd.DataFrame(
+        {
+            "Org_Code": ["E06000001", "E07000001", "E09000001", "E12000001",
+                         "E54000001"],
+            "Org_Name": ["LA 1", "District 1", "LA 2", "Region 1", "ICB 1"],
+            "Parent_Org_Name": ["Region 1", "Region 1", "Region 1", "England",
+                                "Region 1"],
+            "Entity_code": ["E06", "E07", "E09", "E12", "E54"],
+            "Org_Type": ["LA", "LA", "LA", "LA_parent", "ICB"],
+            "Org_Level": ["Local", "Local", "Local", "Regional", "Local"],
+        }
+    )
+    org_ref.register(df)
+    yield df
+    org_ref.clear_registry()
+
+
+def test_org_ref_registry_view(df_org_ref):
+    """
+    Tests that the registry views hold the valid organisations for each local
+    level org type, and reject org types that aren't local level
+    """
+    registry = org_ref.get_registry()
+
+    assert registry.org_types == ["LA", "ICB"]
+    assert registry.view("LA").index.tolist() == ["E06000001", "E09000001"]
+    assert registry.view("ICB")["Org_Name"].tolist() == ["ICB 1"]
+
+    with pytest.raises(ValueError):
+        registry.view("LA_parent")
+
+
+def test_org_ref_registry_save_load(df_org_ref, tmp_path, monkeypatch):
+    """
+    Tests that a registry loaded from the saved feather file matches the
+    registry it was saved from
+    """
+    monkeypatch.setattr(org_ref, "ORG_REF_FEATHER", tmp_path / "df_org_ref.ft")
+    org_ref.get_registry().save()
+
+    actual = org_ref.OrgRefRegistry.load()
+
+    pd.testing.assert_frame_equal(actual.df_org_ref, df_org_ref)
+    pd.testing.assert_frame_equal(actual.view("LA"),
+                                  org_ref.get_registry().view("LA"))
+
+    # Without a registry for the run, it is only loaded from file if the
+    # org reference data is persisted
+    org_ref.clear_registry()
+    monkeypatch.setattr(param, "ORG_REF_PERSIST", False)
+    with pytest.raises(ValueError):
+        org_ref.get_registry()
+
+    monkeypatch.setattr(param, "ORG_REF_PERSIST", True)
+    assert org_ref.get_registry().org_types == ["LA", "ICB"]
+
+
+def test_merge_org_ref_data(df_org_ref, monkeypatch):
+    """
+    Tests that merge_org_ref_data returns all valid organisations with their
+    reference details, including those with no data
+    """
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+    df = pd.DataFrame(
+        {
+            "Org_Code": ["E09000001", "E09000001", "E07000001"],
+            "Org_Name": ["Old name", "Old name", "District 1"],
+            "Vac_Type": ["BCG_3m", "PCV_12m", "PCV_12m"],
+            "Coverage": [90.0, 95.0, 80.0],
+        }
+    )
+
+    expected = pd.DataFrame(
+        {
+            "FinancialYear": ["2022-23", "2022-23", "2022-23"],
+            "Org_Code": ["E06000001", "E09000001", "E09000001"],
+            "Org_Name": ["LA 1", "LA 2", "LA 2"],
+            "Coverage": [None, 90.0, 95.0],
+            "Vac_Type": [None, "BCG_3m", "PCV_12m"],
+        }
+    )
+
+    actual = processing.merge_org_ref_data(
+        df, "Org_Code", "LA", ["FinancialYear", "Org_Code", "Org_Name"])
+
+    pd.testing.assert_frame_equal(actual, expected)
@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+from child_vac_code.utilities import dashboards, output_specs, processing, tables
+
+
+@pytest.mark.parametrize(
+    "spec, match",
+    [
+        ({"function": "create_output_pivot"}, "invalid function"),
+        ({"function": "create_csv_output", "output_type": "Population"},
+         "missing a required argument"),
+        ({"function": "create_csv_output", "filter_condition": None,
+          "output_type": "Population", "breakdowns": ["Vac_Type"],
+          "sort_on": None, "column_rename": None, "org_typ": "LA"},
+         "unexpected keyword argument"),
+        ({"function": "create_csv_output",
+          "filter_condition": "Vac_Type in @param.NOT_A_PARAMETER",
+          "output_type": "Population", "breakdowns": ["Vac_Type"],
+          "sort_on": None, "column_rename": None},
+         "parameter"),
+        ({"function": "create_csv_output",
+          "filter_condition": "Vac_Typ in ['BCG_3m']",
+          "output_type": "Population", "breakdowns": ["Vac_Type"],
+          "sort_on": None, "column_rename": None},
+         "unknown columns: Vac_Typ"),
+    ],
+)
+def test_register_specs_invalid(spec, match):
+    """
+    Tests that invalid specs are rejected when they are registered
+    """
+    with pytest.raises(ValueError, match=match):
+        output_specs.register_specs({"create_csv_test": spec})
+
+    assert output_specs.get_spec("create_csv_test") is None
+
+
+def test_register_specs_duplicate():
+    """
+    Tests that an output can't be registered more than once
+    """
+    with pytest.raises(ValueError, match="more than once"):
+        output_specs.register_specs(
+            {"create_table_coverage_12m_england":
+             tables.TABLE_SPECS["create_table_coverage_12m_england"]})
+
+
+def test_run(monkeypatch):
+    """
+    Tests that the content functions call the processing function with a copy
+    of the spec arguments
+    """
+    calls = []
+
+    def create_output_crosstab(df, **kwargs):
+        calls.append(kwargs)
+        kwargs["rows"].append("Org_Name")
+        return df
+
+    spec = output_specs.get_spec("create_table_coverage_12m_england")
+    monkeypatch.setattr(output_specs, "_REGISTRY", {
+        spec.name: output_specs.OutputSpec(spec.name, create_output_crosstab,
+                                           spec.arguments)})
+    df = pd.DataFrame()
+
+    for _ in range(2):
+        assert tables.create_table_coverage_12m_england(df) is df
+
+    assert calls[1]["rows"] == ["FinancialYear", "Org_Name"]
+    assert spec.arguments["rows"] == ["FinancialYear"]
+
+
+def test_plan():
+    """
+    Tests that outputs needing the same aggregation are grouped in the plan,
+    and content functions without a spec are listed separately
+    """
+    def create_table_custom(df):
+        return df
+
+    output_args = [
+        {"name": "Table 1",
+         "contents": [tables.create_table_population_12m_england_thousands,
+                      tables.create_table_population_12m_england]},
+        {"name": "Table 2",
+         "contents": [create_table_custom],
+         "contents_2": [tables.create_table_coverage_12m_england]},
+    ]
+
+    aggregations, unplanned = output_specs.plan(output_args)
+
+    assert aggregations == {
+        ("LA", "Vac_Type in ['DTaP_IPV_Hib_HepB_12m']",
+         ("FinancialYear", "Vac_Type"), 1, "Number_Vaccinated",
+         "Number_Population"):
+            ["create_table_population_12m_england_thousands",
+             "create_table_population_12m_england"],
+        ("LA", None, ("FinancialYear", "Vac_Type"), 1, "Number_Vaccinated",
+         "Number_Population"):
+            ["create_table_coverage_12m_england"],
+    }
+    assert unplanned == ["create_table_custom"]
+
+
+def test_plan_dashboard():
+    """
+    Tests that the dashboard breakdowns set to fixed values are not in the
+    aggregation planned
+    """
+    spec = output_specs.get_spec(
+        dashboards.create_dashboard_data_england.__name__)
+    variables = spec.aggregation()[2]
+
+    assert variables == ("FinancialYear", "Vac_Type")
+    assert set(spec.arguments["breakdowns"]) - set(variables) == set(
+        processing.get_dashboard_fixed_values("National"))
@@ -0,0 +1,86 @@
+import pandas as pd
+import numpy as np
+import child_vac_code.parameters as param
+from child_vac_code.utilities import pre_processing
+
+
+def test_add_vaccine_status(monkeypatch):
+    """
+    Tests the add_vaccine_status function, which sets the status of the
+    HepB vaccines, updated for the orgs and vac types in the status updates
+    file
+    """
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+
+    input_df = pd.DataFrame(
+        {
+            "FinancialYear": ["2021-22", "2022-23", "2022-23", "2022-23",
+                              "2022-23"],
+            "Org_Code": ["E06000001", "E06000001", "E06000001", "E06000002",
+                         "E06000002"],
+            "Org_Name": ["LA 1", "LA 1", "LA 1", "LA 2", "LA 2"],
+            "Vac_Type": ["HepB_Group2_12m", "HepB_Group2_12m", "PCV_12m",
+                         "HepB_Group2_24m", "PCV_12m"],
+        },
+        index=[5, 6, 7, 8, 9]
+    )
+    df_status_updates = pd.DataFrame(
+        {
+            "FinancialYear": ["2022-23", "2022-23"],
+            "Org_Code": ["E06000001", "E06000001"],
+            "Vac_Type": ["HepB_Group2_12m", "PCV_12m"],
+        }
+    )
+
+    expected = input_df.copy()
+    expected["Vaccine_Status"] = ["Full data submitted",
+                                  "Full data not available", np.nan,
+                                  "Full data submitted", np.nan]
+
+    actual = pre_processing.add_vaccine_status(input_df, df_status_updates)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_update_flu_vac_data():
+    """
+    Tests that update_flu_vac_data stacks the age bands of the flu data into
+    rows, applying the LA code substitutions and adding org details
+    """
+    input_df = pd.DataFrame(
+        {
+            "Year": ["2022-23", "2022-23"],
+            "Local Authority code": ["E06000001", "E08000020"],
+            "All 2 year olds (combined): Patients registered": [100, 200],
+            "All 2 year olds (combined): Number vaccinated": [50, 150],
+            "All 3 year olds (combined): Patients registered": [110, 210],
+            "All 3 year olds (combined): Number vaccinated": [60, 160],
+        }
+    )
+    df_org_ref = pd.DataFrame(
+        {
+            "Org_Code": ["E06000001", "E08000037"],
+            "Org_Name": ["LA 1", "LA 2"],
+            "Org_Type": ["LA", "LA"],
+            "Parent_Org_Code": ["E12000001", "E12000001"],
+            "Parent_Org_Name": ["Region 1", "Region 1"],
+        }
+    )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["E06000001", "E08000037", "E06000001", "E08000037"],
+            "Number_Population": [100, 200, 110, 210],
+            "Number_Vaccinated": [50, 150, 60, 160],
+            "Child_Age": ["24m", "24m", "3y", "3y"],
+            "Vac_Type": ["Flu_24m", "Flu_24m", "Flu_3y", "Flu_3y"],
+        }
+    )
+
+    actual = pre_processing.update_flu_vac_data(input_df, df_org_ref,
+                                                "2022-23")
+
+    assert (actual["Org_Name"].astype(str).tolist()
+            == ["LA 1", "LA 2", "LA 1", "LA 2"])
+    pd.testing.assert_frame_equal(actual[expected.columns], expected,
+                                  check_dtype=False, check_categorical=False)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+from child_vac_code.utilities import predicates
+
+
+@pytest.mark.parametrize("as_category", [False, True])
+@pytest.mark.parametrize(
+    "filter_condition",
+    [
+        "Vac_Type in ['BCG_3m']",
+        "Vac_Type in ('MMR_24m')",
+        "Vac_Type not in (@param.SELECTIVE_VACCS)",
+        "Vac_Type not in ({0})".format(param.EXCLUDE_VACCS_VAL),
+        "Vac_Type == ['BCG_3m', 'MMR_24m'] and Number_Population >= 100",
+        "~(Vac_Type == 'BCG_3m') & Number_Population > 100",
+        "not Vac_Type != 'BCG_3m' or Number_Population < 100",
+    ],
+)
+def test_compile_predicate(filter_condition, as_category):
+    """
+    Tests that compiled filters select the same rows as DataFrame.query,
+    including for nulls and categorical columns
+    """
+    df = pd.DataFrame(
+        {
+            "Vac_Type": ["BCG_3m", "MMR_24m", "BCG_12m", np.nan, "PCV_12m"],
+            "Number_Population": [50, 150, 100, 200, 120],
+        }
+    )
+    if as_category:
+        df = df.astype({"Vac_Type": "category"})
+
+    predicate = predicates.compile_predicate(filter_condition, df.columns)
+    actual = df[predicate.evaluate(df)]
+
+    pd.testing.assert_frame_equal(actual, df.query(filter_condition))
+
+
+def test_compile_predicate_invalid():
+    """
+    Tests that filters with invalid columns, parameters or expressions are
+    rejected when they are compiled
+    """
+    with pytest.raises(ValueError, match="unknown columns: Vac_Typ"):
+        predicates.compile_predicate("Vac_Typ in ['BCG_3m']",
+                                     ["Vac_Type", "Org_Type"])
+
+    with pytest.raises(ValueError, match="parameter"):
+        predicates.compile_predicate("Vac_Type in @param.NOT_A_PARAMETER")
+
+    with pytest.raises(ValueError):
+        predicates.compile_predicate("Org_Name.isnull()")
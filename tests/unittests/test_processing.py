@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from child_vac_code.utilities import processing
+from child_vac_code.utilities import helpers, processing
 
 
 def test_check_for_sort_on():
@@ -143,3 +143,94 @@ def test_apply_hepb_suppression():
                              "Coverage":   [0, "*", "*", "*", "*", 62.5]})
 
     pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_aggregate_crosstab_data_categorical(monkeypatch):
+    """
+    Tests that aggregating data held with the compact processed column types
+    gives the same result as aggregating object data
+    """
+    monkeypatch.setattr(processing.param, "FYEAR_START", "01APR2022")
+    df = pd.DataFrame(
+        {
+            "FinancialYearStart": ["01APR2021", "01APR2022", "01APR2022",
+                                   "01APR2022", "01APR2022"],
+            "FinancialYear": ["2021-22", "2022-23", "2022-23", "2022-23",
+                              "2022-23"],
+            "Org_Type": ["LA", "LA", "LA", "LA", "Region"],
+            "Vac_Type": ["PCV_12m", "PCV_12m", "BCG_3m", "PCV_12m", "PCV_12m"],
+            "Vaccine_Status": [np.nan, "Full data submitted", np.nan, np.nan,
+                               np.nan],
+            "Number_Population": [100, 200, 300, 400, 1000],
+            "Number_Vaccinated": [90, 180, 250, 380, 900],
+        }
+    )
+    df_categorical = helpers.apply_column_types(
+        df.copy(), {column: column_type for column, column_type
+                    in processing.param.PROCESSED_COLUMN_TYPES.items()
+                    if column in df.columns})
+
+    for filter_condition, variables, ts_years in [
+            (None, ["FinancialYear", "Vac_Type"], 2),
+            ("Vac_Type not in ['BCG_3m']", ["Vac_Type"], 1),
+            (None, ["Vac_Type", "Vaccine_Status"], 1)]:
+        expected = processing.aggregate_crosstab_data(df, "LA",
+                                                      filter_condition,
+                                                      variables, ts_years)
+        actual = processing.aggregate_crosstab_data(df_categorical, "LA",
+                                                    filter_condition,
+                                                    variables, ts_years)
+
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_pivot_crosstab_data():
+    """
+    Tests that pivot_crosstab_data pivots the measure by the columns variable,
+    keeping null and negative values, excluding groups with null labels, and
+    only keeping observed groups of categorical variables
+    """
+    df_agg = pd.DataFrame(
+        {
+            "Org_Code": ["E2", "E2", "E1", "E1", "E3", np.nan],
+            "FinancialYear": ["2022-23", "2021-22", "2022-23", "2021-22",
+                              "2022-23", "2022-23"],
+            "Coverage": [95.0, np.nan, -1.0, 80.0, 70.0, 50.0],
+        }
+    )
+
+    expected = pd.DataFrame(
+        {
+            "Org_Code": ["E1", "E2", "E3"],
+            "2021-22": [80.0, np.nan, np.nan],
+            "2022-23": [-1.0, 95.0, 70.0],
+        }
+    )
+    expected.columns.name = "FinancialYear"
+
+    actual = processing.pivot_crosstab_data(df_agg, ["Org_Code"],
+                                            "FinancialYear", "Coverage")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+    # Categorical rows variables with duplicate groups give the same result as
+    # pivot_table, without rows for unobserved combinations of the categories
+    df_agg = pd.DataFrame(
+        {
+            "Org_Code": ["E1", "E1", "E1", "E2", "E2", "E3"],
+            "Vac_Type": ["PCV_12m", "PCV_12m", "MMR_24m", "MMR_24m",
+                         "MMR_24m", "Rota_12m"],
+            "FinancialYear": ["2022-23", "2022-23", "2021-22", "2022-23",
+                              "2021-22", "2022-23"],
+            "Coverage": [90.0, 80.0, 70.0, 60.0, 50.0, 40.0],
+        }
+    ).astype({"Org_Code": "category", "Vac_Type": "category"})
+
+    expected = pd.pivot_table(df_agg, values="Coverage",
+                              index=["Org_Code", "Vac_Type"],
+                              columns="FinancialYear").reset_index()
+
+    actual = processing.pivot_crosstab_data(df_agg, ["Org_Code", "Vac_Type"],
+                                            "FinancialYear", "Coverage")
+
+    pd.testing.assert_frame_equal(actual, expected)
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+import child_vac_code.parameters as param
+import child_vac_code.utilities.data_connections as dbc
+from child_vac_code.utilities import pre_processing, processing, pushdown
+
+
+def test_compile_filter():
+    """
+    Tests the compile_filter function, which translates dataframe query
+    filters into SQL conditions
+    """
+    column_expressions = {"Vac_Type": "[Vac_Type]", "Org_Type": "[Org_Type]"}
+
+    assert (pushdown.compile_filter("Vac_Type in ['BCG_3m']",
+                                    column_expressions)
+            == "[Vac_Type] in ('BCG_3m')")
+    assert (pushdown.compile_filter("Vac_Type in ('DTaP_IPV_Hib_HepB_24m')",
+                                    column_expressions)
+            == "[Vac_Type] in ('DTaP_IPV_Hib_HepB_24m')")
+    assert (pushdown.compile_filter(
+                "Vac_Type not in @param.SELECTIVE_VACCS and Org_Type == 'LA'",
+                column_expressions)
+            == "([Vac_Type] not in ('BCG_12m', 'BCG_3m', 'HepB_Group2_12m', "
+               "'HepB_Group2_24m') AND [Org_Type] in ('LA'))")
+
+    with pytest.raises(ValueError):
+        pushdown.compile_filter("Vaccine_Status in ['Full data submitted']",
+                                column_expressions)
+
+
+def test_aggregate_crosstab_parity(tmp_path, monkeypatch):
+    """
+    Tests that aggregating crosstab data in a SQLite stand-in for the asset
+    gives the same result as aggregating the pre-processed data in pandas
+    """
+    monkeypatch.setattr(param, "DATA_BACKEND", "sqlite")
+    monkeypatch.setattr(param, "SQLITE_DIR", tmp_path)
+    monkeypatch.setattr(param, "USE_SNAPSHOTS", False)
+    monkeypatch.setattr(param, "FYEAR_START", "01APR2022")
+
+    orgs = [("E06000016", "Leicester", "E12000004", "LA"),
+            ("E06000017", "Rutland", "E12000004", "LA"),
+            ("E10000018", "Leicestershire", "E12000004", "LA"),
+            ("E09000012", "Hackney", "E12000007", "LA"),
+            ("E12000004", "East Midlands", "E92000001", "Region")]
+    rows = []
+    for year_index, year in enumerate(["01APR2021", "01APR2022"]):
+        for org_index, (code, name, parent, org_type) in enumerate(orgs):
+            for vac_index, vac_type in enumerate(["MMR1_24m", "BCG_3m",
+                                                  "PCV_12m"]):
+                for data_type in ["Actual", "Projected"]:
+                    population = 100 + 10 * org_index + vac_index + year_index
+                    rows.append([year, parent, code, name, org_type, "12m",
+                                 vac_type, data_type, population,
+                                 population - org_index - vac_index])
+    df_asset = pd.DataFrame(rows, columns=["FinancialYearStart",
+                                           "Parent_Org_Code", "Org_Code",
+                                           "Org_Name", "Org_Type", "Child_Age",
+                                           "Vac_Type", "Data_Type",
+                                           "Number_Population",
+                                           "Number_Vaccinated"])
+    df_org_ref = pd.DataFrame({"Org_Code": ["E12000004", "E12000007"],
+                               "Org_Name": ["East Midlands", "London"]})
+    df_status_updates = pd.DataFrame(columns=["FinancialYear", "Org_Code",
+                                              "Vac_Type"])
+
+    dbc.seed_sqlite_database(param.DATABASE, {param.TABLE: df_asset}, tmp_path)
+    year_range = ["01APR2021", "01APR2022"]
+    df = df_asset[df_asset["Data_Type"] == "Actual"].reset_index(drop=True)
+    df = pre_processing.update_child_vac_data(df, df_org_ref,
+                                              df_status_updates)
+    pushdown.register_source(df, year_range, df_org_ref)
+
+    specs = [("LA", None, ["FinancialYear", "Vac_Type"], 2),
+             ("LA", "Vac_Type in ['BCG_3m']",
+              ["Org_Code", "Org_Name", "Parent_Org_Name"], 1),
+             ("LA", "Vac_Type not in @param.SELECTIVE_VACCS",
+              ["Parent_Org_Code", "Parent_Org_Name", "Vac_Type"], 1),
+             (None, None, ["Org_Type", "Vac_Type"], 2)]
+    try:
+        for org_type, filter_condition, variables, ts_years in specs:
+            df_sql = pushdown.aggregate_crosstab(df, org_type, filter_condition,
+                                                 variables, ts_years)
+            df_pandas = processing.aggregate_crosstab_data(df, org_type,
+                                                           filter_condition,
+                                                           variables, ts_years)
+            pushdown.check_parity(df_sql, df_pandas, variables)
+
+        # Crosstabs that can't be aggregated in SQL use pandas
+        assert pushdown.aggregate_crosstab(df, "LA", None,
+                                           ["Vaccine_Status"], 1) is None
+        assert pushdown.aggregate_crosstab(df.copy(), "LA", None,
+                                           ["Vac_Type"], 1) is None
+    finally:
+        pushdown.clear_sources()
+        dbc.dispose_engines()
@@ -0,0 +1,81 @@
+import os
+import pandas as pd
+from child_vac_code.utilities import snapshots
+
+
+def test_snapshot_key():
+    """
+    Tests the snapshot_key function, which should give the same key for the
+    same query/server/database and a different key if any of them change
+    """
+    key = snapshots.snapshot_key("SELECT 1", "SERVER", "DATABASE")
+
+    assert key == snapshots.snapshot_key("SELECT 1", "SERVER", "DATABASE")
+    assert key != snapshots.snapshot_key("SELECT 2", "SERVER", "DATABASE")
+    assert key != snapshots.snapshot_key("SELECT 1", "SERVER", "DATABASE2")
+    assert key != snapshots.snapshot_key("SELECT 1", "SERVER", "DATABASE",
+                                         {"Vac_Type": "category"})
+
+
+def test_write_read_snapshot(tmp_path):
+    """
+    Tests that a snapshot written by write_snapshot is returned by
+    read_snapshot, and that invalidate_snapshots removes it
+    """
+    df = pd.DataFrame({"Vac_Type": ["MMR1_5y", "MMR2_5y"],
+                       "Number_Population": [100, 200]})
+
+    assert snapshots.read_snapshot("key1", tmp_path) is None
+
+    snapshots.write_snapshot("key1", df, tmp_path, max_mb=100)
+    actual = snapshots.read_snapshot("key1", tmp_path)
+
+    pd.testing.assert_frame_equal(actual, df)
+
+    snapshots.invalidate_snapshots(["key1"], tmp_path)
+
+    assert snapshots.read_snapshot("key1", tmp_path) is None
+
+
+def test_evict_snapshots(tmp_path):
+    """
+    Tests the evict_snapshots function, which should remove the least
+    recently used snapshots until the folder is within the size limit
+    """
+    for number, key in enumerate(["old", "middle", "new"]):
+        path = snapshots.snapshot_path(key, tmp_path)
+        path.write_bytes(b"0" * 1024 * 1024)
+        os.utime(path, (number, number))
+
+    snapshots.evict_snapshots(tmp_path, max_mb=2)
+
+    remaining = sorted(path.stem for path in tmp_path.glob("*.ft"))
+
+    assert remaining == ["middle", "new"]
+
+
+def test_read_write_partitions(tmp_path):
+    """
+    Tests that partitions written by write_partition are returned by
+    read_partitions (only for years in the store), and that
+    invalidate_partitions removes them
+    """
+    df_2020 = pd.DataFrame({"FinancialYearStart": ["01APR2020", "01APR2020"],
+                            "Number_Population": [100, 200]})
+    df_2021 = pd.DataFrame({"FinancialYearStart": ["01APR2021"],
+                            "Number_Population": [300]})
+
+    snapshots.write_partition("01APR2020", df_2020, tmp_path)
+    snapshots.write_partition("01APR2021", df_2021, tmp_path)
+
+    actual = snapshots.read_partitions(["01APR2019", "01APR2020", "01APR2021"],
+                                       tmp_path)
+
+    assert list(actual.keys()) == ["01APR2020", "01APR2021"]
+    pd.testing.assert_frame_equal(actual["01APR2020"], df_2020)
+    pd.testing.assert_frame_equal(actual["01APR2021"], df_2021)
+
+    snapshots.invalidate_partitions(["01APR2021"], tmp_path)
+
+    assert list(snapshots.read_partitions(["01APR2020", "01APR2021"],
+                                          tmp_path).keys()) == ["01APR2020"]
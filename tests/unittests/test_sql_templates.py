@@ -0,0 +1,42 @@
+import pytest
+from child_vac_code.utilities import sql_templates
+
+
+def test_render_template():
+    """
+    Tests the render_template function, which should insert the identifiers
+    and replace value placeholders with bind parameters
+    """
+    expected = """SELECT [FinancialYearStart]
+      ,[Parent_Org_Code]
+      ,[Org_Code]
+      ,[Org_Name]
+      ,[Org_Type]
+      ,[Child_Age]
+      ,[Vac_Type]
+      ,[Data_Type]
+      ,[Number_Population]
+      ,[Number_Vaccinated]
+FROM [DATABASE].[dbo].[TABLE]
+WHERE [FinancialYearStart] in :YearRange and [Data_Type] in ('Actual')"""
+
+    actual = sql_templates.render_template("query_asset.sql",
+                                           {"Database": "DATABASE",
+                                            "Table": "TABLE"})
+
+    assert actual.strip() == expected
+    # The rendered query is cached for the same identifiers
+    assert actual is sql_templates.render_template("query_asset.sql",
+                                                   {"Table": "TABLE",
+                                                    "Database": "DATABASE"})
+
+
+def test_render_template_invalid_identifier():
+    """
+    Tests that render_template rejects identifiers that could change the
+    query
+    """
+    with pytest.raises(ValueError):
+        sql_templates.render_template("query_asset.sql",
+                                      {"Database": "DATABASE",
+                                       "Table": "TABLE]; DROP TABLE [X"})